@@ -14,9 +14,57 @@
 
 """Backlog package."""
 
+from .activity import (  # noqa
+    ActivityFeed,
+    ChangeEvent,
+    latest_changes,
+    to_change_events,
+)
 from .api import (  # noqa
     BacklogApi,
 )
+from .async_api import (  # noqa
+    AsyncBacklogApi,
+)
+from .cache import (  # noqa
+    ResponseCache,
+)
+from .decoding import (  # noqa
+    ModelDecoder,
+)
+from .http_cache import (  # noqa
+    SQLiteHttpCache,
+)
+from .json_backend import (  # noqa
+    JsonBackend,
+    get_json_backend,
+)
+from .mirror import (  # noqa
+    SQLiteMirror,
+)
+from .ratelimit import (  # noqa
+    FileRateLimiter,
+    RateLimiter,
+)
+from .retry import (  # noqa
+    RetryPolicy,
+    RetryStats,
+)
+from .singleflight import (  # noqa
+    SingleFlight,
+)
+from .sync import (  # noqa
+    SQLiteSyncStore,
+    SyncEngine,
+    SyncReport,
+    SyncState,
+)
+from .webhook import (  # noqa
+    WebhookEvent,
+    WebhookReceiver,
+    load_payloads,
+    replay,
+)
 
 __title__ = "backlog-api4py"
 __author__ = "Ryo H"
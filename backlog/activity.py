@@ -0,0 +1,219 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Activity feed module."""
+
+import functools
+from dataclasses import dataclass
+from typing import (Dict, Iterable, Iterator, List, Optional, Tuple, Type,
+                    Union)
+
+from .api import BacklogApi
+from .models import (Activity, ActivityType, Base, Comment, Issue,
+                     SharedFile, User, Version, Wiki)
+from .pagination import MAX_COUNT, iter_by_id_cursor
+from .sync import SQLiteSyncStore
+
+CREATED = "created"
+UPDATED = "updated"
+DELETED = "deleted"
+ADDED = "added"
+REMOVED = "removed"
+
+# model and action of the entity changed by each type of activity
+_CHANGES: Dict[ActivityType, Tuple[Type[Base], str]] = {
+    ActivityType.ISSUE_CREATED: (Issue, CREATED),
+    ActivityType.ISSUE_UPDATED: (Issue, UPDATED),
+    ActivityType.ISSUE_COMMENTED: (Comment, CREATED),
+    ActivityType.ISSUE_DELETED: (Issue, DELETED),
+    ActivityType.ISSUE_MULTI_UPDATED: (Issue, UPDATED),
+    ActivityType.WIKI_CREATED: (Wiki, CREATED),
+    ActivityType.WIKI_UPDATED: (Wiki, UPDATED),
+    ActivityType.WIKI_DELETED: (Wiki, DELETED),
+    ActivityType.FILE_ADDED: (SharedFile, CREATED),
+    ActivityType.FILE_UPDATED: (SharedFile, UPDATED),
+    ActivityType.FILE_DELETED: (SharedFile, DELETED),
+    ActivityType.PROJECT_USER_ADDED: (User, ADDED),
+    ActivityType.PROJECT_USER_REMOVED: (User, REMOVED),
+    ActivityType.MILESTONE_CREATED: (Version, CREATED),
+    ActivityType.MILESTONE_UPDATED: (Version, UPDATED),
+    ActivityType.MILESTONE_DELETED: (Version, DELETED),
+}
+
+
+@dataclass
+class ChangeEvent(object):
+    """Change of an entity told by an activity."""
+
+    activity: Activity
+    # None when the entity has no model, e.g. pull requests
+    model: Optional[Type[Base]]
+    action: Optional[str]
+    id: Optional[int]
+    # issue id of comment, or project id of project user
+    parent_id: Optional[int] = None
+    # key id of the issue, or of the issue of comment
+    key_id: Optional[int] = None
+
+    @property
+    def project_id(self) -> Optional[int]:
+        """Id of the project where the change happened."""
+        project = self.activity.project
+        return project.id if project is not None else None
+
+    @property
+    def issue_key(self) -> Optional[str]:
+        """Key of the issue, or of the issue of comment, e.g. "BLG-1"."""
+        project = self.activity.project
+        if project is None or self.key_id is None:
+            return None
+        return f"{project.project_key}-{self.key_id}"
+
+
+def to_change_events(activity: Activity) -> List[ChangeEvent]:
+    """Convert activity to events of the entities it changed.
+
+    An activity updating multiple issues or adding multiple users
+    is converted to an event per entity.
+
+    :param activity: activity
+    :return: change events
+    """
+    content = activity.content or {}
+    change = _CHANGES.get(activity.type)
+    if change is None:
+        return [ChangeEvent(activity, None, None, content.get("id"))]
+
+    model, action = change
+    if activity.type == ActivityType.ISSUE_MULTI_UPDATED:
+        return [ChangeEvent(activity, model, action, link["id"],
+                            key_id=link.get("key_id"))
+                for link in content.get("link", [])]
+    if model is User:
+        project_id = activity.project.id if activity.project else None
+        return [ChangeEvent(activity, model, action, user["id"], project_id)
+                for user in content.get("users", [])]
+    if model is Comment:
+        comment = content.get("comment") or {}
+        return [ChangeEvent(
+            activity, model, action, comment.get("id"), content.get("id"),
+            key_id=content.get("key_id"))]
+    if model is Issue:
+        return [ChangeEvent(activity, model, action, content.get("id"),
+                            key_id=content.get("key_id"))]
+    return [ChangeEvent(activity, model, action, content.get("id"))]
+
+
+def latest_changes(
+        events: Iterable[ChangeEvent]
+) -> Dict[Tuple[Type[Base], int], ChangeEvent]:
+    """Keep only the latest event of every entity.
+
+    Entities changed many times are fetched once by looking up the result,
+    e.g. ids of wikis to get are the keys whose model is Wiki
+    and whose event is not deleted.
+
+    :param events: events in the order of activities
+    :return: latest event by model and id. events without model are dropped
+    """
+    changes: Dict[Tuple[Type[Base], int], ChangeEvent] = {}
+    for event in events:
+        if event.model is not None and event.id is not None:
+            changes[(event.model, event.id)] = event
+    return changes
+
+
+class ActivityFeed(object):
+    """Reader of activities continuing from where the last read stopped.
+
+    Activities are read in ascending order of id from the one following
+    the cursor, which is the id of the last activity read.
+    The cursor is stored when the iteration is exhausted,
+    so the activities are read again if the reading is interrupted.
+    """
+
+    def __init__(
+            self,
+            api: BacklogApi,
+            store: Optional[SQLiteSyncStore] = None,
+            project_id_or_key: Optional[Union[int, str]] = None,
+            user_id: Optional[int] = None,
+            activity_types: Optional[Iterable[ActivityType]] = None,
+            count: int = MAX_COUNT):
+        """__init__ method.
+
+        Activities of the space are read unless the project or the user
+        is given.
+
+        :param api: client. its decoder must build models
+        :param store: store of the cursor. None keeps it in this instance
+        :param project_id_or_key: project id or project key
+        :param user_id: user id
+        :param activity_types: activity types to read. None means all
+        :param count: number of activities fetched per request (1-100)
+        :raises ValueError: when initialization fails
+        """
+        if api.decoder.output != "model":
+            raise ValueError("decoder of api must build models.")
+        if project_id_or_key is not None and user_id is not None:
+            raise ValueError(
+                "only one of project_id_or_key and user_id can be given.")
+        if not 1 <= count <= MAX_COUNT:
+            raise ValueError(f"count must be between 1 and {MAX_COUNT}.")
+
+        if project_id_or_key is not None:
+            self.resource = f"projects/{project_id_or_key}/activities"
+            fetch = functools.partial(
+                api.get_project_activities, project_id_or_key)
+        elif user_id is not None:
+            self.resource = f"users/{user_id}/activities"
+            fetch = functools.partial(api.get_user_activities, user_id)
+        else:
+            self.resource = "space/activities"
+            fetch = api.get_space_activities
+        if activity_types is not None:
+            activity_types = list(activity_types)
+            self.resource += "?types=" + ",".join(
+                str(t.to_value()) for t in activity_types)
+
+        self.store = store
+        self.count = count
+        self.last_id = store.get_cursor(self.resource) if store else None
+        self._fetch = functools.partial(
+            fetch, activity_types=activity_types, count=count, order="asc")
+
+    def iter_activities(self) -> Iterator[Activity]:
+        """Iterate over activities after the cursor.
+
+        :return: iterator of activities
+        """
+        start = self.last_id
+        fetch_page = functools.partial(self._fetch, min_id=start) \
+            if start is not None else self._fetch
+        for activity in iter_by_id_cursor(fetch_page, self.count, "asc"):
+            # minId may be inclusive
+            if start is not None and activity.id <= start:
+                continue
+            self.last_id = activity.id
+            yield activity
+        if self.store is not None and self.last_id is not None:
+            self.store.set_cursor(self.resource, self.last_id)
+
+    def iter_events(self) -> Iterator[ChangeEvent]:
+        """Iterate over changes told by activities after the cursor.
+
+        :return: iterator of change events
+        """
+        for activity in self.iter_activities():
+            yield from to_change_events(activity)
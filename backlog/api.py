@@ -14,13 +14,28 @@
 
 """Backlog API module."""
 
-from typing import List, Optional, Union
+import copy
+import functools
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
 
 import requests
-
-from .models import (Attachment, Category, Comment, IssueType, Priority,
-                     Project, Resolution, SharedFile, Space, Star, Status,
-                     User, Version, Wiki)
+from requests.adapters import HTTPAdapter
+
+from .bulk import BulkResult, run_bulk
+from .cache import ResponseCache
+from .decoding import ModelDecoder
+from .filters import DateType, activity_params, issue_params
+from .http_cache import SQLiteHttpCache
+from .json_backend import JsonBackend, get_json_backend
+from .models import (Activity, ActivityType, Attachment, Category,
+                     Comment, Issue, IssueType, Priority, Project, Resolution,
+                     SharedFile, Space, Star, Status, User, Version, Wiki)
+from .pagination import (MAX_COUNT, check_offset_params, check_page_params,
+                         iter_by_id_cursor, iter_by_offset, page_params)
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, RetryStats, send_with_retry
+from .singleflight import SingleFlight
+from .streaming import CHUNK_SIZE, iter_json_array
 
 
 class BacklogApi(object):
@@ -32,12 +47,55 @@ class BacklogApi(object):
         "tool": "backlogtool.com"
     }
 
-    def __init__(self, space_key: str, space_type: str, api_key: str):
+    def __init__(
+            self,
+            space_key: str,
+            space_type: str,
+            api_key: str,
+            session: Optional[requests.Session] = None,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            pool_block: bool = False,
+            keep_alive: bool = True,
+            max_workers: Optional[int] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            timeout: Tuple[float, float] = (10.0, 60.0),
+            retry_policy: Optional[RetryPolicy] = None,
+            cache: Optional[ResponseCache] = None,
+            http_cache: Optional[SQLiteHttpCache] = None,
+            single_flight: Optional[SingleFlight] = None,
+            decoder: Optional[ModelDecoder] = None,
+            json_backend: Optional[Union[str, JsonBackend]] = None):
         """__init__ method.
 
         :param space_key: space key
         :param space_type: space type
         :param api_key: api key
+        :param session: session used for every request.
+            if omitted, a pooled session owned by this instance is created
+        :param pool_connections: number of connection pools to cache
+        :param pool_maxsize: maximum number of connections kept per host
+        :param pool_block: whether to block when no free connection is
+            available instead of opening a temporary one
+        :param keep_alive: whether to reuse connections between requests
+        :param max_workers: default number of concurrent requests
+            in bulk methods. defaults to pool_maxsize
+        :param rate_limiter: rate limiter that paces every request.
+            it can be shared by multiple instances
+        :param timeout: connect timeout and read timeout in seconds
+        :param retry_policy: policy to retry failed requests.
+            if omitted, requests are not retried
+        :param cache: cache of responses for rarely changed data.
+            if omitted, responses are not cached
+        :param http_cache: persistent cache revalidated by conditional
+            requests. if omitted, conditional requests are not sent
+        :param single_flight: deduplicator that makes concurrent identical
+            requests share one round trip. if omitted, they are all sent
+        :param decoder: decoder building models from responses.
+            if omitted, users nested in one response are shared by id
+        :param json_backend: backend decoding JSON of every response,
+            or its name such as "orjson".
+            if omitted, the fastest installed backend is used
         :raises ValueError: when initialization fails
         """
         if not space_key:
@@ -47,9 +105,56 @@ class BacklogApi(object):
             raise ValueError("space_type must be one of 'jp', 'com', 'tool'.")
         if not api_key:
             raise ValueError("api_key must not be empty.")
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool size must be greater than 0.")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be greater than 0.")
 
         self.base_url = f"https://{space_key}.{domain}/api/v2/"
         self.api_key = api_key
+        self.max_workers = max_workers or pool_maxsize
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=1)
+        self.retry_stats = RetryStats()
+        self.cache = cache
+        self.http_cache = http_cache
+        self.single_flight = single_flight
+        self.decoder = decoder or ModelDecoder()
+        self.json_backend = get_json_backend(json_backend)
+        self._owns_session = session is None
+        self.session = session or self._create_session(
+            pool_connections, pool_maxsize, pool_block, keep_alive)
+
+    def __enter__(self) -> "BacklogApi":
+        """__enter__ method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """__exit__ method."""
+        self.close()
+
+    def close(self):
+        """Release the connections held by this instance.
+
+        A session passed from outside is left open for its owner to close.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def with_decoder(self, decoder: ModelDecoder) -> "BacklogApi":
+        """Create an instance sharing the session with another decoder.
+
+        e.g. ``api.with_decoder(ModelDecoder(output="columns")).get_users()``
+        returns columns only for that call.
+
+        :param decoder: decoder building models from responses
+        :return: new instance. closing it leaves the session open
+        """
+        api = copy.copy(self)
+        api.decoder = decoder
+        api._owns_session = False
+        return api
 
     def get_space(self) -> Space:
         """Get information about your space.
@@ -59,7 +164,32 @@ class BacklogApi(object):
         url = "space"
 
         space = self._send_get_request(url)
-        return Space.from_dict(space)
+        return self.decoder.to_model(Space, space)
+
+    def get_space_activities(
+            self,
+            activity_types: Optional[
+                Iterable[Union[int, ActivityType]]] = None,
+            min_id: Optional[int] = None,
+            max_id: Optional[int] = None,
+            count: Optional[int] = None,
+            order: Optional[str] = None) -> List[Activity]:
+        """Get list of recent activities in your space.
+
+        :param activity_types: activity types or their ids
+        :param min_id: minimum activity id
+        :param max_id: maximum activity id
+        :param count: number of activities to get (1-100)
+        :param order: sort order by id ('asc' or 'desc')
+        :raises ValueError: when parameters are invalid
+        :return: list of activities
+        """
+        url = "space/activities"
+        query_params = activity_params(
+            activity_types, min_id, max_id, count, order)
+
+        activities = self._send_get_request(url, query_params)
+        return self.decoder.to_models(Activity, activities)
 
     def get_users(self) -> List[User]:
         """Get list of users in your space.
@@ -69,7 +199,20 @@ class BacklogApi(object):
         url = "users"
 
         users = self._send_get_request(url)
-        return [User.from_dict(user) for user in users]
+        return self.decoder.to_models(User, users)
+
+    def iter_users(self) -> Iterator[User]:
+        """Iterate over users in your space.
+
+        The response is decoded while it is being received,
+        so users are returned one by one without loading the whole list.
+
+        :return: iterator of users
+        """
+        url = "users"
+
+        return self.decoder.iter_models(
+            User, self._stream_get_request(url))
 
     def get_user(self, user_id: int) -> User:
         """Get information about user.
@@ -80,7 +223,47 @@ class BacklogApi(object):
         url = f"users/{user_id}"
 
         user = self._send_get_request(url)
-        return User.from_dict(user)
+        return self.decoder.to_model(User, user)
+
+    def get_users_bulk(
+            self,
+            user_ids: Iterable[int],
+            max_workers: Optional[int] = None) -> List[BulkResult[User]]:
+        """Get information about multiple users concurrently.
+
+        :param user_ids: user ids
+        :param max_workers: maximum number of concurrent requests
+        :return: results in the same order as user_ids
+        """
+        return run_bulk(
+            self.get_user, user_ids, max_workers or self.max_workers)
+
+    def get_user_activities(
+            self,
+            user_id: int,
+            activity_types: Optional[
+                Iterable[Union[int, ActivityType]]] = None,
+            min_id: Optional[int] = None,
+            max_id: Optional[int] = None,
+            count: Optional[int] = None,
+            order: Optional[str] = None) -> List[Activity]:
+        """Get list of recent activities of user.
+
+        :param user_id: user id
+        :param activity_types: activity types or their ids
+        :param min_id: minimum activity id
+        :param max_id: maximum activity id
+        :param count: number of activities to get (1-100)
+        :param order: sort order by id ('asc' or 'desc')
+        :raises ValueError: when parameters are invalid
+        :return: list of activities
+        """
+        url = f"users/{user_id}/activities"
+        query_params = activity_params(
+            activity_types, min_id, max_id, count, order)
+
+        activities = self._send_get_request(url, query_params)
+        return self.decoder.to_models(Activity, activities)
 
     def get_own_user(self) -> User:
         """Get own information about user.
@@ -90,18 +273,51 @@ class BacklogApi(object):
         url = "users/myself"
 
         user = self._send_get_request(url)
-        return User.from_dict(user)
+        return self.decoder.to_model(User, user)
 
-    def get_user_received_stars(self, user_id: int) -> List[Star]:
+    def get_user_received_stars(
+            self,
+            user_id: int,
+            min_id: Optional[int] = None,
+            max_id: Optional[int] = None,
+            count: Optional[int] = None,
+            order: Optional[str] = None) -> List[Star]:
         """Get list of stars that user received.
 
         :param user_id: user id
+        :param min_id: minimum star id
+        :param max_id: maximum star id
+        :param count: number of stars to get (1-100)
+        :param order: sort order by id ('asc' or 'desc')
         :return: list of stars
         """
         url = f"users/{user_id}/stars"
+        query_params = page_params(min_id, max_id, count, order)
+
+        stars = self._send_get_request(url, query_params)
+        return self.decoder.to_models(Star, stars)
+
+    def iter_user_received_stars(
+            self,
+            user_id: int,
+            count: int = MAX_COUNT,
+            order: str = "desc") -> Iterator[Star]:
+        """Iterate over all stars that user received.
 
-        stars = self._send_get_request(url)
-        return [Star.from_dict(star) for star in stars]
+        Stars are fetched page by page, so every star is returned
+        however many stars the user received.
+
+        :param user_id: user id
+        :param count: number of stars fetched per request (1-100)
+        :param order: sort order by id ('asc' or 'desc')
+        :return: iterator of stars
+        """
+        return iter_by_id_cursor(
+            functools.partial(
+                self._for_iteration().get_user_received_stars, user_id,
+                count=count, order=order),
+            count,
+            order)
 
     def get_number_of_user_received_stars(self, user_id: int) -> int:
         """Get number of stars that user received.
@@ -122,7 +338,7 @@ class BacklogApi(object):
         url = "priorities"
 
         priorities = self._send_get_request(url)
-        return [Priority.value_of(priority["id"]) for priority in priorities]
+        return self.decoder.to_enums(Priority, priorities)
 
     def get_resolutions(self) -> List[Resolution]:
         """Get list of resolutions that can be set for issue.
@@ -132,8 +348,7 @@ class BacklogApi(object):
         url = "resolutions"
 
         resolutions = self._send_get_request(url)
-        return [Resolution.value_of(resolution["id"])
-                for resolution in resolutions]
+        return self.decoder.to_enums(Resolution, resolutions)
 
     def get_projects(self) -> List[Project]:
         """Get list of projects.
@@ -143,7 +358,7 @@ class BacklogApi(object):
         url = "projects"
 
         projects = self._send_get_request(url)
-        return [Project.from_dict(project) for project in projects]
+        return self.decoder.to_models(Project, projects)
 
     def get_project(self, project_id_or_key: Union[int, str]) -> Project:
         """Get information about project.
@@ -154,7 +369,34 @@ class BacklogApi(object):
         url = f"projects/{project_id_or_key}"
 
         project = self._send_get_request(url)
-        return Project.from_dict(project)
+        return self.decoder.to_model(Project, project)
+
+    def get_project_activities(
+            self,
+            project_id_or_key: Union[int, str],
+            activity_types: Optional[
+                Iterable[Union[int, ActivityType]]] = None,
+            min_id: Optional[int] = None,
+            max_id: Optional[int] = None,
+            count: Optional[int] = None,
+            order: Optional[str] = None) -> List[Activity]:
+        """Get list of recent activities in the project.
+
+        :param project_id_or_key: project id or project key
+        :param activity_types: activity types or their ids
+        :param min_id: minimum activity id
+        :param max_id: maximum activity id
+        :param count: number of activities to get (1-100)
+        :param order: sort order by id ('asc' or 'desc')
+        :raises ValueError: when parameters are invalid
+        :return: list of activities
+        """
+        url = f"projects/{project_id_or_key}/activities"
+        query_params = activity_params(
+            activity_types, min_id, max_id, count, order)
+
+        activities = self._send_get_request(url, query_params)
+        return self.decoder.to_models(Activity, activities)
 
     def get_project_users(
             self, project_id_or_key: Union[int, str]) -> List[User]:
@@ -166,7 +408,22 @@ class BacklogApi(object):
         url = f"projects/{project_id_or_key}/users"
 
         users = self._send_get_request(url)
-        return [User.from_dict(user) for user in users]
+        return self.decoder.to_models(User, users)
+
+    def iter_project_users(
+            self, project_id_or_key: Union[int, str]) -> Iterator[User]:
+        """Iterate over project members.
+
+        The response is decoded while it is being received,
+        so members are returned one by one without loading the whole list.
+
+        :param project_id_or_key: project id or project key
+        :return: iterator of project members
+        """
+        url = f"projects/{project_id_or_key}/users"
+
+        return self.decoder.iter_models(
+            User, self._stream_get_request(url))
 
     def get_project_administrators(
             self, project_id_or_key: Union[int, str]) -> List[User]:
@@ -178,8 +435,7 @@ class BacklogApi(object):
         url = f"projects/{project_id_or_key}/administrators"
 
         administrators = self._send_get_request(url)
-        return [User.from_dict(administrator)
-                for administrator in administrators]
+        return self.decoder.to_models(User, administrators)
 
     def get_project_statuses(
             self, project_id_or_key: Union[int, str]) -> List[Status]:
@@ -191,7 +447,7 @@ class BacklogApi(object):
         url = f"projects/{project_id_or_key}/statuses"
 
         statuses = self._send_get_request(url)
-        return [Status.from_dict(status) for status in statuses]
+        return self.decoder.to_models(Status, statuses)
 
     def get_project_issue_types(
             self, project_id_or_key: Union[int, str]) -> List[IssueType]:
@@ -203,7 +459,7 @@ class BacklogApi(object):
         url = f"projects/{project_id_or_key}/issueTypes"
 
         issue_types = self._send_get_request(url)
-        return [IssueType.from_dict(issue_type) for issue_type in issue_types]
+        return self.decoder.to_models(IssueType, issue_types)
 
     def get_project_categories(
             self, project_id_or_key: Union[int, str]) -> List[Category]:
@@ -215,7 +471,7 @@ class BacklogApi(object):
         url = f"projects/{project_id_or_key}/categories"
 
         categories = self._send_get_request(url)
-        return [Category.from_dict(category) for category in categories]
+        return self.decoder.to_models(Category, categories)
 
     def get_project_versions(
             self, project_id_or_key: Union[int, str]) -> List[Version]:
@@ -227,19 +483,186 @@ class BacklogApi(object):
         url = f"projects/{project_id_or_key}/versions"
 
         versions = self._send_get_request(url)
-        return [Version.from_dict(version) for version in versions]
+        return self.decoder.to_models(Version, versions)
+
+    def get_issues(
+            self,
+            project_ids: Optional[Iterable[int]] = None,
+            status_ids: Optional[Iterable[int]] = None,
+            assignee_ids: Optional[Iterable[int]] = None,
+            keyword: Optional[str] = None,
+            updated_since: Optional[DateType] = None,
+            updated_until: Optional[DateType] = None,
+            sort: Optional[str] = None,
+            order: Optional[str] = None,
+            offset: Optional[int] = None,
+            count: Optional[int] = None) -> List[Issue]:
+        """Get list of issues.
+
+        :param project_ids: project ids
+        :param status_ids: status ids
+        :param assignee_ids: assignee ids
+        :param keyword: keyword
+        :param updated_since: first date of update
+        :param updated_until: last date of update
+        :param sort: attribute name to sort by, e.g. 'created'
+        :param order: sort order ('asc' or 'desc')
+        :param offset: number of issues to skip
+        :param count: number of issues to get (1-100)
+        :raises ValueError: when parameters are invalid
+        :return: list of issues
+        """
+        url = "issues"
+        query_params = issue_params(
+            project_ids, status_ids, assignee_ids, keyword,
+            updated_since, updated_until,
+            sort, order, offset, count)
+
+        issues = self._send_get_request(url, query_params)
+        return self.decoder.to_models(Issue, issues)
+
+    def count_issues(
+            self,
+            project_ids: Optional[Iterable[int]] = None,
+            status_ids: Optional[Iterable[int]] = None,
+            assignee_ids: Optional[Iterable[int]] = None,
+            keyword: Optional[str] = None,
+            updated_since: Optional[DateType] = None,
+            updated_until: Optional[DateType] = None) -> int:
+        """Get number of issues.
+
+        :param project_ids: project ids
+        :param status_ids: status ids
+        :param assignee_ids: assignee ids
+        :param keyword: keyword
+        :param updated_since: first date of update
+        :param updated_until: last date of update
+        :return: number of issues
+        """
+        url = "issues/count"
+        query_params = issue_params(
+            project_ids, status_ids, assignee_ids, keyword,
+            updated_since, updated_until)
+
+        res = self._send_get_request(url, query_params)
+        return res["count"]
+
+    def iter_issues(
+            self,
+            project_ids: Optional[Iterable[int]] = None,
+            status_ids: Optional[Iterable[int]] = None,
+            assignee_ids: Optional[Iterable[int]] = None,
+            keyword: Optional[str] = None,
+            updated_since: Optional[DateType] = None,
+            updated_until: Optional[DateType] = None,
+            sort: str = "created",
+            order: str = "asc",
+            count: int = MAX_COUNT,
+            max_workers: Optional[int] = None) -> Iterator[Issue]:
+        """Iterate over all issues.
+
+        The issues are counted first, and then pages are requested
+        concurrently by offset. The default sort by creation in
+        ascending order keeps offsets stable while issues are created.
+
+        :param project_ids: project ids
+        :param status_ids: status ids
+        :param assignee_ids: assignee ids
+        :param keyword: keyword
+        :param updated_since: first date of update
+        :param updated_until: last date of update
+        :param sort: attribute name to sort by
+        :param order: sort order ('asc' or 'desc')
+        :param count: number of issues fetched per request (1-100)
+        :param max_workers: maximum number of pages requested
+            concurrently. defaults to max_workers of this instance
+        :raises ValueError: when parameters are invalid
+        :return: iterator of issues
+        """
+        max_workers = max_workers or self.max_workers
+        check_page_params(count, order)
+        check_offset_params(count, max_workers)
+        # ids are used twice, for counting and for getting pages
+        project_ids, status_ids, assignee_ids = (
+            None if ids is None else list(ids)
+            for ids in (project_ids, status_ids, assignee_ids))
+
+        total = self.count_issues(
+            project_ids, status_ids, assignee_ids, keyword,
+            updated_since, updated_until)
+        return iter_by_offset(
+            functools.partial(
+                self._for_iteration().get_issues,
+                project_ids=project_ids,
+                status_ids=status_ids,
+                assignee_ids=assignee_ids,
+                keyword=keyword,
+                updated_since=updated_since,
+                updated_until=updated_until,
+                sort=sort, order=order, count=count),
+            total,
+            count,
+            max_workers)
 
     def get_issue_comments(
-            self, issue_id_or_key: Union[int, str]) -> List[Comment]:
+            self,
+            issue_id_or_key: Union[int, str],
+            min_id: Optional[int] = None,
+            max_id: Optional[int] = None,
+            count: Optional[int] = None,
+            order: Optional[str] = None) -> List[Comment]:
         """Get list of comments in issue.
 
         :param issue_id_or_key: issue id or issue key
+        :param min_id: minimum comment id
+        :param max_id: maximum comment id
+        :param count: number of comments to get (1-100)
+        :param order: sort order by id ('asc' or 'desc')
         :return: list of comments
         """
         url = f"issues/{issue_id_or_key}/comments"
+        query_params = page_params(min_id, max_id, count, order)
 
-        comments = self._send_get_request(url)
-        return [Comment.from_dict(comment) for comment in comments]
+        comments = self._send_get_request(url, query_params)
+        return self.decoder.to_models(Comment, comments)
+
+    def iter_issue_comments(
+            self,
+            issue_id_or_key: Union[int, str],
+            count: int = MAX_COUNT,
+            order: str = "asc") -> Iterator[Comment]:
+        """Iterate over all comments in issue.
+
+        Comments are fetched page by page, so every comment is returned
+        however many comments the issue has.
+
+        :param issue_id_or_key: issue id or issue key
+        :param count: number of comments fetched per request (1-100)
+        :param order: sort order by id ('asc' or 'desc')
+        :return: iterator of comments
+        """
+        return iter_by_id_cursor(
+            functools.partial(
+                self._for_iteration().get_issue_comments, issue_id_or_key,
+                count=count, order=order),
+            count,
+            order)
+
+    def get_issue_comments_bulk(
+            self,
+            issue_ids_or_keys: Iterable[Union[int, str]],
+            max_workers: Optional[int] = None
+    ) -> List[BulkResult[List[Comment]]]:
+        """Get lists of comments in multiple issues concurrently.
+
+        :param issue_ids_or_keys: issue ids or issue keys
+        :param max_workers: maximum number of concurrent requests
+        :return: results in the same order as issue_ids_or_keys
+        """
+        return run_bulk(
+            self.get_issue_comments,
+            issue_ids_or_keys,
+            max_workers or self.max_workers)
 
     def get_number_of_comments(
             self, issue_id_or_key: Union[int, str]) -> int:
@@ -266,7 +689,7 @@ class BacklogApi(object):
         url = f"issues/{issue_id_or_key}/comments/{comment_id}"
 
         comment = self._send_get_request(url)
-        return Comment.from_dict(comment)
+        return self.decoder.to_model(Comment, comment)
 
     def get_wikis(
             self,
@@ -286,7 +709,30 @@ class BacklogApi(object):
             query_params["keyword"] = keyword
 
         wikis = self._send_get_request(url, query_params)
-        return [Wiki.from_dict(wiki) for wiki in wikis]
+        return self.decoder.to_models(Wiki, wikis)
+
+    def iter_wikis(
+            self,
+            project_id_or_key: Union[int, str],
+            keyword: Optional[str] = None) -> Iterator[Wiki]:
+        """Iterate over wiki pages.
+
+        The response is decoded while it is being received,
+        so wiki pages are returned one by one without loading the whole list.
+
+        :param project_id_or_key: project id or project key
+        :param keyword: keyword
+        :return: iterator of wiki pages
+        """
+        url = "wikis"
+        query_params = {
+            "projectIdOrKey": project_id_or_key,
+        }
+        if keyword is not None:
+            query_params["keyword"] = keyword
+
+        return self.decoder.iter_models(
+            Wiki, self._stream_get_request(url, query_params))
 
     def get_number_of_wikis(
             self, project_id_or_key: Union[int, str]) -> int:
@@ -312,7 +758,20 @@ class BacklogApi(object):
         url = f"wikis/{wiki_id}"
 
         wiki = self._send_get_request(url)
-        return Wiki.from_dict(wiki)
+        return self.decoder.to_model(Wiki, wiki)
+
+    def get_wikis_bulk(
+            self,
+            wiki_ids: Iterable[int],
+            max_workers: Optional[int] = None) -> List[BulkResult[Wiki]]:
+        """Get information about multiple wiki pages concurrently.
+
+        :param wiki_ids: wiki ids
+        :param max_workers: maximum number of concurrent requests
+        :return: results in the same order as wiki_ids
+        """
+        return run_bulk(
+            self.get_wiki, wiki_ids, max_workers or self.max_workers)
 
     def get_wiki_attachments(
             self,
@@ -325,7 +784,23 @@ class BacklogApi(object):
         url = f"wikis/{wiki_id}/attachments"
 
         attachments = self._send_get_request(url)
-        return [Attachment.from_dict(attachment) for attachment in attachments]
+        return self.decoder.to_models(Attachment, attachments)
+
+    def get_wiki_attachments_bulk(
+            self,
+            wiki_ids: Iterable[int],
+            max_workers: Optional[int] = None
+    ) -> List[BulkResult[List[Attachment]]]:
+        """Get lists of files attached to multiple wikis concurrently.
+
+        :param wiki_ids: wiki ids
+        :param max_workers: maximum number of concurrent requests
+        :return: results in the same order as wiki_ids
+        """
+        return run_bulk(
+            self.get_wiki_attachments,
+            wiki_ids,
+            max_workers or self.max_workers)
 
     def get_wiki_shared_files(
             self,
@@ -338,12 +813,120 @@ class BacklogApi(object):
         url = f"wikis/{wiki_id}/sharedFiles"
 
         shared_files = self._send_get_request(url)
-        return [SharedFile.from_dict(shared_file)
-                for shared_file in shared_files]
+        return self.decoder.to_models(SharedFile, shared_files)
+
+    def get_wiki_shared_files_bulk(
+            self,
+            wiki_ids: Iterable[int],
+            max_workers: Optional[int] = None
+    ) -> List[BulkResult[List[SharedFile]]]:
+        """Get lists of shared files on multiple wikis concurrently.
+
+        :param wiki_ids: wiki ids
+        :param max_workers: maximum number of concurrent requests
+        :return: results in the same order as wiki_ids
+        """
+        return run_bulk(
+            self.get_wiki_shared_files,
+            wiki_ids,
+            max_workers or self.max_workers)
+
+    def _for_iteration(self) -> "BacklogApi":
+        # columns cannot be yielded one by one, so pages are decoded as raw
+        if self.decoder.output != "columns":
+            return self
+        return self.with_decoder(self.decoder.with_output("raw"))
+
+    @staticmethod
+    def _create_session(
+            pool_connections: int,
+            pool_maxsize: int,
+            pool_block: bool,
+            keep_alive: bool) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
 
     def _send_get_request(self, path: str, query_params: dict = None):
         query_params = query_params or {}
+        key = ResponseCache.make_key(self.base_url, path, query_params)
+        ttl = self.cache.get_ttl(path) if self.cache is not None else None
+        if ttl:
+            found, data = self.cache.get(key)
+            if found:
+                return data
+
+        def fetch():
+            return self.json_backend.loads(self._fetch(path, query_params))
+
+        if self.single_flight is not None:
+            data = self.single_flight.do(key, fetch)
+        else:
+            data = fetch()
+        if ttl:
+            self.cache.set(key, data, ttl)
+        return data
+
+    def _stream_get_request(
+            self, path: str, query_params: dict = None) -> Iterator[Any]:
+        query_params = query_params or {}
         query_params["apiKey"] = self.api_key
 
-        response = requests.get(self.base_url + path, params=query_params)
-        return response.json()
+        with self._get(path, query_params, stream=True) as response:
+            yield from iter_json_array(
+                response.iter_content(chunk_size=CHUNK_SIZE))
+
+    def _fetch(self, path: str, query_params: dict) -> bytes:
+        if self.http_cache is None:
+            query_params["apiKey"] = self.api_key
+            response = self._get(path, query_params)
+            return response.content
+
+        key = SQLiteHttpCache.make_key(self.base_url, path, query_params)
+        cached = self.http_cache.get(key)
+        headers = cached.to_conditional_headers() if cached else {}
+        query_params["apiKey"] = self.api_key
+        response = self._get(path, query_params, headers)
+        if cached is not None:
+            not_modified = response.status_code == 304
+            self.http_cache.record(not_modified)
+            if not_modified:
+                return cached.body
+        self.http_cache.store(key, path, response.headers, response.content)
+        return response.content
+
+    def _get(
+            self,
+            path: str,
+            query_params: dict,
+            headers: Optional[dict] = None,
+            stream: bool = False) -> requests.Response:
+        def send() -> requests.Response:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            response = self.session.get(
+                self.base_url + path,
+                params=query_params,
+                headers=headers,
+                stream=stream,
+                timeout=self.timeout)
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(response.headers)
+            return response
+
+        response = send_with_retry(
+            send,
+            self.retry_policy,
+            self.retry_stats,
+            (requests.ConnectionError, requests.Timeout))
+        if stream and not response.ok:
+            response.close()
+        response.raise_for_status()
+        return response
@@ -0,0 +1,951 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Backlog asynchronous API module."""
+
+import copy
+import functools
+from typing import (Any, AsyncIterator, Awaitable, Callable, Iterable, List,
+                    Optional, Tuple, Union)
+
+from .api import BacklogApi
+from .bulk import BulkResult, gather_bulk
+from .cache import ResponseCache
+from .decoding import ModelDecoder
+from .filters import DateType, activity_params, issue_params
+from .http_cache import SQLiteHttpCache
+from .json_backend import JsonBackend, get_json_backend
+from .models import (Activity, ActivityType, Attachment, Category,
+                     Comment, Issue, IssueType, Priority, Project, Resolution,
+                     SharedFile, Space, Star, Status, User, Version, Wiki)
+from .pagination import (MAX_COUNT, aiter_by_id_cursor, aiter_by_offset,
+                         check_offset_params, check_page_params,
+                         page_params)
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, RetryStats, send_with_retry_async
+from .singleflight import SingleFlight
+from .streaming import CHUNK_SIZE, JsonArrayDecoder
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+class AsyncBacklogApi(object):
+    """Backlog API class for asyncio.
+
+    This class has the same methods as :class:`BacklogApi`,
+    but every method is a coroutine.
+    """
+
+    SPACE_TYPES = BacklogApi.SPACE_TYPES
+
+    def __init__(
+            self,
+            space_key: str,
+            space_type: str,
+            api_key: str,
+            client: Optional["httpx.AsyncClient"] = None,
+            max_connections: int = 100,
+            max_keepalive_connections: int = 20,
+            max_concurrency: Optional[int] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            timeout: Tuple[float, float] = (10.0, 60.0),
+            retry_policy: Optional[RetryPolicy] = None,
+            cache: Optional[ResponseCache] = None,
+            http_cache: Optional[SQLiteHttpCache] = None,
+            single_flight: Optional[SingleFlight] = None,
+            decoder: Optional[ModelDecoder] = None,
+            json_backend: Optional[Union[str, JsonBackend]] = None):
+        """__init__ method.
+
+        :param space_key: space key
+        :param space_type: space type
+        :param api_key: api key
+        :param client: client used for every request.
+            if omitted, a pooled client owned by this instance is created
+        :param max_connections: maximum number of concurrent connections
+        :param max_keepalive_connections: maximum number of idle connections
+            kept for reuse
+        :param max_concurrency: default number of concurrent requests
+            in bulk methods. defaults to max_connections
+        :param rate_limiter: rate limiter that paces every request.
+            it can be shared by multiple instances
+        :param timeout: connect timeout and read timeout in seconds
+        :param retry_policy: policy to retry failed requests.
+            if omitted, requests are not retried
+        :param cache: cache of responses for rarely changed data.
+            if omitted, responses are not cached
+        :param http_cache: persistent cache revalidated by conditional
+            requests. if omitted, conditional requests are not sent
+        :param single_flight: deduplicator that makes concurrent identical
+            requests share one round trip. if omitted, they are all sent
+        :param decoder: decoder building models from responses.
+            if omitted, users nested in one response are shared by id
+        :param json_backend: backend decoding JSON of every response,
+            or its name such as "orjson".
+            if omitted, the fastest installed backend is used
+        :raises ImportError: when httpx is not installed
+        :raises ValueError: when initialization fails
+        """
+        if httpx is None:
+            raise ImportError(
+                "httpx is required to use AsyncBacklogApi. "
+                "Install it with 'pip install backlog-api4py[async]'.")
+        if not space_key:
+            raise ValueError("space_key must not be empty.")
+        domain = self.SPACE_TYPES.get(space_type)
+        if not domain:
+            raise ValueError("space_type must be one of 'jp', 'com', 'tool'.")
+        if not api_key:
+            raise ValueError("api_key must not be empty.")
+        if max_connections < 1:
+            raise ValueError("max_connections must be greater than 0.")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0.")
+
+        self.base_url = f"https://{space_key}.{domain}/api/v2/"
+        self.api_key = api_key
+        self.max_concurrency = max_concurrency or max_connections
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=1)
+        self.retry_stats = RetryStats()
+        self.cache = cache
+        self.http_cache = http_cache
+        self.single_flight = single_flight
+        self.decoder = decoder or ModelDecoder()
+        self.json_backend = get_json_backend(json_backend)
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections))
+
+    async def __aenter__(self) -> "AsyncBacklogApi":
+        """__aenter__ method."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """__aexit__ method."""
+        await self.aclose()
+
+    async def aclose(self):
+        """Release the connections held by this instance.
+
+        A client passed from outside is left open for its owner to close.
+        """
+        if self._owns_client:
+            await self.client.aclose()
+
+    def with_decoder(self, decoder: ModelDecoder) -> "AsyncBacklogApi":
+        """Create an instance sharing the client with another decoder.
+
+        e.g. ``api.with_decoder(ModelDecoder(output="columns")).get_users()``
+        returns columns only for that call.
+
+        :param decoder: decoder building models from responses
+        :return: new instance. closing it leaves the client open
+        """
+        api = copy.copy(self)
+        api.decoder = decoder
+        api._owns_client = False
+        return api
+
+    async def get_space(self) -> Space:
+        """Get information about your space.
+
+        :return: space information
+        """
+        url = "space"
+
+        space = await self._send_get_request(url)
+        return self.decoder.to_model(Space, space)
+
+    async def get_space_activities(
+            self,
+            activity_types: Optional[
+                Iterable[Union[int, ActivityType]]] = None,
+            min_id: Optional[int] = None,
+            max_id: Optional[int] = None,
+            count: Optional[int] = None,
+            order: Optional[str] = None) -> List[Activity]:
+        """Get list of recent activities in your space.
+
+        :param activity_types: activity types or their ids
+        :param min_id: minimum activity id
+        :param max_id: maximum activity id
+        :param count: number of activities to get (1-100)
+        :param order: sort order by id ('asc' or 'desc')
+        :raises ValueError: when parameters are invalid
+        :return: list of activities
+        """
+        url = "space/activities"
+        query_params = activity_params(
+            activity_types, min_id, max_id, count, order)
+
+        activities = await self._send_get_request(url, query_params)
+        return self.decoder.to_models(Activity, activities)
+
+    async def get_users(self) -> List[User]:
+        """Get list of users in your space.
+
+        :return: list of users
+        """
+        url = "users"
+
+        users = await self._send_get_request(url)
+        return self.decoder.to_models(User, users)
+
+    def iter_users(self) -> AsyncIterator[User]:
+        """Iterate over users in your space.
+
+        The response is decoded while it is being received,
+        so users are returned one by one without loading the whole list.
+
+        :return: iterator of users
+        """
+        url = "users"
+
+        return self.decoder.aiter_models(
+            User, self._stream_get_request(url))
+
+    async def get_user(self, user_id: int) -> User:
+        """Get information about user.
+
+        :param user_id: user id
+        :return: user information
+        """
+        url = f"users/{user_id}"
+
+        user = await self._send_get_request(url)
+        return self.decoder.to_model(User, user)
+
+    async def get_users_bulk(
+            self,
+            user_ids: Iterable[int],
+            max_concurrency: Optional[int] = None) -> List[BulkResult[User]]:
+        """Get information about multiple users concurrently.
+
+        :param user_ids: user ids
+        :param max_concurrency: maximum number of concurrent requests
+        :return: results in the same order as user_ids
+        """
+        return await gather_bulk(
+            self.get_user, user_ids, max_concurrency or self.max_concurrency)
+
+    async def get_user_activities(
+            self,
+            user_id: int,
+            activity_types: Optional[
+                Iterable[Union[int, ActivityType]]] = None,
+            min_id: Optional[int] = None,
+            max_id: Optional[int] = None,
+            count: Optional[int] = None,
+            order: Optional[str] = None) -> List[Activity]:
+        """Get list of recent activities of user.
+
+        :param user_id: user id
+        :param activity_types: activity types or their ids
+        :param min_id: minimum activity id
+        :param max_id: maximum activity id
+        :param count: number of activities to get (1-100)
+        :param order: sort order by id ('asc' or 'desc')
+        :raises ValueError: when parameters are invalid
+        :return: list of activities
+        """
+        url = f"users/{user_id}/activities"
+        query_params = activity_params(
+            activity_types, min_id, max_id, count, order)
+
+        activities = await self._send_get_request(url, query_params)
+        return self.decoder.to_models(Activity, activities)
+
+    async def get_own_user(self) -> User:
+        """Get own information about user.
+
+        :return: user information
+        """
+        url = "users/myself"
+
+        user = await self._send_get_request(url)
+        return self.decoder.to_model(User, user)
+
+    async def get_user_received_stars(
+            self,
+            user_id: int,
+            min_id: Optional[int] = None,
+            max_id: Optional[int] = None,
+            count: Optional[int] = None,
+            order: Optional[str] = None) -> List[Star]:
+        """Get list of stars that user received.
+
+        :param user_id: user id
+        :param min_id: minimum star id
+        :param max_id: maximum star id
+        :param count: number of stars to get (1-100)
+        :param order: sort order by id ('asc' or 'desc')
+        :return: list of stars
+        """
+        url = f"users/{user_id}/stars"
+        query_params = page_params(min_id, max_id, count, order)
+
+        stars = await self._send_get_request(url, query_params)
+        return self.decoder.to_models(Star, stars)
+
+    def iter_user_received_stars(
+            self,
+            user_id: int,
+            count: int = MAX_COUNT,
+            order: str = "desc") -> AsyncIterator[Star]:
+        """Iterate over all stars that user received.
+
+        Stars are fetched page by page, so every star is returned
+        however many stars the user received.
+
+        :param user_id: user id
+        :param count: number of stars fetched per request (1-100)
+        :param order: sort order by id ('asc' or 'desc')
+        :return: iterator of stars
+        """
+        return aiter_by_id_cursor(
+            functools.partial(
+                self._for_iteration().get_user_received_stars, user_id,
+                count=count, order=order),
+            count,
+            order)
+
+    async def get_number_of_user_received_stars(self, user_id: int) -> int:
+        """Get number of stars that user received.
+
+        :param user_id: user id
+        :return: number of stars
+        """
+        url = f"users/{user_id}/stars/count"
+
+        res = await self._send_get_request(url)
+        return res["count"]
+
+    async def get_priorities(self) -> List[Priority]:
+        """Get list of priorities that can be set for issue.
+
+        :return: list of priorities
+        """
+        url = "priorities"
+
+        priorities = await self._send_get_request(url)
+        return self.decoder.to_enums(Priority, priorities)
+
+    async def get_resolutions(self) -> List[Resolution]:
+        """Get list of resolutions that can be set for issue.
+
+        :return: list of resolutions
+        """
+        url = "resolutions"
+
+        resolutions = await self._send_get_request(url)
+        return self.decoder.to_enums(Resolution, resolutions)
+
+    async def get_projects(self) -> List[Project]:
+        """Get list of projects.
+
+        :return: list of projects
+        """
+        url = "projects"
+
+        projects = await self._send_get_request(url)
+        return self.decoder.to_models(Project, projects)
+
+    async def get_project(self, project_id_or_key: Union[int, str]) -> Project:
+        """Get information about project.
+
+        :param project_id_or_key: project id or project key
+        :return: project information
+        """
+        url = f"projects/{project_id_or_key}"
+
+        project = await self._send_get_request(url)
+        return self.decoder.to_model(Project, project)
+
+    async def get_project_activities(
+            self,
+            project_id_or_key: Union[int, str],
+            activity_types: Optional[
+                Iterable[Union[int, ActivityType]]] = None,
+            min_id: Optional[int] = None,
+            max_id: Optional[int] = None,
+            count: Optional[int] = None,
+            order: Optional[str] = None) -> List[Activity]:
+        """Get list of recent activities in the project.
+
+        :param project_id_or_key: project id or project key
+        :param activity_types: activity types or their ids
+        :param min_id: minimum activity id
+        :param max_id: maximum activity id
+        :param count: number of activities to get (1-100)
+        :param order: sort order by id ('asc' or 'desc')
+        :raises ValueError: when parameters are invalid
+        :return: list of activities
+        """
+        url = f"projects/{project_id_or_key}/activities"
+        query_params = activity_params(
+            activity_types, min_id, max_id, count, order)
+
+        activities = await self._send_get_request(url, query_params)
+        return self.decoder.to_models(Activity, activities)
+
+    async def get_project_users(
+            self, project_id_or_key: Union[int, str]) -> List[User]:
+        """Get list of project members.
+
+        :param project_id_or_key: project id or project key
+        :return: list of project members
+        """
+        url = f"projects/{project_id_or_key}/users"
+
+        users = await self._send_get_request(url)
+        return self.decoder.to_models(User, users)
+
+    def iter_project_users(
+            self, project_id_or_key: Union[int, str]) -> AsyncIterator[User]:
+        """Iterate over project members.
+
+        The response is decoded while it is being received,
+        so members are returned one by one without loading the whole list.
+
+        :param project_id_or_key: project id or project key
+        :return: iterator of project members
+        """
+        url = f"projects/{project_id_or_key}/users"
+
+        return self.decoder.aiter_models(
+            User, self._stream_get_request(url))
+
+    async def get_project_administrators(
+            self, project_id_or_key: Union[int, str]) -> List[User]:
+        """Get list of users who has project administrator role.
+
+        :param project_id_or_key: project id or project key
+        :return: list of project administrators
+        """
+        url = f"projects/{project_id_or_key}/administrators"
+
+        administrators = await self._send_get_request(url)
+        return self.decoder.to_models(User, administrators)
+
+    async def get_project_statuses(
+            self, project_id_or_key: Union[int, str]) -> List[Status]:
+        """Get list of statuses in the project.
+
+        :param project_id_or_key: project id or project key
+        :return: list of issue statuses
+        """
+        url = f"projects/{project_id_or_key}/statuses"
+
+        statuses = await self._send_get_request(url)
+        return self.decoder.to_models(Status, statuses)
+
+    async def get_project_issue_types(
+            self, project_id_or_key: Union[int, str]) -> List[IssueType]:
+        """Get list of issue types in the project.
+
+        :param project_id_or_key: project id or project key
+        :return: list of issue types
+        """
+        url = f"projects/{project_id_or_key}/issueTypes"
+
+        issue_types = await self._send_get_request(url)
+        return self.decoder.to_models(IssueType, issue_types)
+
+    async def get_project_categories(
+            self, project_id_or_key: Union[int, str]) -> List[Category]:
+        """Get list of categories in the project.
+
+        :param project_id_or_key: project id or project key
+        :return: list of categories
+        """
+        url = f"projects/{project_id_or_key}/categories"
+
+        categories = await self._send_get_request(url)
+        return self.decoder.to_models(Category, categories)
+
+    async def get_project_versions(
+            self, project_id_or_key: Union[int, str]) -> List[Version]:
+        """Get list of versions(milestones) in the project.
+
+        :param project_id_or_key: project id or project key
+        :return: list of versions(milestones)
+        """
+        url = f"projects/{project_id_or_key}/versions"
+
+        versions = await self._send_get_request(url)
+        return self.decoder.to_models(Version, versions)
+
+    async def get_issues(
+            self,
+            project_ids: Optional[Iterable[int]] = None,
+            status_ids: Optional[Iterable[int]] = None,
+            assignee_ids: Optional[Iterable[int]] = None,
+            keyword: Optional[str] = None,
+            updated_since: Optional[DateType] = None,
+            updated_until: Optional[DateType] = None,
+            sort: Optional[str] = None,
+            order: Optional[str] = None,
+            offset: Optional[int] = None,
+            count: Optional[int] = None) -> List[Issue]:
+        """Get list of issues.
+
+        :param project_ids: project ids
+        :param status_ids: status ids
+        :param assignee_ids: assignee ids
+        :param keyword: keyword
+        :param updated_since: first date of update
+        :param updated_until: last date of update
+        :param sort: attribute name to sort by, e.g. 'created'
+        :param order: sort order ('asc' or 'desc')
+        :param offset: number of issues to skip
+        :param count: number of issues to get (1-100)
+        :raises ValueError: when parameters are invalid
+        :return: list of issues
+        """
+        url = "issues"
+        query_params = issue_params(
+            project_ids, status_ids, assignee_ids, keyword,
+            updated_since, updated_until,
+            sort, order, offset, count)
+
+        issues = await self._send_get_request(url, query_params)
+        return self.decoder.to_models(Issue, issues)
+
+    async def count_issues(
+            self,
+            project_ids: Optional[Iterable[int]] = None,
+            status_ids: Optional[Iterable[int]] = None,
+            assignee_ids: Optional[Iterable[int]] = None,
+            keyword: Optional[str] = None,
+            updated_since: Optional[DateType] = None,
+            updated_until: Optional[DateType] = None) -> int:
+        """Get number of issues.
+
+        :param project_ids: project ids
+        :param status_ids: status ids
+        :param assignee_ids: assignee ids
+        :param keyword: keyword
+        :param updated_since: first date of update
+        :param updated_until: last date of update
+        :return: number of issues
+        """
+        url = "issues/count"
+        query_params = issue_params(
+            project_ids, status_ids, assignee_ids, keyword,
+            updated_since, updated_until)
+
+        res = await self._send_get_request(url, query_params)
+        return res["count"]
+
+    def iter_issues(
+            self,
+            project_ids: Optional[Iterable[int]] = None,
+            status_ids: Optional[Iterable[int]] = None,
+            assignee_ids: Optional[Iterable[int]] = None,
+            keyword: Optional[str] = None,
+            updated_since: Optional[DateType] = None,
+            updated_until: Optional[DateType] = None,
+            sort: str = "created",
+            order: str = "asc",
+            count: int = MAX_COUNT,
+            max_concurrency: Optional[int] = None) -> AsyncIterator[Issue]:
+        """Iterate over all issues.
+
+        The issues are counted first, and then pages are requested
+        concurrently by offset. The default sort by creation in
+        ascending order keeps offsets stable while issues are created.
+
+        :param project_ids: project ids
+        :param status_ids: status ids
+        :param assignee_ids: assignee ids
+        :param keyword: keyword
+        :param updated_since: first date of update
+        :param updated_until: last date of update
+        :param sort: attribute name to sort by
+        :param order: sort order ('asc' or 'desc')
+        :param count: number of issues fetched per request (1-100)
+        :param max_concurrency: maximum number of pages requested
+            concurrently. defaults to max_concurrency of this instance
+        :raises ValueError: when parameters are invalid
+        :return: iterator of issues
+        """
+        max_concurrency = max_concurrency or self.max_concurrency
+        check_page_params(count, order)
+        check_offset_params(count, max_concurrency)
+        # ids are used twice, for counting and for getting pages
+        project_ids, status_ids, assignee_ids = (
+            None if ids is None else list(ids)
+            for ids in (project_ids, status_ids, assignee_ids))
+
+        return self._iter_issues(
+            functools.partial(
+                self._for_iteration().get_issues,
+                project_ids=project_ids,
+                status_ids=status_ids,
+                assignee_ids=assignee_ids,
+                keyword=keyword,
+                updated_since=updated_since,
+                updated_until=updated_until,
+                sort=sort, order=order, count=count),
+            functools.partial(
+                self.count_issues,
+                project_ids=project_ids,
+                status_ids=status_ids,
+                assignee_ids=assignee_ids,
+                keyword=keyword,
+                updated_since=updated_since,
+                updated_until=updated_until),
+            count,
+            max_concurrency)
+
+    async def get_issue_comments(
+            self,
+            issue_id_or_key: Union[int, str],
+            min_id: Optional[int] = None,
+            max_id: Optional[int] = None,
+            count: Optional[int] = None,
+            order: Optional[str] = None) -> List[Comment]:
+        """Get list of comments in issue.
+
+        :param issue_id_or_key: issue id or issue key
+        :param min_id: minimum comment id
+        :param max_id: maximum comment id
+        :param count: number of comments to get (1-100)
+        :param order: sort order by id ('asc' or 'desc')
+        :return: list of comments
+        """
+        url = f"issues/{issue_id_or_key}/comments"
+        query_params = page_params(min_id, max_id, count, order)
+
+        comments = await self._send_get_request(url, query_params)
+        return self.decoder.to_models(Comment, comments)
+
+    def iter_issue_comments(
+            self,
+            issue_id_or_key: Union[int, str],
+            count: int = MAX_COUNT,
+            order: str = "asc") -> AsyncIterator[Comment]:
+        """Iterate over all comments in issue.
+
+        Comments are fetched page by page, so every comment is returned
+        however many comments the issue has.
+
+        :param issue_id_or_key: issue id or issue key
+        :param count: number of comments fetched per request (1-100)
+        :param order: sort order by id ('asc' or 'desc')
+        :return: iterator of comments
+        """
+        return aiter_by_id_cursor(
+            functools.partial(
+                self._for_iteration().get_issue_comments, issue_id_or_key,
+                count=count, order=order),
+            count,
+            order)
+
+    async def get_issue_comments_bulk(
+            self,
+            issue_ids_or_keys: Iterable[Union[int, str]],
+            max_concurrency: Optional[int] = None
+    ) -> List[BulkResult[List[Comment]]]:
+        """Get lists of comments in multiple issues concurrently.
+
+        :param issue_ids_or_keys: issue ids or issue keys
+        :param max_concurrency: maximum number of concurrent requests
+        :return: results in the same order as issue_ids_or_keys
+        """
+        return await gather_bulk(
+            self.get_issue_comments,
+            issue_ids_or_keys,
+            max_concurrency or self.max_concurrency)
+
+    async def get_number_of_comments(
+            self, issue_id_or_key: Union[int, str]) -> int:
+        """Get number of comments in issue.
+
+        :param issue_id_or_key: issue id or issue key
+        :return: number of comments
+        """
+        url = f"issues/{issue_id_or_key}/comments/count"
+
+        res = await self._send_get_request(url)
+        return res["count"]
+
+    async def get_issue_comment(
+            self,
+            issue_id_or_key: Union[int, str],
+            comment_id: int) -> Comment:
+        """Get information about comment.
+
+        :param issue_id_or_key: issue id or issue key
+        :param comment_id: comment id
+        :return: list of comments
+        """
+        url = f"issues/{issue_id_or_key}/comments/{comment_id}"
+
+        comment = await self._send_get_request(url)
+        return self.decoder.to_model(Comment, comment)
+
+    async def get_wikis(
+            self,
+            project_id_or_key: Union[int, str],
+            keyword: Optional[str] = None) -> List[Wiki]:
+        """Get list of wiki pages.
+
+        :param project_id_or_key: project id or project key
+        :param keyword: keyword
+        :return: list of wiki pages
+        """
+        url = "wikis"
+        query_params = {
+            "projectIdOrKey": project_id_or_key,
+        }
+        if keyword is not None:
+            query_params["keyword"] = keyword
+
+        wikis = await self._send_get_request(url, query_params)
+        return self.decoder.to_models(Wiki, wikis)
+
+    def iter_wikis(
+            self,
+            project_id_or_key: Union[int, str],
+            keyword: Optional[str] = None) -> AsyncIterator[Wiki]:
+        """Iterate over wiki pages.
+
+        The response is decoded while it is being received,
+        so wiki pages are returned one by one without loading the whole list.
+
+        :param project_id_or_key: project id or project key
+        :param keyword: keyword
+        :return: iterator of wiki pages
+        """
+        url = "wikis"
+        query_params = {
+            "projectIdOrKey": project_id_or_key,
+        }
+        if keyword is not None:
+            query_params["keyword"] = keyword
+
+        return self.decoder.aiter_models(
+            Wiki, self._stream_get_request(url, query_params))
+
+    async def get_wikis_bulk(
+            self,
+            wiki_ids: Iterable[int],
+            max_concurrency: Optional[int] = None) -> List[BulkResult[Wiki]]:
+        """Get information about multiple wiki pages concurrently.
+
+        :param wiki_ids: wiki ids
+        :param max_concurrency: maximum number of concurrent requests
+        :return: results in the same order as wiki_ids
+        """
+        return await gather_bulk(
+            self.get_wiki, wiki_ids, max_concurrency or self.max_concurrency)
+
+    async def get_number_of_wikis(
+            self, project_id_or_key: Union[int, str]) -> int:
+        """Get number of wiki pages.
+
+        :param project_id_or_key: project id or project key
+        :return: number of wiki pages
+        """
+        url = "wikis/count"
+        query_params = {
+            "projectIdOrKey": project_id_or_key,
+        }
+
+        res = await self._send_get_request(url, query_params)
+        return res["count"]
+
+    async def get_wiki(self, wiki_id: int) -> Wiki:
+        """Get information about wiki page.
+
+        :param wiki_id: wiki id
+        :return: list of wiki pages
+        """
+        url = f"wikis/{wiki_id}"
+
+        wiki = await self._send_get_request(url)
+        return self.decoder.to_model(Wiki, wiki)
+
+    async def get_wiki_attachments(
+            self,
+            wiki_id: int) -> List[Attachment]:
+        """Get list of files attached to wiki.
+
+        :param wiki_id: wiki id
+        :return: list of wiki attachments
+        """
+        url = f"wikis/{wiki_id}/attachments"
+
+        attachments = await self._send_get_request(url)
+        return self.decoder.to_models(Attachment, attachments)
+
+    async def get_wiki_attachments_bulk(
+            self,
+            wiki_ids: Iterable[int],
+            max_concurrency: Optional[int] = None
+    ) -> List[BulkResult[List[Attachment]]]:
+        """Get lists of files attached to multiple wikis concurrently.
+
+        :param wiki_ids: wiki ids
+        :param max_concurrency: maximum number of concurrent requests
+        :return: results in the same order as wiki_ids
+        """
+        return await gather_bulk(
+            self.get_wiki_attachments,
+            wiki_ids,
+            max_concurrency or self.max_concurrency)
+
+    async def get_wiki_shared_files(
+            self,
+            wiki_id: int) -> List[SharedFile]:
+        """Get list of shared files on wiki.
+
+        :param wiki_id: wiki id
+        :return: list of shared files
+        """
+        url = f"wikis/{wiki_id}/sharedFiles"
+
+        shared_files = await self._send_get_request(url)
+        return self.decoder.to_models(SharedFile, shared_files)
+
+    async def get_wiki_shared_files_bulk(
+            self,
+            wiki_ids: Iterable[int],
+            max_concurrency: Optional[int] = None
+    ) -> List[BulkResult[List[SharedFile]]]:
+        """Get lists of shared files on multiple wikis concurrently.
+
+        :param wiki_ids: wiki ids
+        :param max_concurrency: maximum number of concurrent requests
+        :return: results in the same order as wiki_ids
+        """
+        return await gather_bulk(
+            self.get_wiki_shared_files,
+            wiki_ids,
+            max_concurrency or self.max_concurrency)
+
+    async def _iter_issues(
+            self,
+            fetch_page: Callable[..., Awaitable[List[Issue]]],
+            count_issues: Callable[[], Awaitable[int]],
+            count: int,
+            max_concurrency: int) -> AsyncIterator[Issue]:
+        total = await count_issues()
+        async for issue in aiter_by_offset(
+                fetch_page, total, count, max_concurrency):
+            yield issue
+
+    def _for_iteration(self) -> "AsyncBacklogApi":
+        # columns cannot be yielded one by one, so pages are decoded as raw
+        if self.decoder.output != "columns":
+            return self
+        return self.with_decoder(self.decoder.with_output("raw"))
+
+    async def _send_get_request(self, path: str, query_params: dict = None):
+        query_params = query_params or {}
+        key = ResponseCache.make_key(self.base_url, path, query_params)
+        ttl = self.cache.get_ttl(path) if self.cache is not None else None
+        if ttl:
+            found, data = self.cache.get(key)
+            if found:
+                return data
+
+        async def fetch():
+            return self.json_backend.loads(
+                await self._fetch(path, query_params))
+
+        if self.single_flight is not None:
+            data = await self.single_flight.do_async(key, fetch)
+        else:
+            data = await fetch()
+        if ttl:
+            self.cache.set(key, data, ttl)
+        return data
+
+    async def _stream_get_request(
+            self, path: str, query_params: dict = None) -> AsyncIterator[Any]:
+        query_params = query_params or {}
+        query_params["apiKey"] = self.api_key
+
+        response = await self._get(path, query_params, stream=True)
+        try:
+            decoder = JsonArrayDecoder()
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                for item in decoder.feed(chunk):
+                    yield item
+            for item in decoder.close():
+                yield item
+        finally:
+            await response.aclose()
+
+    async def _fetch(self, path: str, query_params: dict) -> bytes:
+        if self.http_cache is None:
+            query_params["apiKey"] = self.api_key
+            response = await self._get(path, query_params)
+            return response.content
+
+        key = SQLiteHttpCache.make_key(self.base_url, path, query_params)
+        cached = self.http_cache.get(key)
+        headers = cached.to_conditional_headers() if cached else {}
+        query_params["apiKey"] = self.api_key
+        response = await self._get(path, query_params, headers)
+        if cached is not None:
+            not_modified = response.status_code == 304
+            self.http_cache.record(not_modified)
+            if not_modified:
+                return cached.body
+        self.http_cache.store(key, path, response.headers, response.content)
+        return response.content
+
+    async def _get(
+            self,
+            path: str,
+            query_params: dict,
+            headers: Optional[dict] = None,
+            stream: bool = False) -> "httpx.Response":
+        connect_timeout, read_timeout = self.timeout
+
+        async def send() -> httpx.Response:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            request = self.client.build_request(
+                "GET",
+                self.base_url + path,
+                params=query_params,
+                headers=headers,
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout))
+            response = await self.client.send(request, stream=stream)
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(response.headers)
+            return response
+
+        response = await send_with_retry_async(
+            send,
+            self.retry_policy,
+            self.retry_stats,
+            (httpx.TransportError,))
+        # httpx raises for 304 too, which answers a conditional request
+        if response.is_error:
+            if stream:
+                await response.aclose()
+            response.raise_for_status()
+        return response
@@ -0,0 +1,97 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bulk request module."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any, Awaitable, Callable, Generic, Iterable, List, Optional, TypeVar)
+
+T = TypeVar("T")
+
+
+@dataclass
+class BulkResult(Generic[T]):
+    """Result of one item in a bulk request."""
+
+    key: Any
+    value: Optional[T] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request for this item succeeded.
+
+        :return: True if succeeded
+        """
+        return self.error is None
+
+
+def run_bulk(
+        func: Callable[[Any], T],
+        keys: Iterable[Any],
+        max_workers: int) -> List[BulkResult[T]]:
+    """Call the function for each key on a bounded thread pool.
+
+    :param func: function called with each key
+    :param keys: keys
+    :param max_workers: maximum number of concurrent calls
+    :raises ValueError: when max_workers is less than 1
+    :return: results in the same order as keys
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0.")
+    keys = list(keys)
+    if not keys:
+        return []
+
+    with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(keys))) as executor:
+        futures = [executor.submit(func, key) for key in keys]
+
+    results: List[BulkResult[T]] = []
+    for key, future in zip(keys, futures):
+        try:
+            results.append(BulkResult(key, value=future.result()))
+        except Exception as e:
+            results.append(BulkResult(key, error=e))
+    return results
+
+
+async def gather_bulk(
+        func: Callable[[Any], Awaitable[T]],
+        keys: Iterable[Any],
+        max_concurrency: int) -> List[BulkResult[T]]:
+    """Await the coroutine function for each key with bounded concurrency.
+
+    :param func: coroutine function called with each key
+    :param keys: keys
+    :param max_concurrency: maximum number of concurrent calls
+    :raises ValueError: when max_concurrency is less than 1
+    :return: results in the same order as keys
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be greater than 0.")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def call(key) -> BulkResult[T]:
+        async with semaphore:
+            try:
+                return BulkResult(key, value=await func(key))
+            except Exception as e:
+                return BulkResult(key, error=e)
+
+    return list(await asyncio.gather(*[call(key) for key in keys]))
@@ -0,0 +1,146 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Response cache module."""
+
+import threading
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+
+class ResponseCache(object):
+    """In-memory cache of responses with TTL and LRU eviction.
+
+    Only paths matching one of the TTL patterns are cached.
+    Patterns are shell-style wildcards matched against the path
+    after "/api/v2/", e.g. "projects/*/statuses".
+    """
+
+    DEFAULT_TTLS: Dict[str, float] = {
+        "space": 3600.0,
+        "priorities": 3600.0,
+        "resolutions": 3600.0,
+        "projects/*/statuses": 600.0,
+        "projects/*/issueTypes": 600.0,
+        "projects/*/categories": 600.0,
+        "projects/*/versions": 600.0,
+    }
+
+    def __init__(
+            self,
+            maxsize: int = 1024,
+            ttls: Optional[Mapping[str, float]] = None,
+            clock: Callable[[], float] = time.monotonic):
+        """__init__ method.
+
+        :param maxsize: maximum number of cached responses
+        :param ttls: TTL in seconds for each path pattern.
+            defaults to DEFAULT_TTLS
+        :param clock: function that returns current time in seconds
+        :raises ValueError: when initialization fails
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be greater than 0.")
+
+        self.maxsize = maxsize
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = \
+            OrderedDict()
+
+    def __len__(self) -> int:
+        """__len__ method."""
+        return len(self._entries)
+
+    def get_ttl(self, path: str) -> Optional[float]:
+        """Get TTL of the path.
+
+        :param path: path of the request
+        :return: TTL in seconds, or None if the path is not cached
+        """
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return None
+
+    @staticmethod
+    def make_key(base_url: str, path: str, query_params: dict) -> Hashable:
+        """Create cache key of the request.
+
+        :param base_url: base url of the space
+        :param path: path of the request
+        :param query_params: query parameters without api key
+        :return: cache key
+        """
+        params = tuple(sorted(
+            (name, str(value)) for name, value in query_params.items()))
+        return base_url, path, params
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Get cached response.
+
+        :param key: cache key
+        :return: whether the response was found and the response
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float):
+        """Cache response.
+
+        :param key: cache key
+        :param value: response
+        :param ttl: TTL in seconds
+        """
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, pattern: str = "*") -> int:
+        """Remove cached responses whose path matches the pattern.
+
+        :param pattern: shell-style wildcard of the path
+        :return: number of removed responses
+        """
+        with self._lock:
+            keys = [key for key in self._entries
+                    if fnmatchcase(key[1], pattern)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self):
+        """Remove all cached responses and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
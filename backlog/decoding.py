@@ -0,0 +1,317 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Model decoding module."""
+
+import copy
+import functools
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from typing import (Any, AsyncIterable, AsyncIterator, Callable, Dict,
+                    Iterable, Iterator, List, Optional, Tuple, Type, TypeVar)
+
+from .models import (LAZY_MODELS, RAISE, Base, BaseEnum, UserIdentityMap,
+                     enum_default_scope, user_identity_scope)
+from .models.base import (KIND_MODEL, KIND_MODELS, get_decoder,
+                          get_field_plan, get_json_keys)
+
+M = TypeVar("M", bound=Base)
+E = TypeVar("E", bound=BaseEnum)
+
+OUTPUTS = ("model", "raw", "columns")
+
+# name of attribute, key in JSON, nested model and whether it is a list
+_FieldPlan = Tuple[str, str, Optional[Type[Base]], bool]
+
+
+class ModelDecoder(object):
+    """Decoder building models from responses."""
+
+    def __init__(
+            self,
+            intern_users: bool = True,
+            user_identity_map: Optional[UserIdentityMap] = None,
+            lazy: bool = False,
+            compiled: bool = True,
+            output: str = "model",
+            enum_default: Any = None,
+            executor: Optional[Executor] = None,
+            parallel_threshold: int = 10000,
+            chunk_size: int = 2000):
+        """__init__ method.
+
+        :param intern_users: whether users nested in models having
+            the same id are resolved to one shared instance.
+            disable it if models are modified after being returned
+        :param user_identity_map: identity map shared by every response.
+            if omitted, users are shared only within one response
+        :param lazy: whether nested fields of models such as Wiki and
+            Comment are decoded on first access instead of at once
+        :param compiled: whether models are built by decoders compiled
+            from their fields instead of their from_dict methods
+        :param output: type of returned values.
+            "model" returns models,
+            "raw" returns dictionaries keyed by attribute names of models,
+            "columns" returns a dictionary of lists keyed by attribute names
+            for list results, and dictionaries like "raw" otherwise.
+            nested objects are returned like "raw" and datetimes are left
+            as strings in "raw" and "columns"
+        :param enum_default: value that unknown ids of enumerations such as
+            Priority are mapped to, both by to_enums and in models such as
+            Issue and Activity. pass RAISE to raise ValueError
+        :param executor: executor such as ProcessPoolExecutor that builds
+            models of large list responses in chunks.
+            users are shared only within each chunk.
+            if omitted, models are built in the calling thread
+        :param parallel_threshold: minimum number of items decoded
+            by the executor. smaller lists are decoded in the calling thread
+        :param chunk_size: number of items decoded by one task
+        :raises ValueError: when initialization fails
+        """
+        if output not in OUTPUTS:
+            raise ValueError(f"output must be one of {OUTPUTS}.")
+        if parallel_threshold < 1 or chunk_size < 1:
+            raise ValueError(
+                "parallel_threshold and chunk_size must be greater than 0.")
+
+        self.intern_users = intern_users
+        self.user_identity_map = user_identity_map
+        self.lazy = lazy
+        self.compiled = compiled
+        self.output = output
+        self.enum_default = enum_default
+        self.executor = executor
+        self.parallel_threshold = parallel_threshold
+        self.chunk_size = chunk_size
+
+    def with_output(self, output: str) -> "ModelDecoder":
+        """Create a decoder with the same settings but another output.
+
+        :param output: type of returned values
+        :raises ValueError: when the output is invalid
+        :return: new decoder
+        """
+        if output not in OUTPUTS:
+            raise ValueError(f"output must be one of {OUTPUTS}.")
+        decoder = copy.copy(self)
+        decoder.output = output
+        return decoder
+
+    def to_model(self, model: Type[M], data: dict) -> M:
+        """Build a model.
+
+        :param model: model class
+        :param data: decoded JSON object
+        :return: model
+        """
+        if self.output != "model":
+            return self.to_raw(model, data)
+        with self._scope():
+            return self._get_from_dict(model)(data)
+
+    def to_models(self, model: Type[M], items: Iterable[dict]) -> List[M]:
+        """Build models.
+
+        :param model: model class
+        :param items: decoded JSON objects
+        :return: list of models
+        """
+        if self.output == "raw":
+            return [self.to_raw(model, item) for item in items]
+        if self.output == "columns":
+            return self.to_columns(model, items)
+        if self.executor is not None and not self.lazy:
+            items = list(items)
+            if len(items) >= self.parallel_threshold:
+                return self._to_models_in_executor(model, items)
+        from_dict = self._get_from_dict(model)
+        with self._scope():
+            return [from_dict(item) for item in items]
+
+    def iter_models(
+            self,
+            model: Type[M],
+            items: Iterable[dict]) -> Iterator[M]:
+        """Build models one by one.
+
+        Dictionaries like "raw" are returned unless the output is "model".
+
+        :param model: model class
+        :param items: decoded JSON objects
+        :return: iterator of models
+        """
+        if self.output != "model":
+            for item in items:
+                yield self.to_raw(model, item)
+            return
+        from_dict = self._get_from_dict(model)
+        identity_map = self._identity_map()
+        for item in items:
+            with self._scope(identity_map):
+                result = from_dict(item)
+            yield result
+
+    async def aiter_models(
+            self,
+            model: Type[M],
+            items: AsyncIterable[dict]) -> AsyncIterator[M]:
+        """Build models one by one from asynchronous iterable.
+
+        Dictionaries like "raw" are returned unless the output is "model".
+
+        :param model: model class
+        :param items: decoded JSON objects
+        :return: asynchronous iterator of models
+        """
+        if self.output != "model":
+            async for item in items:
+                yield self.to_raw(model, item)
+            return
+        from_dict = self._get_from_dict(model)
+        identity_map = self._identity_map()
+        async for item in items:
+            with self._scope(identity_map):
+                result = from_dict(item)
+            yield result
+
+    def to_enums(self, enum: Type[E], items: Iterable[dict]) -> List[E]:
+        """Build members of enumeration from objects having id.
+
+        Objects whose id is unknown are mapped to enum_default,
+        and left out if it is None.
+
+        :param enum: enumeration class
+        :param items: decoded JSON objects
+        :raises ValueError: when an id is unknown and enum_default is RAISE
+        :return: list of members
+        """
+        value_of = enum.value_of
+        default = self.enum_default
+        members = [value_of(item["id"], default) for item in items]
+        return [member for member in members if member is not None]
+
+    def to_raw(self, model: Type[Base], data: dict) -> Dict[str, Any]:
+        """Rename keys of decoded JSON object to attribute names of model.
+
+        :param model: model class
+        :param data: decoded JSON object
+        :return: dictionary keyed by attribute names
+        """
+        raw = {}
+        for name, key, nested, is_list in _get_plan(model):
+            value = data.get(key)
+            if nested is not None and value is not None:
+                if is_list:
+                    value = [self.to_raw(nested, v) for v in value]
+                else:
+                    value = self.to_raw(nested, value)
+            raw[name] = value
+        return raw
+
+    def to_columns(
+            self,
+            model: Type[Base],
+            items: Iterable[dict]) -> Dict[str, List[Any]]:
+        """Build columns of decoded JSON objects in one pass.
+
+        The result can be passed to e.g. pyarrow.Table.from_pydict
+        or pandas.DataFrame.
+
+        :param model: model class
+        :param items: decoded JSON objects
+        :return: dictionary of lists keyed by attribute names
+        """
+        plan = _get_plan(model)
+        columns: Dict[str, List[Any]] = {name: [] for name, _, _, _ in plan}
+        appenders = [(columns[name].append, key, nested, is_list)
+                     for name, key, nested, is_list in plan]
+        to_raw = self.to_raw
+        for item in items:
+            for append, key, nested, is_list in appenders:
+                value = item.get(key)
+                if nested is not None and value is not None:
+                    if is_list:
+                        value = [to_raw(nested, v) for v in value]
+                    else:
+                        value = to_raw(nested, value)
+                append(value)
+        return columns
+
+    def _to_models_in_executor(
+            self,
+            model: Type[M],
+            items: List[dict]) -> List[M]:
+        chunks = [items[i:i + self.chunk_size]
+                  for i in range(0, len(items), self.chunk_size)]
+        results = self.executor.map(
+            _decode_chunk,
+            [model] * len(chunks),
+            chunks,
+            [self.intern_users] * len(chunks),
+            [self.compiled] * len(chunks),
+            # RAISE is compared by identity, so it is not pickled
+            [None if self.enum_default is RAISE else self.enum_default]
+            * len(chunks),
+            [self.enum_default is RAISE] * len(chunks))
+        return [item for result in results for item in result]
+
+    def _get_from_dict(self, model: Type[M]) -> Callable[[dict], M]:
+        if self.lazy and model in LAZY_MODELS:
+            return LAZY_MODELS[model].from_dict
+        if self.compiled:
+            return get_decoder(model)
+        return model.from_dict
+
+    def _identity_map(self) -> Optional[UserIdentityMap]:
+        if not self.intern_users:
+            return None
+        if self.user_identity_map is not None:
+            return self.user_identity_map
+        return UserIdentityMap()
+
+    @contextmanager
+    def _scope(self, identity_map: Optional[UserIdentityMap] = None):
+        with enum_default_scope(self.enum_default):
+            if not self.intern_users:
+                yield
+                return
+            if identity_map is None:
+                identity_map = self.user_identity_map
+            with user_identity_scope(identity_map):
+                yield
+
+
+def _decode_chunk(
+        model: Type[M],
+        items: List[dict],
+        intern_users: bool,
+        compiled: bool,
+        enum_default: Any,
+        raise_unknown_enum: bool) -> List[M]:
+    # runs in worker of executor, so it must be picklable
+    decoder = ModelDecoder(
+        intern_users=intern_users,
+        compiled=compiled,
+        enum_default=RAISE if raise_unknown_enum else enum_default)
+    return decoder.to_models(model, items)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_plan(model: Type[Base]) -> Tuple[_FieldPlan, ...]:
+    return tuple(
+        (name, key,
+         nested if kind in (KIND_MODEL, KIND_MODELS) else None,
+         kind == KIND_MODELS)
+        for (name, kind, nested), key in zip(
+            get_field_plan(model), get_json_keys(model)))
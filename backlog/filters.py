@@ -0,0 +1,120 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Query filter module."""
+
+from datetime import date
+from typing import Iterable, Optional, Union
+
+from .models import ActivityType
+from .pagination import MAX_COUNT, ORDERS, page_params
+
+DateType = Union[date, str]
+
+
+def format_date(value: DateType) -> str:
+    """Format date in "yyyy-MM-dd" format.
+
+    :param value: date, or string already formatted
+    :return: formatted string
+    """
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d")
+    return value
+
+
+def issue_params(
+        project_ids: Optional[Iterable[int]] = None,
+        status_ids: Optional[Iterable[int]] = None,
+        assignee_ids: Optional[Iterable[int]] = None,
+        keyword: Optional[str] = None,
+        updated_since: Optional[DateType] = None,
+        updated_until: Optional[DateType] = None,
+        sort: Optional[str] = None,
+        order: Optional[str] = None,
+        offset: Optional[int] = None,
+        count: Optional[int] = None) -> dict:
+    """Create query parameters of issue list request.
+
+    :param project_ids: project ids
+    :param status_ids: status ids
+    :param assignee_ids: assignee ids
+    :param keyword: keyword
+    :param updated_since: first date of update
+    :param updated_until: last date of update
+    :param sort: attribute name to sort by, e.g. 'created'
+    :param order: sort order ('asc' or 'desc')
+    :param offset: number of issues to skip
+    :param count: number of issues to get (1-100)
+    :raises ValueError: when parameters are invalid
+    :return: query parameters
+    """
+    if order is not None and order not in ORDERS:
+        raise ValueError("order must be one of 'asc', 'desc'.")
+    if offset is not None and offset < 0:
+        raise ValueError("offset must not be negative.")
+    if count is not None and not 1 <= count <= MAX_COUNT:
+        raise ValueError(f"count must be between 1 and {MAX_COUNT}.")
+
+    query_params: dict = {}
+    if project_ids is not None:
+        query_params["projectId[]"] = list(project_ids)
+    if status_ids is not None:
+        query_params["statusId[]"] = list(status_ids)
+    if assignee_ids is not None:
+        query_params["assigneeId[]"] = list(assignee_ids)
+    if keyword is not None:
+        query_params["keyword"] = keyword
+    if updated_since is not None:
+        query_params["updatedSince"] = format_date(updated_since)
+    if updated_until is not None:
+        query_params["updatedUntil"] = format_date(updated_until)
+    if sort is not None:
+        query_params["sort"] = sort
+    if order is not None:
+        query_params["order"] = order
+    if offset is not None:
+        query_params["offset"] = offset
+    if count is not None:
+        query_params["count"] = count
+    return query_params
+
+
+def activity_params(
+        activity_types: Optional[Iterable[Union[int, ActivityType]]] = None,
+        min_id: Optional[int] = None,
+        max_id: Optional[int] = None,
+        count: Optional[int] = None,
+        order: Optional[str] = None) -> dict:
+    """Create query parameters of activity list request.
+
+    :param activity_types: activity types or their ids
+    :param min_id: minimum activity id
+    :param max_id: maximum activity id
+    :param count: number of activities to get (1-100)
+    :param order: sort order by id ('asc' or 'desc')
+    :raises ValueError: when parameters are invalid
+    :return: query parameters
+    """
+    if order is not None and order not in ORDERS:
+        raise ValueError("order must be one of 'asc', 'desc'.")
+    if count is not None and not 1 <= count <= MAX_COUNT:
+        raise ValueError(f"count must be between 1 and {MAX_COUNT}.")
+
+    query_params = page_params(min_id, max_id, count, order)
+    if activity_types is not None:
+        query_params["activityTypeId[]"] = [
+            t.to_value() if isinstance(t, ActivityType) else t
+            for t in activity_types]
+    return query_params
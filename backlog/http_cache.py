@@ -0,0 +1,158 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""HTTP cache module."""
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlencode
+
+
+@dataclass
+class CachedResponse(object):
+    """Response body stored with its validators."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+
+    def to_conditional_headers(self) -> Dict[str, str]:
+        """Create headers for conditional request.
+
+        :return: request headers
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class SQLiteHttpCache(object):
+    """Persistent HTTP cache stored in SQLite.
+
+    Responses having ETag or Last-Modified header are stored,
+    and the next request for the same resource is sent as conditional
+    request, so an unchanged resource is answered by 304 Not Modified.
+    """
+
+    def __init__(self, path: str):
+        """__init__ method.
+
+        :param path: path of the database file, or ":memory:"
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "path TEXT NOT NULL, "
+                "etag TEXT, "
+                "last_modified TEXT, "
+                "body BLOB NOT NULL)")
+
+    def __enter__(self) -> "SQLiteHttpCache":
+        """__enter__ method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """__exit__ method."""
+        self.close()
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def make_key(base_url: str, path: str, query_params: dict) -> str:
+        """Create cache key of the request.
+
+        :param base_url: base url of the space
+        :param path: path of the request
+        :param query_params: query parameters without api key
+        :return: cache key
+        """
+        return base_url + path + "?" + urlencode(
+            sorted((name, str(value))
+                   for name, value in query_params.items()))
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get stored response.
+
+        :param key: cache key
+        :return: stored response, or None if not stored
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT etag, last_modified, body FROM responses "
+                "WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(etag=row[0], last_modified=row[1], body=row[2])
+
+    def store(
+            self,
+            key: str,
+            path: str,
+            headers: Mapping[str, str],
+            body: bytes) -> bool:
+        """Store response if it has validators.
+
+        :param key: cache key
+        :param path: path of the request
+        :param headers: response headers
+        :param body: response body
+        :return: True if stored
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return False
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, path, etag, last_modified, body) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, path, etag, last_modified, body))
+        return True
+
+    def record(self, not_modified: bool):
+        """Record whether a conditional request was answered by 304.
+
+        :param not_modified: True if answered by 304
+        """
+        with self._lock:
+            if not_modified:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def invalidate(self, pattern: str = "*") -> int:
+        """Remove stored responses whose path matches the pattern.
+
+        :param pattern: shell-style wildcard of the path
+        :return: number of removed responses
+        """
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM responses WHERE path GLOB ?", (pattern,))
+        return cursor.rowcount
@@ -0,0 +1,76 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""JSON backend module."""
+
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+
+class JsonBackend(object):
+    """Backend decoding JSON bodies of responses."""
+
+    def __init__(self, name: str, loads: Callable[[bytes], Any]):
+        """__init__ method.
+
+        :param name: name of the backend
+        :param loads: function decoding JSON from bytes
+        """
+        self.name = name
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        """__repr__ method."""
+        return f"JsonBackend(name={self.name!r})"
+
+
+BACKENDS: Dict[str, JsonBackend] = {"json": JsonBackend("json", json.loads)}
+if orjson is not None:
+    BACKENDS["orjson"] = JsonBackend("orjson", orjson.loads)
+if msgspec is not None:
+    BACKENDS["msgspec"] = JsonBackend("msgspec", msgspec.json.decode)
+
+# backends in order of preference when auto-detected
+PREFERENCE = ("orjson", "msgspec", "json")
+
+
+def get_json_backend(
+        backend: Optional[Union[str, JsonBackend]] = None) -> JsonBackend:
+    """Get JSON backend.
+
+    :param backend: name of installed backend ("json", "orjson" or
+        "msgspec") or backend itself.
+        if omitted, the fastest installed backend is chosen
+    :raises ValueError: when the backend is not installed
+    :return: JSON backend
+    """
+    if isinstance(backend, JsonBackend):
+        return backend
+    if backend is None:
+        return next(BACKENDS[name] for name in PREFERENCE if name in BACKENDS)
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"JSON backend is not installed. backend: {backend}, "
+            f"installed: {', '.join(sorted(BACKENDS))}")
+    return BACKENDS[backend]
@@ -0,0 +1,336 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local mirror module."""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from itertools import islice
+from typing import (Any, Dict, Iterable, List, Optional, Tuple, Type,
+                    TypeVar, Union)
+
+from .models import (Attachment, Comment, Project, SharedFile, Star, User,
+                     Wiki)
+from .models.base import (DATETIME_FORMAT, KIND_DATETIME, KIND_ENUM,
+                          KIND_MODEL, KIND_MODELS, Base, get_field_plan,
+                          get_json_keys)
+
+M = TypeVar("M", bound=Base)
+
+# indexed columns other than id
+_COLUMNS = ("parent_id", "project_id", "created", "updated", "created_user")
+ORDERS = ("id",) + _COLUMNS
+
+
+class SQLiteMirror(object):
+    """Local copy of models stored in SQLite.
+
+    Each model class has its own table indexed by id, project id,
+    created, updated and the user who created the model,
+    so lookups are answered locally instead of by Backlog.
+    Models are stored as JSON in the format of Backlog
+    and rebuilt by from_dict(), so rows stay readable
+    when fields of models are added or reordered.
+
+    Models which do not know their parent, e.g. comments do not know
+    their issue, can be stored with parent_id to be queried by it.
+    """
+
+    TABLES: Dict[type, str] = {
+        User: "users",
+        Project: "projects",
+        Wiki: "wikis",
+        Comment: "comments",
+        Star: "stars",
+        Attachment: "attachments",
+        SharedFile: "shared_files",
+    }
+
+    def __init__(self, path: str, batch_size: int = 500):
+        """__init__ method.
+
+        :param path: path of the database file, or ":memory:"
+        :param batch_size: number of models written per statement
+        :raises ValueError: when initialization fails
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than 0.")
+
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            for table in self.TABLES.values():
+                self._connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ("
+                    "id INTEGER PRIMARY KEY, "
+                    "parent_id INTEGER, "
+                    "project_id INTEGER, "
+                    "created TEXT, "
+                    "updated TEXT, "
+                    "created_user INTEGER, "
+                    "data TEXT NOT NULL)")
+                for column in _COLUMNS:
+                    self._connection.execute(
+                        f"CREATE INDEX IF NOT EXISTS {table}_{column} "
+                        f"ON {table} ({column})")
+
+    def __enter__(self) -> "SQLiteMirror":
+        """__enter__ method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """__exit__ method."""
+        self.close()
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def upsert(
+            self,
+            models: Iterable[Base],
+            parent_id: Optional[int] = None) -> int:
+        """Insert models, replacing those with the same id.
+
+        Models are written in batches, each in one transaction,
+        so any iterable of models, e.g. SyncEngine.sync_wikis(),
+        is stored without being held in memory.
+
+        :param models: models of the classes in TABLES
+        :param parent_id: id of the parent of the models,
+            e.g. issue id of comments. if omitted, the parent id
+            already stored is kept
+        :raises ValueError: when a model is not of the classes in TABLES
+        :return: number of stored models
+        """
+        total = 0
+        iterator = iter(models)
+        while True:
+            batch = list(islice(iterator, self.batch_size))
+            if not batch:
+                return total
+            rows: Dict[str, List[Tuple]] = {}
+            for model in batch:
+                table = self._get_table(type(model))
+                rows.setdefault(table, []).append(
+                    _to_row(model, parent_id))
+            with self._lock, self._connection:
+                for table, table_rows in rows.items():
+                    self._connection.executemany(
+                        f"INSERT INTO {table} "
+                        "(id, parent_id, project_id, created, updated, "
+                        "created_user, data) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT (id) DO UPDATE SET "
+                        "parent_id = COALESCE(excluded.parent_id, parent_id), "
+                        "project_id = excluded.project_id, "
+                        "created = excluded.created, "
+                        "updated = excluded.updated, "
+                        "created_user = excluded.created_user, "
+                        "data = excluded.data",
+                        table_rows)
+            total += len(batch)
+
+    def get(self, model: Type[M], model_id: int) -> Optional[M]:
+        """Get stored model by id.
+
+        :param model: model class
+        :param model_id: id of the model
+        :raises ValueError: when the class is not in TABLES
+        :return: stored model, or None if not stored
+        """
+        table, cls = self._get_table(model), self._get_model(model)
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT data FROM {table} WHERE id = ?",
+                (model_id,)).fetchone()
+        return cls.from_dict(json.loads(row[0])) if row is not None else None
+
+    def query(
+            self,
+            model: Type[M],
+            parent_id: Optional[int] = None,
+            project_id: Optional[int] = None,
+            created_user: Optional[int] = None,
+            created_since: Optional[datetime] = None,
+            created_until: Optional[datetime] = None,
+            updated_since: Optional[datetime] = None,
+            updated_until: Optional[datetime] = None,
+            order_by: str = "id",
+            order: str = "asc",
+            limit: Optional[int] = None,
+            offset: int = 0) -> List[M]:
+        """Query stored models.
+
+        Datetimes are in UTC, and ranges include both ends.
+
+        :param model: model class
+        :param parent_id: id of the parent given when stored
+        :param project_id: project id
+        :param created_user: id of the user who created the models
+        :param created_since: first datetime of creation
+        :param created_until: last datetime of creation
+        :param updated_since: first datetime of update
+        :param updated_until: last datetime of update
+        :param order_by: column to sort by, one of ORDERS
+        :param order: sort order ('asc' or 'desc')
+        :param limit: maximum number of models
+        :param offset: number of models to skip
+        :raises ValueError: when parameters are invalid
+        :return: list of models
+        """
+        if order_by not in ORDERS:
+            raise ValueError(f"order_by must be one of {ORDERS}.")
+        if order not in ("asc", "desc"):
+            raise ValueError("order must be one of 'asc', 'desc'.")
+        if (limit is not None and limit < 0) or offset < 0:
+            raise ValueError("limit and offset must not be negative.")
+
+        where, params = _where(
+            parent_id, project_id, created_user,
+            created_since, created_until, updated_since, updated_until)
+        sql = (f"SELECT data FROM {self._get_table(model)}{where} "
+               f"ORDER BY {order_by} {order.upper()}, id {order.upper()} "
+               "LIMIT ? OFFSET ?")
+        params.extend((-1 if limit is None else limit, offset))
+        cls = self._get_model(model)
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        return [cls.from_dict(json.loads(row[0])) for row in rows]
+
+    def count(
+            self,
+            model: type,
+            parent_id: Optional[int] = None,
+            project_id: Optional[int] = None,
+            created_user: Optional[int] = None,
+            created_since: Optional[datetime] = None,
+            created_until: Optional[datetime] = None,
+            updated_since: Optional[datetime] = None,
+            updated_until: Optional[datetime] = None) -> int:
+        """Count stored models.
+
+        :param model: model class
+        :param parent_id: id of the parent given when stored
+        :param project_id: project id
+        :param created_user: id of the user who created the models
+        :param created_since: first datetime of creation
+        :param created_until: last datetime of creation
+        :param updated_since: first datetime of update
+        :param updated_until: last datetime of update
+        :raises ValueError: when the class is not in TABLES
+        :return: number of models
+        """
+        where, params = _where(
+            parent_id, project_id, created_user,
+            created_since, created_until, updated_since, updated_until)
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT COUNT(*) FROM {self._get_table(model)}{where}",
+                params).fetchone()
+        return row[0]
+
+    def delete(self, model: type, model_ids: Iterable[int]) -> int:
+        """Delete stored models by id.
+
+        :param model: model class
+        :param model_ids: ids of the models
+        :raises ValueError: when the class is not in TABLES
+        :return: number of deleted models
+        """
+        table = self._get_table(model)
+        with self._lock, self._connection:
+            cursor = self._connection.executemany(
+                f"DELETE FROM {table} WHERE id = ?",
+                ((model_id,) for model_id in model_ids))
+        return cursor.rowcount
+
+    def _get_table(self, model: type) -> str:
+        return self.TABLES[self._get_model(model)]
+
+    def _get_model(self, model: type) -> Any:
+        # subclasses such as lazy models share the table of their model
+        for cls in model.__mro__:
+            if cls in self.TABLES:
+                return cls
+        raise ValueError(f"{model.__name__} is not stored in the mirror.")
+
+
+def _to_row(model: Base, parent_id: Optional[int]) -> Tuple:
+    created_user = getattr(model, "created_user", None) or \
+        getattr(model, "presenter", None)
+    return (
+        model.id,
+        parent_id,
+        getattr(model, "project_id", None),
+        _format(getattr(model, "created", None)),
+        _format(getattr(model, "updated", None)),
+        created_user.id if created_user is not None else None,
+        json.dumps(_to_backlog_dict(model), ensure_ascii=False),
+    )
+
+
+def _to_backlog_dict(model: Base) -> Dict[str, Any]:
+    # inverse of from_dict, keyed by the names used by Backlog
+    data: Dict[str, Any] = {}
+    for key, (name, kind, _) in zip(
+            get_json_keys(type(model)), get_field_plan(type(model))):
+        value = getattr(model, name)
+        if value is None:
+            pass
+        elif kind == KIND_DATETIME:
+            value = _format(value)
+        elif kind == KIND_ENUM:
+            value = {"id": value.to_value(), "name": str(value)}
+        elif kind == KIND_MODEL:
+            value = _to_backlog_dict(value)
+        elif kind == KIND_MODELS:
+            value = [_to_backlog_dict(item) for item in value]
+        data[key] = value
+    return data
+
+
+def _format(value: Optional[datetime]) -> Optional[str]:
+    # the format sorts in the order of time
+    return value.strftime(DATETIME_FORMAT) if value is not None else None
+
+
+def _where(
+        parent_id: Optional[int],
+        project_id: Optional[int],
+        created_user: Optional[int],
+        created_since: Optional[datetime],
+        created_until: Optional[datetime],
+        updated_since: Optional[datetime],
+        updated_until: Optional[datetime]) -> Tuple[str, List[Any]]:
+    conditions: List[Tuple[str, Union[int, str]]] = []
+    for column, value in (("parent_id", parent_id),
+                          ("project_id", project_id),
+                          ("created_user", created_user)):
+        if value is not None:
+            conditions.append((f"{column} = ?", value))
+    for column, operator, value in (("created", ">=", created_since),
+                                    ("created", "<=", created_until),
+                                    ("updated", ">=", updated_since),
+                                    ("updated", "<=", updated_until)):
+        if value is not None:
+            conditions.append((f"{column} {operator} ?", _format(value)))
+    if not conditions:
+        return "", []
+    return (" WHERE " + " AND ".join(sql for sql, _ in conditions),
+            [value for _, value in conditions])
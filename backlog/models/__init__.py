@@ -16,10 +16,17 @@
 
 from .base import (  # noqa
     Base,
+    dumps_many,
+    parse_datetime,
 )
 from .const import (  # noqa
+    RAISE,
+    ActivityType,
+    BaseEnum,
     Priority,
     Resolution,
+    current_enum_default,
+    enum_default_scope,
 )
 from .file import (  # noqa
     Attachment,
@@ -28,6 +35,9 @@ from .file import (  # noqa
 from .user import (  # noqa
     NulabAccount,
     User,
+    UserIdentityMap,
+    current_identity_map,
+    user_identity_scope,
 )
 from .project import (  # noqa
     Project,
@@ -45,7 +55,17 @@ from .issue import (  # noqa
     Version,
     ChangeLog,
     Comment,
+    Issue,
+    LazyComment,
+)
+from .activity import (  # noqa
+    Activity,
 )
 from .wiki import (  # noqa
+    LazyWiki,
     Wiki,
 )
+from .lazy import (  # noqa
+    LAZY_MODELS,
+    LazyModel,
+)
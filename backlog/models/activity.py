@@ -0,0 +1,72 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Activity module."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .base import Base, parse_datetime
+from .const import ActivityType, current_enum_default
+from .project import Project
+from .user import User
+
+
+def _to_activity_type(value: int) -> Optional[ActivityType]:
+    return ActivityType.value_of(value, current_enum_default())
+
+
+@dataclass
+class Activity(Base):
+    """Activity class."""
+
+    __slots__ = (
+        "id",
+        "project",
+        "type",
+        "content",
+        "notifications",
+        "created_user",
+        "created",
+    )
+
+    # types added to Backlog later are decoded to None
+    _FIELD_DECODERS = {
+        "type": _to_activity_type,
+    }
+
+    id: int
+    project: Optional[Project]
+    type: Optional[ActivityType]
+    # keys of the content differ by type
+    content: Dict[str, Any]
+    notifications: Optional[List[Dict[str, Any]]]
+    created_user: User
+    created: datetime
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        project = Project.from_dict(
+            data["project"]) if data.get("project") else None
+
+        return cls(
+            id=data["id"],
+            project=project,
+            type=_to_activity_type(data["type"]),
+            content=data["content"],
+            notifications=data.get("notifications"),
+            created_user=User.from_dict(data["createdUser"]),
+            created=parse_datetime(data["created"]),
+        )
@@ -15,24 +15,110 @@
 """Base model module."""
 
 import json
-from abc import ABCMeta, abstractmethod
-from datetime import datetime
-from typing import Any, Dict
+from abc import ABCMeta
+from dataclasses import fields
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import (Any, Callable, ClassVar, Dict, Iterable, Optional,
+                    TextIO, Tuple, Union, get_type_hints)
+
+from .const import BaseEnum
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# kinds of fields, decided from type hints
+KIND_VALUE = 0
+KIND_DATETIME = 1
+KIND_MODEL = 2
+KIND_MODELS = 3
+KIND_ANY = 4
+KIND_ENUM = 5
+
+# name of field, kind of field and nested model
+FieldPlan = Tuple[str, int, Optional[type]]
+
+
+@lru_cache(maxsize=8192)
+def _parse_naive_datetime(value: str) -> datetime:
+    # Backlog always returns "YYYY-MM-DDTHH:MM:SSZ", which fromisoformat
+    # parses much faster than strptime once the trailing "Z" is removed.
+    if len(value) == 20 and value[10] == "T" and value[19] == "Z":
+        try:
+            return datetime.fromisoformat(value[:19])
+        except ValueError:
+            pass
+    return datetime.strptime(value, DATETIME_FORMAT)
+
+
+@lru_cache(maxsize=8192)
+def _parse_aware_datetime(value: str) -> datetime:
+    return _parse_naive_datetime(value).replace(tzinfo=timezone.utc)
+
+
+def parse_datetime(value: str, aware: bool = False) -> datetime:
+    """Parse datetime string returned by Backlog.
+
+    Parsed values are cached, since the same timestamps repeat
+    many times in a response.
+
+    :param value: datetime string in "%Y-%m-%dT%H:%M:%SZ" format
+    :param aware: whether to return timezone-aware datetime in UTC
+    :raises ValueError: when the string is not in the format
+    :return: datetime in UTC
+    """
+    if aware:
+        return _parse_aware_datetime(value)
+    return _parse_naive_datetime(value)
 
 
 class Base(metaclass=ABCMeta):
 
-    _DATETIME_FORMAT: str = "%Y-%m-%dT%H:%M:%SZ"
+    __slots__ = ()
+
+    _DATETIME_FORMAT: str = DATETIME_FORMAT
+
+    # keys in JSON of fields whose names are not their keys in snake_case
+    _JSON_KEYS: ClassVar[Dict[str, str]] = {}
+
+    # functions converting values of fields in compiled decoder
+    _FIELD_DECODERS: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
 
     @classmethod
-    @abstractmethod
     def from_dict(cls, data: dict) -> "Base":
         """Create instance from dictionary type variable.
 
+        Unless overridden, the decoder compiled from the fields is used.
+
         :param data: dictionary type variable
         :return: this class instance
         """
-        raise NotImplementedError
+        return get_decoder(cls)(data)
+
+    @classmethod
+    def _get_decoder(cls) -> Callable[[dict], "Base"]:
+        """Get function building this class instance from dictionary.
+
+        Override it to customize how nested instances are created,
+        e.g. to share them.
+
+        :return: decoder
+        """
+        return compile_decoder(cls)
+
+    def __reduce__(self):
+        """__reduce__ method.
+
+        A model is pickled as the values of its fields in order,
+        which is smaller and faster to load than the state of its slots.
+        """
+        cls = type(self)
+        return cls, tuple(
+            getattr(self, name) for name, _, _ in get_field_plan(cls))
 
     def to_json_string(self) -> str:
         """Convert this object to JSON string.
@@ -40,7 +126,7 @@ class Base(metaclass=ABCMeta):
         :return: JSON string
         """
         return json.dumps(
-            self.to_dict(),
+            self._to_json_dict(),
             ensure_ascii=False,
             default=self._convert_value)
 
@@ -50,18 +136,44 @@ class Base(metaclass=ABCMeta):
         :return: dictionary type variable
         """
         data: Dict[str, Any] = {}
-        for key, value in self.__dict__.items():
-            if isinstance(value, (list, tuple, set)):
-                data[key] = []
-                for item in value:
-                    if hasattr(item, "to_dict"):
-                        data[key].append(item.to_dict())
-                    else:
-                        data[key].append(item)
-            elif hasattr(value, "to_dict"):
-                data[key] = value.to_dict()
-            elif value is not None:
-                data[key] = value
+        for name, kind, _ in get_field_plan(type(self)):
+            value = getattr(self, name)
+            if value is None:
+                continue
+            if kind == KIND_MODEL:
+                value = value.to_dict()
+            elif kind == KIND_MODELS:
+                value = [item.to_dict() for item in value]
+            elif kind == KIND_ANY:
+                value = _to_plain(value)
+            data[name] = value
+
+        return data
+
+    def _to_json_dict(self) -> Dict[str, Any]:
+        """Convert this object to dictionary that json.dumps() can process.
+
+        Unlike to_dict(), datetimes are formatted to strings.
+
+        :return: dictionary type variable
+        """
+        datetime_format = self._DATETIME_FORMAT
+        data: Dict[str, Any] = {}
+        for name, kind, _ in get_field_plan(type(self)):
+            value = getattr(self, name)
+            if value is None:
+                continue
+            if kind == KIND_DATETIME:
+                value = _format_datetime(value, datetime_format)
+            elif kind == KIND_ENUM:
+                value = value.to_value()
+            elif kind == KIND_MODEL:
+                value = value._to_json_dict()
+            elif kind == KIND_MODELS:
+                value = [item._to_json_dict() for item in value]
+            elif kind == KIND_ANY:
+                value = _to_plain(value)
+            data[name] = value
 
         return data
 
@@ -74,4 +186,185 @@ class Base(metaclass=ABCMeta):
         """
         if isinstance(value, datetime):
             return value.strftime(self._DATETIME_FORMAT)
+        if isinstance(value, BaseEnum):
+            return value.to_value()
         raise TypeError(f"data cannot be converted. value: {repr(value)}")
+
+
+@lru_cache(maxsize=None)
+def get_decoder(cls: type) -> Callable[[dict], Any]:
+    """Get function building model from dictionary type variable.
+
+    :param cls: model class
+    :return: decoder
+    """
+    return cls._get_decoder()
+
+
+@lru_cache(maxsize=None)
+def compile_decoder(cls: type) -> Callable[[dict], Any]:
+    """Compile function building model from dictionary type variable.
+
+    The function is generated from the fields of the dataclass,
+    looking up the camelCase key of every field. The key and the
+    conversion of a field can be given in _JSON_KEYS and _FIELD_DECODERS
+    of the class. Optional fields may be missing, datetimes are parsed
+    and nested models are built by their own decoders.
+
+    :param cls: model class
+    :return: decoder
+    """
+    hints = get_type_hints(cls)
+    namespace: Dict[str, Any] = {
+        "cls": cls,
+        "parse_datetime": parse_datetime,
+    }
+    args = []
+    for key, (name, kind, model) in zip(
+            get_json_keys(cls), get_field_plan(cls)):
+        optional = _is_optional(hints.get(name, Any))
+        value = f"data.get({key!r})" if optional else f"data[{key!r}]"
+        # empty strings and objects of optional values are treated as None
+        condition = value
+        decode = cls._FIELD_DECODERS.get(name)
+        if decode is not None:
+            namespace[f"decode_{name}"] = decode
+            expr = f"decode_{name}({value})"
+            condition = f"{value} is not None"
+        elif kind == KIND_DATETIME:
+            expr = f"parse_datetime({value})"
+        elif kind == KIND_MODEL:
+            namespace[f"decode_{name}"] = get_decoder(model)
+            expr = f"decode_{name}({value})"
+        elif kind == KIND_MODELS:
+            namespace[f"decode_{name}"] = get_decoder(model)
+            expr = f"[decode_{name}(item) for item in {value}]"
+            condition = f"{value} is not None"
+        else:
+            args.append(value)
+            continue
+        args.append(f"{expr} if {condition} else None" if optional else expr)
+
+    source = "def decode(data):\n    return cls(\n{}\n    )\n".format(
+        ",\n".join(f"        {arg}" for arg in args))
+    exec(source, namespace)
+    decode = namespace["decode"]
+    decode.__qualname__ = f"compile_decoder.<{cls.__qualname__}>"
+    return decode
+
+
+@lru_cache(maxsize=None)
+def get_json_keys(cls: type) -> Tuple[str, ...]:
+    """Get keys in JSON of the fields of model.
+
+    :param cls: model class
+    :return: key in _JSON_KEYS of every field, or its name in camelCase
+    """
+    return tuple(
+        cls._JSON_KEYS.get(field.name) or _to_camel_case(field.name)
+        for field in fields(cls))
+
+
+@lru_cache(maxsize=None)
+def get_field_plan(cls: type) -> Tuple[FieldPlan, ...]:
+    """Get fields of model with their kinds decided from type hints.
+
+    :param cls: model class
+    :return: name, kind and nested model of every field
+    """
+    hints = get_type_hints(cls)
+    plan = []
+    for field in fields(cls):
+        kind, model = _get_kind(hints.get(field.name, Any))
+        plan.append((field.name, kind, model))
+    return tuple(plan)
+
+
+def _is_optional(hint: Any) -> bool:
+    return (getattr(hint, "__origin__", None) is Union
+            and type(None) in hint.__args__) or hint is Any
+
+
+def _to_camel_case(name: str) -> str:
+    head, *tail = name.split("_")
+    return head + "".join(word.capitalize() for word in tail)
+
+
+def _get_kind(hint: Any) -> Tuple[int, Optional[type]]:
+    if getattr(hint, "__origin__", None) is Union:
+        args = [arg for arg in hint.__args__ if arg is not type(None)]
+        hint = args[0] if len(args) == 1 else Any
+    if getattr(hint, "__origin__", None) is list:
+        item = hint.__args__[0]
+        if isinstance(item, type) and issubclass(item, Base):
+            return KIND_MODELS, item
+        if isinstance(item, type) and issubclass(item, (int, str, float)):
+            return KIND_VALUE, None
+        return KIND_ANY, None
+    if isinstance(hint, type):
+        if issubclass(hint, Base):
+            return KIND_MODEL, hint
+        if issubclass(hint, datetime):
+            return KIND_DATETIME, None
+        if issubclass(hint, BaseEnum):
+            return KIND_ENUM, None
+        if issubclass(hint, (int, str, float)):
+            return KIND_VALUE, None
+    return KIND_ANY, None
+
+
+def _to_plain(value: Any) -> Any:
+    # conversion of value whose type is unknown
+    if isinstance(value, (list, tuple, set)):
+        return [item.to_dict() if hasattr(item, "to_dict") else item
+                for item in value]
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    return value
+
+
+def _format_datetime(value: datetime, datetime_format: str) -> str:
+    # isoformat() is much faster than strftime() for the default format
+    if (datetime_format == DATETIME_FORMAT and value.tzinfo is None
+            and not value.microsecond):
+        return value.isoformat() + "Z"
+    return value.strftime(datetime_format)
+
+
+def _dumps_json(data: Dict[str, Any], default: Callable[[Any], Any]) -> str:
+    return json.dumps(
+        data, ensure_ascii=False, separators=(",", ":"), default=default)
+
+
+def _dumps_orjson(data: Dict[str, Any], default: Callable[[Any], Any]) -> str:
+    return orjson.dumps(
+        data, default=default,
+        option=orjson.OPT_PASSTHROUGH_DATETIME).decode("utf-8")
+
+
+def dumps_many(
+        models: Iterable[Base],
+        fp: TextIO,
+        dumps: Optional[Callable[[Dict[str, Any], Callable[[Any], Any]],
+                                 str]] = None) -> int:
+    """Write models to file object as JSON Lines.
+
+    Every model is written as compact JSON object on its own line,
+    with datetimes formatted as in to_json_string().
+
+    :param models: models to write
+    :param fp: text file object
+    :param dumps: function converting dictionary to JSON string,
+        receiving the dictionary and the default hook.
+        defaults to orjson if it is installed, otherwise json
+    :return: number of written models
+    """
+    if dumps is None:
+        dumps = _dumps_json if orjson is None else _dumps_orjson
+    write = fp.write
+    count = 0
+    for model in models:
+        write(dumps(model._to_json_dict(), model._convert_value))
+        write("\n")
+        count += 1
+    return count
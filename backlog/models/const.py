@@ -14,10 +14,54 @@
 
 """Enumeration module."""
 
-from enum import Enum
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum, EnumMeta
+from typing import Any, Iterator
 
+RAISE: Any = object()
 
-class BaseEnum(Enum):
+_current_enum_default: "ContextVar[Any]" = \
+    ContextVar("backlog_enum_default", default=None)
+
+
+def current_enum_default() -> Any:
+    """Get value that unknown ids of enumerations are mapped to.
+
+    :return: value of the current scope, or None if out of any scope
+    """
+    return _current_enum_default.get()
+
+
+@contextmanager
+def enum_default_scope(default: Any = None) -> Iterator[Any]:
+    """Map unknown ids of enumerations in models to default within the scope.
+
+    :param default: value unknown ids are mapped to.
+        pass RAISE to raise ValueError
+    :return: default
+    """
+    token = _current_enum_default.set(default)
+    try:
+        yield default
+    finally:
+        _current_enum_default.reset(token)
+
+
+class _BaseEnumMeta(EnumMeta):
+    """Metaclass indexing members by value and name at class creation."""
+
+    def __new__(metacls, cls, bases, classdict, **kwargs):
+        """__new__ method."""
+        enum_class = super().__new__(metacls, cls, bases, classdict, **kwargs)
+        enum_class._members_by_value = {
+            member.value[0]: member for member in enum_class}
+        enum_class._members_by_name = {
+            member.value[1]: member for member in enum_class}
+        return enum_class
+
+
+class BaseEnum(Enum, metaclass=_BaseEnumMeta):
     """Base class for enumeration."""
 
     def __str__(self):
@@ -32,17 +76,38 @@ class BaseEnum(Enum):
         return self.value[0]
 
     @classmethod
-    def value_of(cls, value: int):
+    def value_of(cls, value: int, default: Any = RAISE):
         """Create instance matching the specified integer value.
 
         :param value: integer type variable
+        :param default: value returned when no instance matches.
+            if omitted, ValueError is raised
+        :raises ValueError: when cannot create instance
+        :return: this class instance
+        """
+        member = cls._members_by_value.get(value)
+        if member is None:
+            if default is RAISE:
+                raise ValueError(f"Invalid value. value: {value}")
+            return default
+        return member
+
+    @classmethod
+    def name_of(cls, name: str, default: Any = RAISE):
+        """Create instance matching the specified name.
+
+        :param name: name such as "High"
+        :param default: value returned when no instance matches.
+            if omitted, ValueError is raised
         :raises ValueError: when cannot create instance
         :return: this class instance
         """
-        for priority in cls:
-            if priority.value[0] == value:
-                return priority
-        raise ValueError(f"Invalid value. value: {value}")
+        member = cls._members_by_name.get(name)
+        if member is None:
+            if default is RAISE:
+                raise ValueError(f"Invalid name. name: {name}")
+            return default
+        return member
 
 
 class Priority(BaseEnum):
@@ -61,3 +126,34 @@ class Resolution(BaseEnum):
     INVALID = (2, "Invalid")
     DUPLICATION = (3, "Duplication")
     CANNOT_REPRODUCE = (4, "Cannot Reproduce")
+
+
+class ActivityType(BaseEnum):
+    """Activity type class."""
+
+    ISSUE_CREATED = (1, "Issue Created")
+    ISSUE_UPDATED = (2, "Issue Updated")
+    ISSUE_COMMENTED = (3, "Issue Commented")
+    ISSUE_DELETED = (4, "Issue Deleted")
+    WIKI_CREATED = (5, "Wiki Created")
+    WIKI_UPDATED = (6, "Wiki Updated")
+    WIKI_DELETED = (7, "Wiki Deleted")
+    FILE_ADDED = (8, "File Added")
+    FILE_UPDATED = (9, "File Updated")
+    FILE_DELETED = (10, "File Deleted")
+    SVN_COMMITTED = (11, "SVN Committed")
+    GIT_PUSHED = (12, "Git Pushed")
+    GIT_REPOSITORY_CREATED = (13, "Git Repository Created")
+    ISSUE_MULTI_UPDATED = (14, "Issue Multi Updated")
+    PROJECT_USER_ADDED = (15, "Project User Added")
+    PROJECT_USER_REMOVED = (16, "Project User Removed")
+    NOTIFY_ADDED = (17, "Notify Added")
+    PULL_REQUEST_ADDED = (18, "Pull Request Added")
+    PULL_REQUEST_UPDATED = (19, "Pull Request Updated")
+    PULL_REQUEST_COMMENTED = (20, "Pull Request Commented")
+    PULL_REQUEST_DELETED = (21, "Pull Request Deleted")
+    MILESTONE_CREATED = (22, "Milestone Created")
+    MILESTONE_UPDATED = (23, "Milestone Updated")
+    MILESTONE_DELETED = (24, "Milestone Deleted")
+    PROJECT_GROUP_ADDED = (25, "Project Group Added")
+    PROJECT_GROUP_DELETED = (26, "Project Group Deleted")
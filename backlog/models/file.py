@@ -17,7 +17,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 
-from .base import Base
+from .base import Base, parse_datetime
 from .user import User
 
 
@@ -25,6 +25,14 @@ from .user import User
 class Attachment(Base):
     """Attachment file class."""
 
+    __slots__ = (
+        "id",
+        "name",
+        "size",
+        "created_user",
+        "created",
+    )
+
     id: int
     name: str
     size: int
@@ -38,7 +46,7 @@ class Attachment(Base):
             name=data["name"],
             size=data["size"],
             created_user=User.from_dict(data["createdUser"]),
-            created=datetime.strptime(data["created"], cls._DATETIME_FORMAT),
+            created=parse_datetime(data["created"]),
         )
 
 
@@ -46,6 +54,18 @@ class Attachment(Base):
 class SharedFile(Base):
     """Shared file class."""
 
+    __slots__ = (
+        "id",
+        "type",
+        "dir",
+        "name",
+        "size",
+        "created_user",
+        "created",
+        "updated_user",
+        "updated",
+    )
+
     id: int
     type: str
     dir: str
@@ -65,7 +85,7 @@ class SharedFile(Base):
             name=data["name"],
             size=data["size"],
             created_user=User.from_dict(data["createdUser"]),
-            created=datetime.strptime(data["created"], cls._DATETIME_FORMAT),
+            created=parse_datetime(data["created"]),
             updated_user=User.from_dict(data["updatedUser"]),
-            updated=datetime.strptime(data["updated"], cls._DATETIME_FORMAT),
+            updated=parse_datetime(data["updated"]),
         )
@@ -16,9 +16,12 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
-from .base import Base
+from .base import Base, parse_datetime
+from .const import Priority, Resolution, current_enum_default
+from .file import Attachment, SharedFile
+from .lazy import LazyModel
 from .star import Star
 from .user import User
 
@@ -27,6 +30,14 @@ from .user import User
 class Status(Base):
     """Status class."""
 
+    __slots__ = (
+        "id",
+        "project_id",
+        "name",
+        "color",
+        "display_order",
+    )
+
     id: int
     project_id: int
     name: str
@@ -48,6 +59,16 @@ class Status(Base):
 class IssueType(Base):
     """Issue Type class."""
 
+    __slots__ = (
+        "id",
+        "project_id",
+        "name",
+        "color",
+        "display_order",
+        "template_summary",
+        "template_description",
+    )
+
     id: int
     project_id: int
     name: str
@@ -73,6 +94,12 @@ class IssueType(Base):
 class Category(Base):
     """Category class."""
 
+    __slots__ = (
+        "id",
+        "name",
+        "display_order",
+    )
+
     id: int
     name: str
     display_order: int
@@ -90,6 +117,17 @@ class Category(Base):
 class Version(Base):
     """Versions(Milestones) class."""
 
+    __slots__ = (
+        "id",
+        "project_id",
+        "name",
+        "description",
+        "start_date",
+        "release_due_date",
+        "archived",
+        "display_order",
+    )
+
     id: int
     project_id: int
     name: str
@@ -101,12 +139,10 @@ class Version(Base):
 
     @classmethod
     def from_dict(cls, data: dict):
-        start_date = datetime.strptime(
-            data["startDate"],
-            cls._DATETIME_FORMAT) if data["startDate"] else None
-        release_due_date = datetime.strptime(
-            data["releaseDueDate"],
-            cls._DATETIME_FORMAT) if data["releaseDueDate"] else None
+        start_date = parse_datetime(
+            data["startDate"]) if data["startDate"] else None
+        release_due_date = parse_datetime(
+            data["releaseDueDate"]) if data["releaseDueDate"] else None
 
         return cls(
             id=data["id"],
@@ -124,6 +160,15 @@ class Version(Base):
 class ChangeLog(Base):
     """Change log class."""
 
+    __slots__ = (
+        "field",
+        "new_value",
+        "original_value",
+        "attachment_info",
+        "attribute_info",
+        "notification_info",
+    )
+
     # TODO: type fix
     field: str
     new_value: Any
@@ -148,6 +193,17 @@ class ChangeLog(Base):
 class Comment(Base):
     """Comment class."""
 
+    __slots__ = (
+        "id",
+        "content",
+        "change_log",
+        "created_user",
+        "created",
+        "updated",
+        "stars",
+        "notifications",
+    )
+
     id: int
     content: Optional[str]
     change_log: List[ChangeLog]
@@ -164,8 +220,159 @@ class Comment(Base):
             content=data["content"],
             change_log=[ChangeLog.from_dict(cl) for cl in data["changeLog"]],
             created_user=User.from_dict(data["createdUser"]),
-            created=datetime.strptime(data["created"], cls._DATETIME_FORMAT),
-            updated=datetime.strptime(data["updated"], cls._DATETIME_FORMAT),
+            created=parse_datetime(data["created"]),
+            updated=parse_datetime(data["updated"]),
             stars=[Star.from_dict(s) for s in data["stars"]],
             notifications=data["notifications"],
         )
+
+
+def _to_priority(data: dict) -> Optional[Priority]:
+    return Priority.value_of(data["id"], current_enum_default())
+
+
+def _to_resolution(data: dict) -> Optional[Resolution]:
+    return Resolution.value_of(data["id"], current_enum_default())
+
+
+@dataclass
+class Issue(Base):
+    """Issue class."""
+
+    __slots__ = (
+        "id",
+        "project_id",
+        "issue_key",
+        "key_id",
+        "issue_type",
+        "summary",
+        "description",
+        "resolution",
+        "priority",
+        "status",
+        "assignee",
+        "category",
+        "versions",
+        "milestone",
+        "start_date",
+        "due_date",
+        "estimated_hours",
+        "actual_hours",
+        "parent_issue_id",
+        "created_user",
+        "created",
+        "updated_user",
+        "updated",
+        "custom_fields",
+        "attachments",
+        "shared_files",
+        "stars",
+    )
+
+    # unknown ids are decoded to None instead of failing the whole list
+    _FIELD_DECODERS = {
+        "resolution": _to_resolution,
+        "priority": _to_priority,
+    }
+
+    id: int
+    project_id: int
+    issue_key: str
+    key_id: int
+    issue_type: IssueType
+    summary: str
+    description: Optional[str]
+    resolution: Optional[Resolution]
+    priority: Optional[Priority]
+    status: Status
+    assignee: Optional[User]
+    category: List[Category]
+    versions: List[Version]
+    milestone: List[Version]
+    start_date: Optional[datetime]
+    due_date: Optional[datetime]
+    estimated_hours: Optional[float]
+    actual_hours: Optional[float]
+    parent_issue_id: Optional[int]
+    created_user: User
+    created: datetime
+    updated_user: Optional[User]
+    updated: Optional[datetime]
+    # values of custom fields differ by their field types
+    custom_fields: List[Dict[str, Any]]
+    attachments: List[Attachment]
+    shared_files: List[SharedFile]
+    stars: List[Star]
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        resolution = _to_resolution(
+            data["resolution"]) if data.get("resolution") else None
+        priority = _to_priority(
+            data["priority"]) if data.get("priority") else None
+        assignee = User.from_dict(
+            data["assignee"]) if data.get("assignee") else None
+        start_date = parse_datetime(
+            data["startDate"]) if data.get("startDate") else None
+        due_date = parse_datetime(
+            data["dueDate"]) if data.get("dueDate") else None
+        updated_user = User.from_dict(
+            data["updatedUser"]) if data.get("updatedUser") else None
+        updated = parse_datetime(
+            data["updated"]) if data.get("updated") else None
+
+        return cls(
+            id=data["id"],
+            project_id=data["projectId"],
+            issue_key=data["issueKey"],
+            key_id=data["keyId"],
+            issue_type=IssueType.from_dict(data["issueType"]),
+            summary=data["summary"],
+            description=data.get("description"),
+            resolution=resolution,
+            priority=priority,
+            status=Status.from_dict(data["status"]),
+            assignee=assignee,
+            category=[Category.from_dict(c) for c in data["category"]],
+            versions=[Version.from_dict(v) for v in data["versions"]],
+            milestone=[Version.from_dict(m) for m in data["milestone"]],
+            start_date=start_date,
+            due_date=due_date,
+            estimated_hours=data.get("estimatedHours"),
+            actual_hours=data.get("actualHours"),
+            parent_issue_id=data.get("parentIssueId"),
+            created_user=User.from_dict(data["createdUser"]),
+            created=parse_datetime(data["created"]),
+            updated_user=updated_user,
+            updated=updated,
+            custom_fields=data["customFields"],
+            attachments=[Attachment.from_dict(a)
+                         for a in data["attachments"]],
+            shared_files=[SharedFile.from_dict(s)
+                          for s in data["sharedFiles"]],
+            stars=[Star.from_dict(s) for s in data["stars"]],
+        )
+
+
+class LazyComment(LazyModel, Comment):
+    """Comment class decoding nested fields on first access."""
+
+    __slots__ = LazyModel.SLOTS
+
+    _LAZY_FIELDS = {
+        "change_log": lambda data: [
+            ChangeLog.from_dict(cl) for cl in data["changeLog"]],
+        "created_user": lambda data: User.from_dict(data["createdUser"]),
+        "created": lambda data: parse_datetime(data["created"]),
+        "updated": lambda data: parse_datetime(data["updated"]),
+        "stars": lambda data: [Star.from_dict(s) for s in data["stars"]],
+    }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls._create(
+            data,
+            id=data["id"],
+            content=data["content"],
+            notifications=data["notifications"],
+        )
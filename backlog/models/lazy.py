@@ -0,0 +1,107 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lazy model module."""
+
+from dataclasses import fields
+from typing import Any, Callable, Dict, Type
+
+from .base import Base
+from .user import current_identity_map, user_identity_scope
+
+LAZY_MODELS: Dict[Type[Base], Type[Base]] = {}
+
+
+class LazyModel(object):
+    """Mixin of model whose nested fields are decoded on first access.
+
+    A subclass of a model lists the fields to decode lazily
+    in _LAZY_FIELDS, and keeps the dictionary type variable it was
+    created from until every lazy field is accessed.
+    Decoded values are stored in the slots, so each field is decoded once,
+    and the dictionary is released when the last one is decoded.
+    """
+
+    __slots__ = ()
+
+    SLOTS = ("_raw", "_identity_map")
+
+    _LAZY_FIELDS: Dict[str, Callable[[dict], Any]] = {}
+
+    _MODEL: Type[Base]
+
+    def __init_subclass__(cls, **kwargs):
+        """__init_subclass__ method."""
+        super().__init_subclass__(**kwargs)
+        for base in cls.__mro__[1:]:
+            if issubclass(base, Base) and not issubclass(base, LazyModel):
+                LAZY_MODELS[base] = cls
+                cls._MODEL = base
+                break
+
+    @classmethod
+    def _create(cls, data: dict, **values):
+        self = cls.__new__(cls)
+        for name, value in values.items():
+            setattr(self, name, value)
+        self._raw = data
+        self._identity_map = current_identity_map()
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        """Decode the field on first access.
+
+        :param name: name of the field
+        :raises AttributeError: when the field does not exist
+        :return: value of the field
+        """
+        decode = type(self)._LAZY_FIELDS.get(name)
+        if decode is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'")
+        # read once, since another thread may release them meanwhile
+        identity_map = self._identity_map
+        raw = self._raw
+        if raw is None:
+            # every field was decoded by another thread
+            return object.__getattribute__(self, name)
+        if identity_map is None:
+            value = decode(raw)
+        else:
+            with user_identity_scope(identity_map):
+                value = decode(raw)
+        setattr(self, name, value)
+        # decoded fields are checked by their slots instead of a counter,
+        # so threads decoding the same field at once cannot release
+        # the dictionary before the other fields are decoded
+        if all(self._is_decoded(field) for field in type(self)._LAZY_FIELDS):
+            self._raw = None
+            self._identity_map = None
+        return value
+
+    def _is_decoded(self, name: str) -> bool:
+        try:
+            object.__getattribute__(self, name)
+        except AttributeError:
+            return False
+        return True
+
+    def __reduce__(self):
+        """__reduce__ method.
+
+        The model is pickled and copied as the eager model
+        with every field decoded.
+        """
+        return self._MODEL, tuple(
+            getattr(self, field.name) for field in fields(self))
@@ -23,6 +23,20 @@ from .base import Base
 class Project(Base):
     """Project class."""
 
+    __slots__ = (
+        "id",
+        "project_key",
+        "name",
+        "chart_enabled",
+        "subtasking_enabled",
+        "project_leader_can_edit_project_leader",
+        "use_wiki_tree_view",
+        "text_formatting_rule",
+        "archived",
+        "display_order",
+        "use_dev_attributes",
+    )
+
     id: int
     project_key: str
     name: str
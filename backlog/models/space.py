@@ -17,13 +17,25 @@
 from dataclasses import dataclass
 from datetime import datetime
 
-from .base import Base
+from .base import Base, parse_datetime
 
 
 @dataclass
 class Space(Base):
     """Space class."""
 
+    __slots__ = (
+        "space_key",
+        "name",
+        "owner_id",
+        "lang",
+        "timezone",
+        "report_send_time",
+        "text_formatting_rule",
+        "created",
+        "updated",
+    )
+
     space_key: str
     name: str
     owner_id: int
@@ -44,6 +56,6 @@ class Space(Base):
             timezone=data["timezone"],
             report_send_time=data["reportSendTime"],
             text_formatting_rule=data["textFormattingRule"],
-            created=datetime.strptime(data["created"], cls._DATETIME_FORMAT),
-            updated=datetime.strptime(data["updated"], cls._DATETIME_FORMAT),
+            created=parse_datetime(data["created"]),
+            updated=parse_datetime(data["updated"]),
         )
@@ -18,7 +18,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-from .base import Base
+from .base import Base, parse_datetime
 from .user import User
 
 
@@ -26,6 +26,15 @@ from .user import User
 class Star(Base):
     """Star class."""
 
+    __slots__ = (
+        "id",
+        "comment",
+        "url",
+        "title",
+        "presenter",
+        "created",
+    )
+
     id: int
     comment: Optional[str]
     url: str
@@ -41,5 +50,5 @@ class Star(Base):
             url=data["url"],
             title=data["title"],
             presenter=User.from_dict(data["presenter"]),
-            created=datetime.strptime(data["created"], cls._DATETIME_FORMAT),
+            created=parse_datetime(data["created"]),
         )
@@ -14,8 +14,12 @@
 
 """User module."""
 
+import threading
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 from .base import Base
 
@@ -24,6 +28,12 @@ from .base import Base
 class NulabAccount(Base):
     """Nulab Account class."""
 
+    __slots__ = (
+        "nulab_id",
+        "name",
+        "unique_id",
+    )
+
     nulab_id: str
     name: str
     unique_id: str
@@ -41,6 +51,18 @@ class NulabAccount(Base):
 class User(Base):
     """User class."""
 
+    __slots__ = (
+        "id",
+        "user_id",
+        "name",
+        "role_type",
+        "lang",
+        "mail_address",
+        "nulab_account",
+        "keyword",
+        "__weakref__",
+    )
+
     id: int
     user_id: Optional[str]
     name: str
@@ -52,6 +74,25 @@ class User(Base):
 
     @classmethod
     def from_dict(cls, data: dict):
+        identity_map = _current_identity_map.get()
+        if identity_map is not None:
+            return identity_map.resolve(data, cls._from_dict)
+        return cls._from_dict(data)
+
+    @classmethod
+    def _get_decoder(cls):
+        decode = super()._get_decoder()
+
+        def decode_user(data: dict) -> "User":
+            identity_map = _current_identity_map.get()
+            if identity_map is not None:
+                return identity_map.resolve(data, decode)
+            return decode(data)
+
+        return decode_user
+
+    @classmethod
+    def _from_dict(cls, data: dict):
         nulab_account = NulabAccount.from_dict(
             data["nulabAccount"]) if data.get("nulabAccount") else None
 
@@ -65,3 +106,103 @@ class User(Base):
             nulab_account=nulab_account,
             keyword=data.get("keyword"),
         )
+
+
+class UserIdentityMap(object):
+    """Identity map resolving users with the same id to one instance.
+
+    Users are held by weak references, so a user is forgotten
+    as soon as no model refers to it.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        """__init__ method.
+
+        :param maxsize: maximum number of users held
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._users: "weakref.WeakValueDictionary[int, User]" = \
+            weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        """__len__ method."""
+        return len(self._users)
+
+    def resolve(
+            self,
+            data: dict,
+            factory: Callable[[dict], User]) -> User:
+        """Get the user of the data, creating it if not held.
+
+        A held user is reused only if every field still has the same
+        value, so that a change of the user is never hidden
+        even when the identity map is shared by many responses.
+
+        :param data: dictionary type variable of user
+        :param factory: function creating user from the data
+        :return: user
+        """
+        with self._lock:
+            user = self._users.get(data["id"])
+            if user is not None and _is_same_user(user, data):
+                self.hits += 1
+                return user
+            self.misses += 1
+            held = user is not None
+            user = factory(data)
+            if held or len(self._users) < self.maxsize:
+                self._users[user.id] = user
+            return user
+
+
+def _is_same_user(user: User, data: dict) -> bool:
+    account = data.get("nulabAccount")
+    held_account = user.nulab_account
+    if account:
+        if (held_account is None
+                or held_account.nulab_id != account["nulabId"]
+                or held_account.name != account["name"]
+                or held_account.unique_id != account["uniqueId"]):
+            return False
+    elif held_account is not None:
+        return False
+    return (user.name == data["name"]
+            and user.mail_address == data["mailAddress"]
+            and user.role_type == data["roleType"]
+            and user.user_id == data.get("userId")
+            and user.lang == data.get("lang")
+            and user.keyword == data.get("keyword"))
+
+
+_current_identity_map: "ContextVar[Optional[UserIdentityMap]]" = \
+    ContextVar("backlog_user_identity_map", default=None)
+
+
+def current_identity_map() -> Optional[UserIdentityMap]:
+    """Get identity map of the current scope.
+
+    :return: identity map, or None if out of any scope
+    """
+    return _current_identity_map.get()
+
+
+@contextmanager
+def user_identity_scope(
+        identity_map: Optional[UserIdentityMap] = None
+) -> Iterator[UserIdentityMap]:
+    """Share users created by User.from_dict within the scope by id.
+
+    :param identity_map: identity map to use.
+        if omitted, a new identity map is used only within the scope
+    :return: identity map
+    """
+    if identity_map is None:
+        identity_map = UserIdentityMap()
+    token = _current_identity_map.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        _current_identity_map.reset(token)
@@ -18,8 +18,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 
-from .base import Base
+from .base import Base, parse_datetime
 from .file import Attachment, SharedFile
+from .lazy import LazyModel
 from .star import Star
 from .user import User
 
@@ -28,6 +29,11 @@ from .user import User
 class Tag(Base):
     """Tag class."""
 
+    __slots__ = (
+        "id",
+        "name",
+    )
+
     id: int
     name: str
 
@@ -43,6 +49,21 @@ class Tag(Base):
 class Wiki(Base):
     """Wiki class."""
 
+    __slots__ = (
+        "id",
+        "project_id",
+        "name",
+        "content",
+        "tags",
+        "attachments",
+        "shared_files",
+        "stars",
+        "created_user",
+        "created",
+        "updated_user",
+        "updated",
+    )
+
     id: int
     project_id: int
     name: str
@@ -68,7 +89,36 @@ class Wiki(Base):
             shared_files=[SharedFile.from_dict(s) for s in data["sharedFiles"]],
             stars=[Star.from_dict(s) for s in data["stars"]],
             created_user=User.from_dict(data["createdUser"]),
-            created=datetime.strptime(data["created"], cls._DATETIME_FORMAT),
+            created=parse_datetime(data["created"]),
             updated_user=User.from_dict(data["updatedUser"]),
-            updated=datetime.strptime(data["updated"], cls._DATETIME_FORMAT),
+            updated=parse_datetime(data["updated"]),
+        )
+
+
+class LazyWiki(LazyModel, Wiki):
+    """Wiki class decoding nested fields on first access."""
+
+    __slots__ = LazyModel.SLOTS
+
+    _LAZY_FIELDS = {
+        "tags": lambda data: [Tag.from_dict(t) for t in data["tags"]],
+        "attachments": lambda data: [
+            Attachment.from_dict(a) for a in data["attachments"]],
+        "shared_files": lambda data: [
+            SharedFile.from_dict(s) for s in data["sharedFiles"]],
+        "stars": lambda data: [Star.from_dict(s) for s in data["stars"]],
+        "created_user": lambda data: User.from_dict(data["createdUser"]),
+        "created": lambda data: parse_datetime(data["created"]),
+        "updated_user": lambda data: User.from_dict(data["updatedUser"]),
+        "updated": lambda data: parse_datetime(data["updated"]),
+    }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls._create(
+            data,
+            id=data["id"],
+            project_id=data["projectId"],
+            name=data["name"],
+            content=data["content"],
         )
@@ -0,0 +1,264 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pagination module."""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import (Any, AsyncIterator, Awaitable, Callable, Iterator, List,
+                    Optional, TypeVar)
+
+T = TypeVar("T")
+
+MAX_COUNT = 100
+ORDERS = ("asc", "desc")
+
+
+def check_page_params(count: int, order: str):
+    """Check parameters of paginated request.
+
+    :param count: number of items per page
+    :param order: sort order by id
+    :raises ValueError: when parameters are invalid
+    """
+    if not 1 <= count <= MAX_COUNT:
+        raise ValueError(f"count must be between 1 and {MAX_COUNT}.")
+    if order not in ORDERS:
+        raise ValueError("order must be one of 'asc', 'desc'.")
+
+
+def page_params(
+        min_id: Optional[int],
+        max_id: Optional[int],
+        count: Optional[int],
+        order: Optional[str]) -> dict:
+    """Create query parameters of paginated request.
+
+    :param min_id: minimum id
+    :param max_id: maximum id
+    :param count: number of items per page
+    :param order: sort order by id
+    :return: query parameters
+    """
+    query_params = {}
+    if min_id is not None:
+        query_params["minId"] = min_id
+    if max_id is not None:
+        query_params["maxId"] = max_id
+    if count is not None:
+        query_params["count"] = count
+    if order is not None:
+        query_params["order"] = order
+    return query_params
+
+
+def _next_cursor(page: list, count: int, order: str) -> Optional[dict]:
+    if len(page) < count:
+        return None
+    key = "min_id" if order == "asc" else "max_id"
+    return {key: _get_id(page[-1])}
+
+
+def _filter_seen(page: list, cursor: Optional[dict]) -> list:
+    # minId and maxId may be inclusive, so drop the item used as cursor.
+    if not cursor:
+        return page
+    if "min_id" in cursor:
+        return [item for item in page if _get_id(item) > cursor["min_id"]]
+    return [item for item in page if _get_id(item) < cursor["max_id"]]
+
+
+def _get_id(item: Any) -> int:
+    # items are dictionaries when the decoder returns raw output
+    return item["id"] if isinstance(item, dict) else item.id
+
+
+def iter_by_id_cursor(
+        fetch_page: Callable[..., List[T]],
+        count: int,
+        order: str) -> Iterator[T]:
+    """Iterate over all items of list endpoint paged by minId/maxId.
+
+    The next page is requested in the background
+    while the items of the current page are being consumed.
+
+    :param fetch_page: function that receives min_id or max_id
+        as keyword argument and returns one page of items having id
+    :param count: number of items per page
+    :param order: sort order by id
+    :raises ValueError: when parameters are invalid
+    :return: iterator of items
+    """
+    check_page_params(count, order)
+    return _iter_by_id_cursor(fetch_page, count, order)
+
+
+def _iter_by_id_cursor(
+        fetch_page: Callable[..., List[T]],
+        count: int,
+        order: str) -> Iterator[T]:
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        cursor: Optional[dict] = {}
+        future = executor.submit(fetch_page)
+        while future is not None:
+            page = future.result()
+            items = _filter_seen(page, cursor)
+            cursor = _next_cursor(page, count, order) if items else None
+            future = executor.submit(fetch_page, **cursor) if cursor else None
+            yield from items
+    finally:
+        executor.shutdown(wait=False)
+
+
+def aiter_by_id_cursor(
+        fetch_page: Callable[..., Awaitable[List[T]]],
+        count: int,
+        order: str) -> AsyncIterator[T]:
+    """Asynchronously iterate over all items paged by minId/maxId.
+
+    :param fetch_page: coroutine function that receives min_id or max_id
+        as keyword argument and returns one page of items having id
+    :param count: number of items per page
+    :param order: sort order by id
+    :raises ValueError: when parameters are invalid
+    :return: asynchronous iterator of items
+    """
+    check_page_params(count, order)
+    return _aiter_by_id_cursor(fetch_page, count, order)
+
+
+async def _aiter_by_id_cursor(
+        fetch_page: Callable[..., Awaitable[List[T]]],
+        count: int,
+        order: str) -> AsyncIterator[T]:
+    cursor: Optional[dict] = {}
+    task: Optional[asyncio.Future] = asyncio.ensure_future(fetch_page())
+    try:
+        while task is not None:
+            page = await task
+            items = _filter_seen(page, cursor)
+            cursor = _next_cursor(page, count, order) if items else None
+            task = asyncio.ensure_future(
+                fetch_page(**cursor)) if cursor else None
+            for item in items:
+                yield item
+    finally:
+        if task is not None:
+            task.cancel()
+
+
+def check_offset_params(count: int, max_workers: int):
+    """Check parameters of request paged by offset.
+
+    :param count: number of items per page
+    :param max_workers: maximum number of pages requested concurrently
+    :raises ValueError: when parameters are invalid
+    """
+    if not 1 <= count <= MAX_COUNT:
+        raise ValueError(f"count must be between 1 and {MAX_COUNT}.")
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0.")
+
+
+def iter_by_offset(
+        fetch_page: Callable[..., List[T]],
+        total: int,
+        count: int,
+        max_workers: int) -> Iterator[T]:
+    """Iterate over all items of list endpoint paged by offset.
+
+    Since the number of items is known, pages are requested concurrently
+    up to max_workers pages ahead of the consumer,
+    and items are returned in order.
+
+    :param fetch_page: function that receives offset as keyword argument
+        and returns one page of items
+    :param total: number of items
+    :param count: number of items per page
+    :param max_workers: maximum number of pages requested concurrently
+    :raises ValueError: when parameters are invalid
+    :return: iterator of items
+    """
+    check_offset_params(count, max_workers)
+    return _iter_by_offset(fetch_page, total, count, max_workers)
+
+
+def _iter_by_offset(
+        fetch_page: Callable[..., List[T]],
+        total: int,
+        count: int,
+        max_workers: int) -> Iterator[T]:
+    offsets = iter(range(0, total, count))
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures: deque = deque()
+    try:
+        for offset in offsets:
+            futures.append(executor.submit(fetch_page, offset=offset))
+            if len(futures) >= max_workers:
+                break
+        while futures:
+            page = futures.popleft().result()
+            offset = next(offsets, None)
+            if offset is not None:
+                futures.append(executor.submit(fetch_page, offset=offset))
+            yield from page
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def aiter_by_offset(
+        fetch_page: Callable[..., Awaitable[List[T]]],
+        total: int,
+        count: int,
+        max_concurrency: int) -> AsyncIterator[T]:
+    """Asynchronously iterate over all items paged by offset.
+
+    :param fetch_page: coroutine function that receives offset
+        as keyword argument and returns one page of items
+    :param total: number of items
+    :param count: number of items per page
+    :param max_concurrency: maximum number of pages requested concurrently
+    :raises ValueError: when parameters are invalid
+    :return: asynchronous iterator of items
+    """
+    check_offset_params(count, max_concurrency)
+    return _aiter_by_offset(fetch_page, total, count, max_concurrency)
+
+
+async def _aiter_by_offset(
+        fetch_page: Callable[..., Awaitable[List[T]]],
+        total: int,
+        count: int,
+        max_concurrency: int) -> AsyncIterator[T]:
+    offsets = iter(range(0, total, count))
+    tasks: deque = deque()
+    try:
+        for offset in offsets:
+            tasks.append(asyncio.ensure_future(fetch_page(offset=offset)))
+            if len(tasks) >= max_concurrency:
+                break
+        while tasks:
+            page = await tasks.popleft()
+            offset = next(offsets, None)
+            if offset is not None:
+                tasks.append(asyncio.ensure_future(fetch_page(offset=offset)))
+            for item in page:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
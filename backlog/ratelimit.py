@@ -0,0 +1,202 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Rate limit module."""
+
+import asyncio
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Mapping, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+class RateLimiter(object):
+    """Token bucket rate limiter shared by threads.
+
+    Tokens are refilled at limit / period per second.
+    Whenever a response has X-RateLimit-* headers, the bucket is corrected
+    so that the remaining quota is spread evenly until the quota is reset.
+    """
+
+    LIMIT_HEADER = "X-RateLimit-Limit"
+    REMAINING_HEADER = "X-RateLimit-Remaining"
+    RESET_HEADER = "X-RateLimit-Reset"
+
+    def __init__(
+            self,
+            limit: int = 60,
+            period: float = 60.0,
+            burst: int = 10,
+            clock: Callable[[], float] = time.time,
+            sleep: Callable[[float], None] = time.sleep):
+        """__init__ method.
+
+        :param limit: number of requests allowed per period
+        :param period: period in seconds
+        :param burst: maximum number of requests sent without pacing
+        :param clock: function that returns current unix time
+        :param sleep: function that sleeps for given seconds
+        :raises ValueError: when initialization fails
+        """
+        if limit < 1:
+            raise ValueError("limit must be greater than 0.")
+        if period <= 0:
+            raise ValueError("period must be greater than 0.")
+        if burst < 1:
+            raise ValueError("burst must be greater than 0.")
+
+        self.period = period
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._state = self._initial_state(limit)
+
+    def acquire(self) -> float:
+        """Wait until a request can be sent.
+
+        :return: seconds waited
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire()
+            if wait == 0:
+                return waited
+            self._sleep(wait)
+            waited += wait
+
+    async def acquire_async(self) -> float:
+        """Wait until a request can be sent without blocking event loop.
+
+        :return: seconds waited
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire()
+            if wait == 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def try_acquire(self) -> float:
+        """Take a token if available.
+
+        :return: 0 if a token was taken, otherwise seconds to wait
+        """
+        with self._locked_state() as state:
+            now = self._clock()
+            self._refill(state, now)
+            if state["tokens"] >= 1:
+                state["tokens"] -= 1
+                return 0
+            if state["rate"] > 0:
+                return (1 - state["tokens"]) / state["rate"]
+            return max(state["reset_at"] - now, 0.001)
+
+    def update(self, headers: Mapping[str, str]):
+        """Correct the bucket by the rate limit headers of a response.
+
+        :param headers: response headers
+        """
+        try:
+            remaining = int(headers[self.REMAINING_HEADER])
+            reset_at = float(headers[self.RESET_HEADER])
+        except (KeyError, TypeError, ValueError):
+            return
+        limit = headers.get(self.LIMIT_HEADER)
+
+        with self._locked_state() as state:
+            now = self._clock()
+            self._refill(state, now)
+            if limit and limit.isdigit() and int(limit) > 0:
+                state["limit"] = int(limit)
+            state["tokens"] = min(state["tokens"], remaining, self.burst)
+            if reset_at > now:
+                state["rate"] = remaining / (reset_at - now)
+                state["reset_at"] = reset_at
+            else:
+                state["rate"] = state["limit"] / self.period
+                state["reset_at"] = 0.0
+
+    def _initial_state(self, limit: int) -> Dict[str, float]:
+        return {
+            "limit": limit,
+            "tokens": float(self.burst),
+            "rate": limit / self.period,
+            "reset_at": 0.0,
+            "updated_at": self._clock(),
+        }
+
+    def _refill(self, state: Dict[str, float], now: float):
+        if state["reset_at"] and now >= state["reset_at"]:
+            state["rate"] = state["limit"] / self.period
+            state["reset_at"] = 0.0
+        elapsed = max(now - state["updated_at"], 0.0)
+        state["tokens"] = min(
+            state["tokens"] + elapsed * state["rate"], self.burst)
+        state["updated_at"] = now
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[Dict[str, float]]:
+        with self._lock:
+            yield self._state
+
+
+class FileRateLimiter(RateLimiter):
+    """Token bucket rate limiter shared by processes.
+
+    The bucket is stored in a file and guarded by an exclusive file lock,
+    so every process using the same file shares one quota.
+    """
+
+    def __init__(self, path: str, *args, **kwargs):
+        """__init__ method.
+
+        :param path: path of the file storing the bucket
+        :raises OSError: when file lock is not supported on this platform
+        :raises ValueError: when initialization fails
+        """
+        if fcntl is None:
+            raise OSError("FileRateLimiter requires fcntl.")
+        self.path = path
+        super().__init__(*args, **kwargs)
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[Dict[str, float]]:
+        with self._lock, open(self.path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                text = f.read()
+                state: Optional[Dict[str, float]] = None
+                if text:
+                    try:
+                        state = json.loads(text)
+                    except ValueError:
+                        state = None
+                if state is None:
+                    state = dict(self._state)
+                yield state
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
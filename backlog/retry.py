@@ -0,0 +1,282 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Retry module."""
+
+import asyncio
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import (Any, Awaitable, Callable, Collection, Dict, Optional,
+                    Tuple, Type, Union)
+
+ReasonType = Union[int, str]
+
+
+class RetryStats(object):
+    """Statistics of requests sent with retry policy."""
+
+    def __init__(self):
+        """__init__ method."""
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.attempts = 0
+        self.retries = 0
+        self.failures = 0
+        self.retries_by_reason: Counter = Counter()
+
+    def record_request(self):
+        """Record a request."""
+        with self._lock:
+            self.requests += 1
+
+    def record_attempt(self):
+        """Record an attempt to send a request."""
+        with self._lock:
+            self.attempts += 1
+
+    def record_retry(self, reason: ReasonType):
+        """Record a retry.
+
+        :param reason: status code or name of exception that caused the retry
+        """
+        with self._lock:
+            self.retries += 1
+            self.retries_by_reason[reason] += 1
+
+    def record_failure(self):
+        """Record a request that failed after all attempts."""
+        with self._lock:
+            self.failures += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert this object to dictionary type variable.
+
+        :return: dictionary type variable
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "failures": self.failures,
+                "retries_by_reason": dict(self.retries_by_reason),
+            }
+
+
+class RetryPolicy(object):
+    """Policy deciding whether and when a request is retried."""
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    def __init__(
+            self,
+            max_attempts: int = 3,
+            backoff_factor: float = 0.5,
+            max_backoff: float = 30.0,
+            jitter: bool = True,
+            retry_statuses: Collection[int] = RETRY_STATUSES,
+            retry_on_errors: bool = True,
+            respect_retry_after: bool = True,
+            max_retry_after: float = 300.0,
+            methods: Collection[str] = IDEMPOTENT_METHODS,
+            random_func: Callable[[], float] = random.random):
+        """__init__ method.
+
+        :param max_attempts: maximum number of attempts including first one
+        :param backoff_factor: delay before first retry in seconds.
+            the delay doubles for every following retry
+        :param max_backoff: maximum delay in seconds
+        :param jitter: whether to randomize delay between 0 and the backoff
+        :param retry_statuses: status codes to retry
+        :param retry_on_errors: whether to retry connection errors
+            and timeouts
+        :param respect_retry_after: whether to wait as the Retry-After header
+            tells instead of backoff
+        :param max_retry_after: maximum delay accepted from Retry-After.
+            longer delay is not retried
+        :param methods: methods allowed to retry
+        :param random_func: function returning random number in [0, 1)
+        :raises ValueError: when initialization fails
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be greater than 0.")
+        if backoff_factor < 0 or max_backoff < 0:
+            raise ValueError("backoff must not be negative.")
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_on_errors = retry_on_errors
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.methods = frozenset(method.upper() for method in methods)
+        self._random = random_func
+
+    def is_retryable(
+            self,
+            method: str,
+            attempt: int,
+            status: Optional[int] = None,
+            error: Optional[Exception] = None) -> bool:
+        """Decide whether a request should be retried.
+
+        :param method: method of the request
+        :param attempt: number of attempts already made
+        :param status: status code of the response
+        :param error: exception raised while sending the request
+        :return: True if the request should be retried
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.methods:
+            return False
+        if error is not None:
+            return self.retry_on_errors
+        return status in self.retry_statuses
+
+    def get_delay(
+            self,
+            attempt: int,
+            retry_after: Optional[str] = None) -> Optional[float]:
+        """Calculate delay before next attempt.
+
+        :param attempt: number of attempts already made
+        :param retry_after: value of Retry-After header
+        :return: delay in seconds, or None if the server asks to wait
+            longer than max_retry_after
+        """
+        if self.respect_retry_after and retry_after:
+            delay = self._parse_retry_after(retry_after)
+            if delay is not None:
+                return delay if delay <= self.max_retry_after else None
+
+        delay = min(
+            self.backoff_factor * (2 ** (attempt - 1)), self.max_backoff)
+        if self.jitter:
+            delay *= self._random()
+        return delay
+
+    @staticmethod
+    def _parse_retry_after(value: str) -> Optional[float]:
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at is None:
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
+
+
+def send_with_retry(
+        send: Callable[[], Any],
+        policy: RetryPolicy,
+        stats: RetryStats,
+        errors: Tuple[Type[Exception], ...],
+        method: str = "GET",
+        sleep: Callable[[float], None] = time.sleep) -> Any:
+    """Send a request, retrying it according to the policy.
+
+    :param send: function that sends the request and returns the response
+        having status_code, headers and close()
+    :param policy: retry policy
+    :param stats: statistics to record to
+    :param errors: exceptions that are retried
+    :param method: method of the request
+    :param sleep: function that sleeps for given seconds
+    :return: last response
+    """
+    stats.record_request()
+    attempt = 0
+    while True:
+        attempt += 1
+        stats.record_attempt()
+        delay, reason = None, None
+        try:
+            response = send()
+        except errors as e:
+            if policy.is_retryable(method, attempt, error=e):
+                delay, reason = policy.get_delay(attempt), type(e).__name__
+            if delay is None:
+                stats.record_failure()
+                raise
+        else:
+            if policy.is_retryable(
+                    method, attempt, status=response.status_code):
+                delay = policy.get_delay(
+                    attempt, response.headers.get("Retry-After"))
+                reason = response.status_code
+            if delay is None:
+                if response.status_code >= 400:
+                    stats.record_failure()
+                return response
+            response.close()
+
+        stats.record_retry(reason)
+        sleep(delay)
+
+
+async def send_with_retry_async(
+        send: Callable[[], Awaitable[Any]],
+        policy: RetryPolicy,
+        stats: RetryStats,
+        errors: Tuple[Type[Exception], ...],
+        method: str = "GET") -> Any:
+    """Send a request asynchronously, retrying it according to the policy.
+
+    :param send: coroutine function that sends the request
+        and returns the response having status_code, headers and aclose()
+    :param policy: retry policy
+    :param stats: statistics to record to
+    :param errors: exceptions that are retried
+    :param method: method of the request
+    :return: last response
+    """
+    stats.record_request()
+    attempt = 0
+    while True:
+        attempt += 1
+        stats.record_attempt()
+        delay, reason = None, None
+        try:
+            response = await send()
+        except errors as e:
+            if policy.is_retryable(method, attempt, error=e):
+                delay, reason = policy.get_delay(attempt), type(e).__name__
+            if delay is None:
+                stats.record_failure()
+                raise
+        else:
+            if policy.is_retryable(
+                    method, attempt, status=response.status_code):
+                delay = policy.get_delay(
+                    attempt, response.headers.get("Retry-After"))
+                reason = response.status_code
+            if delay is None:
+                if response.status_code >= 400:
+                    stats.record_failure()
+                return response
+            await response.aclose()
+
+        stats.record_retry(reason)
+        await asyncio.sleep(delay)
@@ -0,0 +1,99 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Single-flight module."""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(object):
+    """Deduplicator of identical calls in flight.
+
+    While a call for a key is running, other calls for the same key
+    wait for it and receive its result instead of running again.
+    """
+
+    def __init__(self):
+        """__init__ method."""
+        self.executed = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Call the function unless a call for the same key is in flight.
+
+        :param key: key identifying the call
+        :param func: function to call
+        :return: result of the function
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(
+            self,
+            key: Hashable,
+            func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await the coroutine function unless one for the key is in flight.
+
+        :param key: key identifying the call
+        :param func: coroutine function to await
+        :return: result of the coroutine function
+        """
+        future = self._futures.get(key)
+        if future is not None:
+            with self._lock:
+                self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = self._futures[key] = asyncio.ensure_future(func())
+        with self._lock:
+            self.executed += 1
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if self._futures.get(key) is future:
+                del self._futures[key]
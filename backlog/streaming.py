@@ -0,0 +1,127 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming JSON module."""
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, List
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_TERMINATORS = frozenset(" \t\n\r,]")
+
+
+class JsonArrayDecoder(object):
+    """Incremental decoder of JSON array.
+
+    Bytes of a JSON array are fed in chunks of any size,
+    and every element is returned as soon as it is complete,
+    so the whole array is never held in memory.
+    """
+
+    _START = 0
+    _FIRST_VALUE = 1
+    _VALUE = 2
+    _SEPARATOR = 3
+    _END = 4
+
+    def __init__(self):
+        """__init__ method."""
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = self._START
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Feed a chunk of the array.
+
+        :param chunk: chunk of bytes
+        :raises ValueError: when the data is not JSON array
+        :return: elements completed by the chunk
+        """
+        self._buffer += self._text_decoder.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self) -> List[Any]:
+        """Finish decoding.
+
+        :raises ValueError: when the array is incomplete
+        :return: remaining elements
+        """
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        items = self._parse(final=True)
+        if self._state != self._END:
+            raise ValueError("JSON array is incomplete.")
+        return items
+
+    def _parse(self, final: bool) -> List[Any]:
+        items = []
+        buffer = self._buffer
+        pos = 0
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos >= len(buffer):
+                break
+            char = buffer[pos]
+            if self._state == self._END:
+                raise ValueError(f"Extra data after JSON array. pos: {pos}")
+            if self._state == self._START:
+                if char != "[":
+                    raise ValueError("JSON array is expected.")
+                self._state = self._FIRST_VALUE
+                pos += 1
+            elif self._state == self._SEPARATOR or (
+                    self._state == self._FIRST_VALUE and char == "]"):
+                if char == "]":
+                    self._state = self._END
+                elif char == ",":
+                    self._state = self._VALUE
+                else:
+                    raise ValueError(f"Invalid JSON array. pos: {pos}")
+                pos += 1
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                # a number may continue in next chunk unless it is followed
+                # by a character that cannot belong to it
+                if not final and (
+                        end == len(buffer)
+                        or (buffer[end] not in _NUMBER_TERMINATORS
+                            and isinstance(item, (int, float)))):
+                    break
+                items.append(item)
+                self._state = self._SEPARATOR
+                pos = end
+        self._buffer = buffer[pos:]
+        return items
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Iterate over elements of JSON array given in chunks.
+
+    :param chunks: chunks of bytes
+    :raises ValueError: when the data is not complete JSON array
+    :return: iterator of elements
+    """
+    decoder = JsonArrayDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
@@ -0,0 +1,383 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Incremental synchronization module."""
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import (Callable, Iterable, Iterator, List, Optional, Tuple,
+                    TypeVar, Union)
+
+from .api import BacklogApi
+from .models import Comment, Issue, SharedFile, Space, Wiki
+from .models.base import DATETIME_FORMAT
+
+T = TypeVar("T")
+
+# updatedSince is a date in the timezone of the space, so the query goes
+# back one more day and the exact timestamps are compared locally
+_DATE_MARGIN = timedelta(days=1)
+
+
+@dataclass
+class SyncState(object):
+    """State of a resource stored after a synchronization."""
+
+    updated: Optional[datetime]
+    full_synced: datetime
+    full_requests: int
+
+
+@dataclass
+class SyncReport(object):
+    """Report of a synchronization of a resource."""
+
+    resource: str
+    since: Optional[datetime]
+    full: bool
+    fetched: int = 0
+    changed: int = 0
+    requests: int = 0
+    requests_saved: int = 0
+
+
+class SQLiteSyncStore(object):
+    """Persistent store of high-water marks in SQLite."""
+
+    def __init__(self, path: str):
+        """__init__ method.
+
+        :param path: path of the database file, or ":memory:"
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS marks ("
+                "resource TEXT PRIMARY KEY, "
+                "updated TEXT, "
+                "full_synced TEXT NOT NULL, "
+                "full_requests INTEGER NOT NULL)")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cursors ("
+                "resource TEXT PRIMARY KEY, "
+                "last_id INTEGER NOT NULL)")
+
+    def __enter__(self) -> "SQLiteSyncStore":
+        """__enter__ method."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """__exit__ method."""
+        self.close()
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def get(self, resource: str) -> Optional[SyncState]:
+        """Get state of the resource.
+
+        :param resource: name of the resource
+        :return: stored state, or None if never synchronized
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT updated, full_synced, full_requests FROM marks "
+                "WHERE resource = ?", (resource,)).fetchone()
+        if row is None:
+            return None
+        return SyncState(
+            updated=_parse(row[0]) if row[0] else None,
+            full_synced=_parse(row[1]),
+            full_requests=row[2])
+
+    def set(self, resource: str, state: SyncState):
+        """Store state of the resource.
+
+        :param resource: name of the resource
+        :param state: state to store
+        """
+        updated = state.updated.strftime(DATETIME_FORMAT) \
+            if state.updated else None
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO marks "
+                "(resource, updated, full_synced, full_requests) "
+                "VALUES (?, ?, ?, ?)",
+                (resource,
+                 updated,
+                 state.full_synced.strftime(DATETIME_FORMAT),
+                 state.full_requests))
+
+    def get_cursor(self, resource: str) -> Optional[int]:
+        """Get id of the last item read from the resource.
+
+        :param resource: name of the resource
+        :return: last id, or None if never read
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT last_id FROM cursors WHERE resource = ?",
+                (resource,)).fetchone()
+        return row[0] if row is not None else None
+
+    def set_cursor(self, resource: str, last_id: int):
+        """Store id of the last item read from the resource.
+
+        :param resource: name of the resource
+        :param last_id: last id
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cursors (resource, last_id) "
+                "VALUES (?, ?)", (resource, last_id))
+
+    def reset(self, pattern: str = "*") -> int:
+        """Remove states and cursors so that the next synchronization is full.
+
+        :param pattern: shell-style wildcard of the resource name
+        :return: number of removed states and cursors
+        """
+        removed = 0
+        with self._lock, self._connection:
+            for table in ("marks", "cursors"):
+                cursor = self._connection.execute(
+                    f"DELETE FROM {table} WHERE resource GLOB ?", (pattern,))
+                removed += cursor.rowcount
+        return removed
+
+
+class SyncEngine(object):
+    """Synchronizer yielding only entities changed since the last run.
+
+    The newest ``updated`` timestamp seen for each resource is stored
+    as its high-water mark when the iteration is exhausted, and the next
+    run yields entities updated at or after the mark.
+    Entities updated exactly at the mark are yielded again,
+    so consumers should upsert them.
+
+    The first run of a resource, and every run after full_resync_interval
+    has passed since the last full run, fetches everything.
+    The number of requests of the full run is stored,
+    and incremental runs report how many requests they saved against it.
+    Requests are counted by retry_stats of the client,
+    so the client should not be shared with other jobs while synchronizing.
+    """
+
+    def __init__(
+            self,
+            api: BacklogApi,
+            store: SQLiteSyncStore,
+            full: bool = False,
+            full_resync_interval: Optional[timedelta] = None,
+            clock: Callable[[], datetime] = datetime.utcnow):
+        """__init__ method.
+
+        :param api: client. its decoder must build models
+        :param store: store of high-water marks
+        :param full: whether to fetch everything regardless of the marks
+        :param full_resync_interval: interval of full synchronizations,
+            which pick up entities missed by incremental ones.
+            None means never
+        :param clock: function that returns current time in UTC
+        :raises ValueError: when initialization fails
+        """
+        if api.decoder.output != "model":
+            raise ValueError("decoder of api must build models.")
+
+        self.api = api
+        self.store = store
+        self.full = full
+        self.full_resync_interval = full_resync_interval
+        self.reports: List[SyncReport] = []
+        self._clock = clock
+
+    @property
+    def requests_saved(self) -> int:
+        """Number of requests saved by all runs of this instance."""
+        return sum(report.requests_saved for report in self.reports)
+
+    def sync_space(self) -> Iterator[Space]:
+        """Synchronize the space.
+
+        :return: iterator of the space if it was changed
+        """
+        return self.sync("space", lambda since: [self.api.get_space()])
+
+    def sync_wikis(
+            self,
+            project_id_or_key: Union[int, str],
+            detail: bool = False) -> Iterator[Wiki]:
+        """Synchronize wiki pages of the project.
+
+        :param project_id_or_key: project id or project key
+        :param detail: whether to get each changed wiki page by id,
+            e.g. to get its content
+        :return: iterator of changed wiki pages
+        """
+        resource = f"wikis/{project_id_or_key}"
+        if detail:
+            return self.sync(
+                resource + "/detail",
+                lambda since: self.api.get_wikis(project_id_or_key),
+                lambda wiki, since: self.api.get_wiki(wiki.id))
+        return self.sync(
+            resource, lambda since: self.api.get_wikis(project_id_or_key))
+
+    def sync_wiki_shared_files(
+            self, project_id_or_key: Union[int, str]
+    ) -> Iterator[Tuple[Wiki, List[SharedFile]]]:
+        """Synchronize shared files on wiki pages of the project.
+
+        Only wiki pages changed since the last run are visited,
+        and only their shared files changed since then are returned.
+
+        :param project_id_or_key: project id or project key
+        :return: iterator of changed wiki pages and their changed files
+        """
+        return self.sync(
+            f"wikis/{project_id_or_key}/sharedFiles",
+            lambda since: self.api.get_wikis(project_id_or_key),
+            lambda wiki, since: (wiki, _changed(
+                self.api.get_wiki_shared_files(wiki.id), since)))
+
+    def sync_issues(
+            self,
+            project_ids: Optional[Iterable[int]] = None) -> Iterator[Issue]:
+        """Synchronize issues.
+
+        Incremental runs request only issues updated since the mark.
+
+        :param project_ids: project ids. None means all projects
+        :return: iterator of changed issues
+        """
+        project_ids = None if project_ids is None else sorted(project_ids)
+        return self.sync(
+            _issues_resource(project_ids),
+            lambda since: self._fetch_issues(project_ids, since))
+
+    def sync_issue_comments(
+            self,
+            project_ids: Optional[Iterable[int]] = None
+    ) -> Iterator[Tuple[Issue, List[Comment]]]:
+        """Synchronize comments on issues.
+
+        Adding or editing a comment updates the issue, so comments are
+        requested only for issues updated since the mark,
+        and only comments changed since then are returned.
+
+        :param project_ids: project ids. None means all projects
+        :return: iterator of changed issues and their changed comments
+        """
+        project_ids = None if project_ids is None else sorted(project_ids)
+        return self.sync(
+            _issues_resource(project_ids) + "/comments",
+            lambda since: self._fetch_issues(project_ids, since),
+            lambda issue, since: (issue, _changed(
+                self.api.iter_issue_comments(issue.id), since)))
+
+    def sync(
+            self,
+            resource: str,
+            fetch: Callable[[Optional[datetime]], Iterable],
+            expand: Optional[Callable[[T, Optional[datetime]], object]] = None
+    ) -> Iterator:
+        """Synchronize a resource.
+
+        :param resource: name of the resource in the store
+        :param fetch: function that gets entities having ``updated``
+            or ``created``. it receives the mark, or None for a full run,
+            and may narrow the request by it
+        :param expand: function that converts a changed entity to
+            the value to return, e.g. by requesting its children.
+            it receives the entity and the mark
+        :return: iterator of changed entities or values from expand.
+            the mark is stored when the iterator is exhausted
+        """
+        now = self._clock()
+        state = None if self.full else self.store.get(resource)
+        if state is not None and self.full_resync_interval is not None and \
+                now - state.full_synced >= self.full_resync_interval:
+            state = None
+        since = state.updated if state is not None else None
+        report = SyncReport(resource=resource, since=since, full=state is None)
+        return self._sync(resource, fetch, expand, state, report, now)
+
+    def _sync(
+            self,
+            resource: str,
+            fetch: Callable[[Optional[datetime]], Iterable],
+            expand: Optional[Callable[[T, Optional[datetime]], object]],
+            state: Optional[SyncState],
+            report: SyncReport,
+            now: datetime) -> Iterator:
+        since = report.since
+        mark = since
+        start = self.api.retry_stats.requests
+        for item in fetch(since):
+            report.fetched += 1
+            updated = _updated_of(item)
+            if mark is None or updated > mark:
+                mark = updated
+            if since is not None and updated < since:
+                continue
+            report.changed += 1
+            yield expand(item, since) if expand is not None else item
+
+        report.requests = self.api.retry_stats.requests - start
+        if state is None:
+            state = SyncState(
+                updated=mark, full_synced=now, full_requests=report.requests)
+        else:
+            report.requests_saved = max(
+                state.full_requests - report.requests, 0)
+            state = SyncState(
+                updated=mark,
+                full_synced=state.full_synced,
+                full_requests=state.full_requests)
+        self.store.set(resource, state)
+        self.reports.append(report)
+
+    def _fetch_issues(
+            self,
+            project_ids: Optional[List[int]],
+            since: Optional[datetime]) -> Iterator[Issue]:
+        updated_since = (since - _DATE_MARGIN).date() if since else None
+        return self.api.iter_issues(
+            project_ids=project_ids, updated_since=updated_since)
+
+
+def _parse(value: str) -> datetime:
+    return datetime.strptime(value, DATETIME_FORMAT)
+
+
+def _updated_of(item) -> datetime:
+    return getattr(item, "updated", None) or item.created
+
+
+def _changed(items: Iterable[T], since: Optional[datetime]) -> List[T]:
+    if since is None:
+        return list(items)
+    return [item for item in items if _updated_of(item) >= since]
+
+
+def _issues_resource(project_ids: Optional[List[int]]) -> str:
+    if project_ids is None:
+        return "issues"
+    return "issues/" + ",".join(str(project_id) for project_id in project_ids)
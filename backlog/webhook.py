@@ -0,0 +1,361 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Webhook receiver module."""
+
+import asyncio
+import hmac
+import json
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from io import BytesIO
+from typing import (Any, Callable, Iterable, Iterator, List, Optional, Set,
+                    Tuple, Union)
+from urllib.parse import parse_qs
+from wsgiref.util import setup_testing_defaults
+
+from .activity import ChangeEvent, to_change_events
+from .models import (Activity, Comment, Issue, SharedFile, User, Version,
+                     Wiki)
+
+_STATUSES = {
+    200: "200 OK",
+    400: "400 Bad Request",
+    403: "403 Forbidden",
+    405: "405 Method Not Allowed",
+}
+
+
+@dataclass
+class WebhookEvent(object):
+    """Notification received by webhook."""
+
+    activity: Activity
+    changes: List[ChangeEvent]
+
+
+class WebhookReceiver(object):
+    """Receiver of Backlog webhooks usable as WSGI and ASGI application.
+
+    Each payload is parsed into Activity and its change events,
+    the responses cached by the clients for the changed entities are
+    invalidated, and the event is put into every subscribed queue.
+
+    Backlog does not sign webhooks, so a secret token can be given
+    in the query string of the webhook URL, e.g. "/backlog?token=secret".
+
+    ``receiver`` is the WSGI application and ``receiver.asgi``
+    is the ASGI application.
+    """
+
+    def __init__(
+            self,
+            clients: Iterable[Any] = (),
+            caches: Iterable[Any] = (),
+            token: Optional[str] = None):
+        """__init__ method.
+
+        :param clients: BacklogApi or AsyncBacklogApi instances
+            whose cache and http_cache are invalidated
+        :param caches: other caches having invalidate(pattern)
+        :param token: token required in the query string. None means
+            any request is accepted
+        """
+        self.caches = list(caches)
+        for client in clients:
+            for cache in (client.cache, client.http_cache):
+                if cache is not None:
+                    self.caches.append(cache)
+        self.token = token
+        self.received = 0
+        self.invalidated = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._queues: List[queue.Queue] = []
+        self._async_queues: List[
+            Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+
+    def subscribe(self, maxsize: int = 0) -> "queue.Queue[WebhookEvent]":
+        """Create a queue receiving following events.
+
+        Events are dropped instead of blocking the receiver
+        while the queue is full.
+
+        :param maxsize: maximum number of events in the queue.
+            0 means unlimited
+        :return: queue of events
+        """
+        subscription: queue.Queue = queue.Queue(maxsize)
+        with self._lock:
+            self._queues.append(subscription)
+        return subscription
+
+    def subscribe_async(
+            self, maxsize: int = 0) -> "asyncio.Queue[WebhookEvent]":
+        """Create a queue receiving following events in the running loop.
+
+        :param maxsize: maximum number of events in the queue.
+            0 means unlimited
+        :return: asynchronous queue of events
+        """
+        loop = asyncio.get_running_loop()
+        subscription: asyncio.Queue = asyncio.Queue(maxsize)
+        with self._lock:
+            self._async_queues.append((loop, subscription))
+        return subscription
+
+    def unsubscribe(self, subscription: Union[queue.Queue, asyncio.Queue]):
+        """Stop putting events into the queue.
+
+        :param subscription: queue created by subscribe()
+            or subscribe_async()
+        """
+        with self._lock:
+            self._queues = [q for q in self._queues if q is not subscription]
+            self._async_queues = [(loop, q) for loop, q in self._async_queues
+                                  if q is not subscription]
+
+    def handle(self, body: Union[bytes, str, dict]) -> WebhookEvent:
+        """Handle a payload of webhook.
+
+        :param body: payload of the request
+        :raises ValueError: when the payload is not activity
+        :return: received event
+        """
+        try:
+            data = body if isinstance(body, dict) else json.loads(body)
+            if not isinstance(data, dict):
+                raise ValueError("JSON object is expected.")
+            activity = Activity.from_dict(data)
+            event = WebhookEvent(activity, to_change_events(activity))
+            patterns = invalidation_patterns(event)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid webhook payload. {e!r}") from e
+
+        invalidated = 0
+        for pattern in patterns:
+            for cache in self.caches:
+                invalidated += cache.invalidate(pattern)
+        with self._lock:
+            self.received += 1
+            self.invalidated += invalidated
+            queues = list(self._queues)
+            async_queues = list(self._async_queues)
+        for subscription in queues:
+            self._put(subscription.put_nowait, event)
+        for loop, async_subscription in async_queues:
+            if loop.is_closed():
+                self.unsubscribe(async_subscription)
+                continue
+            loop.call_soon_threadsafe(
+                self._put, async_subscription.put_nowait, event)
+        return event
+
+    def __call__(
+            self,
+            environ: dict,
+            start_response: Callable[..., Any]) -> List[bytes]:
+        """WSGI application."""
+        query = environ.get("QUERY_STRING", "")
+        if environ.get("REQUEST_METHOD") != "POST":
+            status = 405
+        elif not self._is_authorized(query):
+            status = 403
+        else:
+            try:
+                length = int(environ.get("CONTENT_LENGTH") or 0)
+                if length < 0:
+                    raise ValueError("Content-Length must not be negative.")
+            except ValueError:
+                status = 400
+            else:
+                status = self._receive(environ["wsgi.input"].read(length))
+        start_response(_STATUSES[status], [("Content-Type", "text/plain")])
+        return [_STATUSES[status].encode()]
+
+    async def asgi(
+            self,
+            scope: dict,
+            receive: Callable[[], Any],
+            send: Callable[[dict], Any]):
+        """ASGI application."""
+        if scope["type"] != "http":
+            return
+        query = scope.get("query_string", b"").decode("latin-1")
+        if scope["method"] != "POST":
+            status = 405
+        elif not self._is_authorized(query):
+            status = 403
+        else:
+            chunks = []
+            more_body = True
+            while more_body:
+                message = await receive()
+                chunks.append(message.get("body", b""))
+                more_body = message.get("more_body", False)
+            status = self._receive(b"".join(chunks))
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"text/plain")],
+        })
+        await send({
+            "type": "http.response.body",
+            "body": _STATUSES[status].encode(),
+        })
+
+    def _is_authorized(self, query: str) -> bool:
+        if self.token is None:
+            return True
+        tokens = parse_qs(query).get("token", [""])
+        return hmac.compare_digest(tokens[0], self.token)
+
+    def _receive(self, body: bytes) -> int:
+        try:
+            self.handle(body)
+        except ValueError:
+            return 400
+        return 200
+
+    def _put(self, put: Callable[[WebhookEvent], None], event: WebhookEvent):
+        try:
+            put(event)
+        except (queue.Full, asyncio.QueueFull):
+            with self._lock:
+                self.dropped += 1
+
+
+def invalidation_patterns(event: WebhookEvent) -> Set[str]:
+    """Get path patterns of responses made stale by the event.
+
+    :param event: received event
+    :return: shell-style wildcards of the paths
+    """
+    project = event.activity.project
+    projects = [str(project.id), project.project_key] if project else ["*"]
+    patterns = {
+        "space/activities*",
+        f"users/{event.activity.created_user.id}/activities*",
+    }
+    for key in projects:
+        patterns.add(f"projects/{key}/activities*")
+
+    for change in event.changes:
+        if change.model is None:
+            continue
+        patterns.update(_PATTERNS[change.model](change, projects))
+    return patterns
+
+
+def _issue_patterns(change: ChangeEvent, projects: List[str]) -> List[str]:
+    issues = [str(change.id)]
+    if change.issue_key is not None:
+        issues.append(change.issue_key)
+    patterns = ["issues", "issues/count"]
+    for issue in issues:
+        patterns.append(f"issues/{issue}")
+        patterns.append(f"issues/{issue}/*")
+    return patterns
+
+
+def _comment_patterns(change: ChangeEvent, projects: List[str]) -> List[str]:
+    return _issue_patterns(
+        ChangeEvent(change.activity, Issue, change.action, change.parent_id,
+                    key_id=change.key_id),
+        projects)
+
+
+def _wiki_patterns(change: ChangeEvent, projects: List[str]) -> List[str]:
+    return ["wikis", "wikis/count",
+            f"wikis/{change.id}", f"wikis/{change.id}/*"]
+
+
+def _file_patterns(change: ChangeEvent, projects: List[str]) -> List[str]:
+    return ["wikis/*/sharedFiles"] + [
+        f"projects/{key}/files/*" for key in projects]
+
+
+def _user_patterns(change: ChangeEvent, projects: List[str]) -> List[str]:
+    return [f"projects/{key}/users" for key in projects] + [
+        f"projects/{key}/administrators" for key in projects]
+
+
+def _version_patterns(change: ChangeEvent, projects: List[str]) -> List[str]:
+    return [f"projects/{key}/versions" for key in projects]
+
+
+_PATTERNS = {
+    Issue: _issue_patterns,
+    Comment: _comment_patterns,
+    Wiki: _wiki_patterns,
+    SharedFile: _file_patterns,
+    User: _user_patterns,
+    Version: _version_patterns,
+}
+
+
+def load_payloads(path: str) -> Iterator[bytes]:
+    """Load recorded payloads of webhooks.
+
+    :param path: JSON Lines file with a payload per line,
+        or directory of JSON files with a payload each read in name order
+    :return: iterator of payloads
+    """
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".json"):
+                with open(os.path.join(path, name), "rb") as f:
+                    yield f.read()
+        return
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield line.strip()
+
+
+def replay(
+        app: Callable[..., Iterable[bytes]],
+        payloads: Iterable[Union[bytes, dict]],
+        path: str = "/",
+        query: str = "") -> List[int]:
+    """Replay payloads of webhooks to WSGI application.
+
+    e.g. ``replay(receiver, load_payloads("recorded.jsonl"))``
+    tests subscribers locally without Backlog.
+
+    :param app: WSGI application such as WebhookReceiver
+    :param payloads: payloads, e.g. from load_payloads()
+    :param path: path of the requests
+    :param query: query string of the requests, e.g. "token=secret"
+    :return: status codes of the responses
+    """
+    statuses = []
+    for payload in payloads:
+        body = json.dumps(payload).encode() \
+            if isinstance(payload, dict) else payload
+        environ: dict = {
+            "REQUEST_METHOD": "POST",
+            "PATH_INFO": path,
+            "QUERY_STRING": query,
+            "CONTENT_TYPE": "application/json",
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.input": BytesIO(body),
+        }
+        setup_testing_defaults(environ)
+        status: List[str] = []
+        app(environ, lambda s, headers, exc_info=None: status.append(s))
+        statuses.append(int(status[0].split()[0]))
+    return statuses
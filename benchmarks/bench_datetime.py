@@ -0,0 +1,60 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of datetime parsing.
+
+Usage::
+
+    $ PYTHONPATH=. python benchmarks/bench_datetime.py
+"""
+
+import random
+import timeit
+from datetime import datetime, timedelta
+
+from backlog.models.base import (DATETIME_FORMAT, _parse_naive_datetime,
+                                 parse_datetime)
+
+NUMBER = 100000
+
+
+def make_values(distinct: int):
+    start = datetime(2013, 1, 1)
+    values = [(start + timedelta(seconds=random.randrange(10 ** 8)))
+              .strftime(DATETIME_FORMAT) for _ in range(distinct)]
+    return [random.choice(values) for _ in range(NUMBER)]
+
+
+def bench(name: str, values: list):
+    strptime = timeit.timeit(
+        lambda: [datetime.strptime(v, DATETIME_FORMAT) for v in values],
+        number=1)
+    _parse_naive_datetime.cache_clear()
+    fast = timeit.timeit(
+        lambda: [parse_datetime(v) for v in values], number=1)
+    print(f"{name:<24}"
+          f"strptime: {NUMBER / strptime:>12,.0f}/s  "
+          f"parse_datetime: {NUMBER / fast:>12,.0f}/s  "
+          f"({strptime / fast:.1f}x)")
+
+
+def main():
+    random.seed(0)
+    bench("all distinct", make_values(NUMBER))
+    bench("1000 distinct", make_values(1000))
+    bench("10 distinct", make_values(10))
+
+
+if __name__ == "__main__":
+    main()
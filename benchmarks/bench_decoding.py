@@ -0,0 +1,69 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of compiled model decoders against handwritten from_dict.
+
+Usage::
+
+    $ PYTHONPATH=. python benchmarks/bench_decoding.py
+"""
+
+import timeit
+
+from backlog.models import Comment, User, Wiki
+from backlog.models.base import get_decoder
+
+from bench_serialization import USER, make_comment
+
+NUMBER = 20000
+
+
+def make_wiki(wiki_id: int) -> dict:
+    return {
+        "id": wiki_id,
+        "projectId": 1,
+        "name": f"page {wiki_id}",
+        "content": "text",
+        "tags": [{"id": 12, "name": "proceedings"}],
+        "attachments": [],
+        "sharedFiles": [],
+        "stars": [],
+        "createdUser": USER,
+        "created": "2012-07-23T06:09:48Z",
+        "updatedUser": USER,
+        "updated": "2012-07-23T06:09:48Z",
+    }
+
+
+def bench(model, items: list):
+    from_dict = model.from_dict
+    decode = get_decoder(model)
+    handwritten = min(timeit.repeat(
+        lambda: [from_dict(item) for item in items], number=1, repeat=3))
+    compiled = min(timeit.repeat(
+        lambda: [decode(item) for item in items], number=1, repeat=3))
+    print(f"{model.__name__:<12}"
+          f"from_dict: {NUMBER / handwritten:>10,.0f}/s  "
+          f"compiled: {NUMBER / compiled:>10,.0f}/s  "
+          f"({handwritten / compiled:.1f}x)")
+
+
+def main():
+    bench(User, [dict(USER, id=i) for i in range(NUMBER)])
+    bench(Comment, [make_comment(i) for i in range(NUMBER)])
+    bench(Wiki, [make_wiki(i) for i in range(NUMBER)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of JSON backends decoding a response body.
+
+Usage::
+
+    $ PYTHONPATH=. python benchmarks/bench_json.py
+"""
+
+import json
+import timeit
+
+from backlog.json_backend import BACKENDS
+
+from bench_serialization import make_comment
+
+NUMBER = 20000
+
+
+def main():
+    body = json.dumps([make_comment(i) for i in range(NUMBER)]).encode()
+    print(f"body: {len(body) / 1024 / 1024:.1f} MiB")
+    baseline = None
+    for name, backend in BACKENDS.items():
+        elapsed = min(timeit.repeat(
+            lambda: backend.loads(body), number=1, repeat=5))
+        baseline = baseline or elapsed
+        print(f"{name:<12}{elapsed * 1000:>8.1f} ms  "
+              f"({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
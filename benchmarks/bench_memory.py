@@ -0,0 +1,75 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of memory used by models.
+
+Each model is compared with an equivalent dataclass
+having per-instance __dict__, which is how models were defined before.
+
+Usage::
+
+    $ PYTHONPATH=. python benchmarks/bench_memory.py
+"""
+
+import tracemalloc
+from dataclasses import dataclass, fields
+from datetime import datetime
+
+from backlog.models import ChangeLog, Comment, Star, User
+
+NUMBER = 100000
+
+
+def unslotted(cls):
+    return dataclass(type(cls.__name__, (), {
+        "__annotations__": {f.name: f.type for f in fields(cls)},
+    }))
+
+
+def measure(cls, values: dict) -> int:
+    tracemalloc.start()
+    objects = [cls(**values) for _ in range(NUMBER)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def bench(cls, values: dict):
+    old = measure(unslotted(cls), values)
+    new = measure(cls, values)
+    print(f"{cls.__name__:<12}"
+          f"__dict__: {old / NUMBER:>7.1f} B/object  "
+          f"__slots__: {new / NUMBER:>7.1f} B/object  "
+          f"({(1 - new / old) * 100:.0f}% smaller)")
+
+
+def main():
+    user = User(id=1, user_id="admin", name="admin", role_type=1, lang="ja",
+                mail_address="eguchi@nulab.example", nulab_account=None,
+                keyword=None)
+    created = datetime(2014, 1, 23, 10, 55, 19)
+
+    bench(Star, {"id": 1, "comment": None, "url": "https://xx.backlogtool.com",
+                 "title": "title", "presenter": user, "created": created})
+    bench(Comment, {"id": 1, "content": "content", "change_log": [],
+                    "created_user": user, "created": created,
+                    "updated": created, "stars": [], "notifications": []})
+    bench(ChangeLog, {"field": "status", "new_value": "2",
+                      "original_value": "1", "attachment_info": None,
+                      "attribute_info": None, "notification_info": None})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of model serialization.
+
+Usage::
+
+    $ PYTHONPATH=. python benchmarks/bench_serialization.py
+"""
+
+import io
+import json
+import timeit
+from dataclasses import fields
+
+from backlog.models import Comment, dumps_many
+from backlog.models.base import _dumps_json
+
+NUMBER = 50000
+
+USER = {
+    "id": 1,
+    "userId": "admin",
+    "name": "admin",
+    "roleType": 1,
+    "lang": "ja",
+    "mailAddress": "eguchi@nulab.example",
+}
+
+
+def make_comment(comment_id: int) -> dict:
+    return {
+        "id": comment_id,
+        "content": f"comment {comment_id}",
+        "changeLog": [{"field": "status",
+                       "newValue": "2",
+                       "originalValue": "1",
+                       "attachmentInfo": None,
+                       "attributeInfo": None,
+                       "notificationInfo": None}],
+        "createdUser": USER,
+        "created": "2013-08-05T06:15:06Z",
+        "updated": "2013-08-05T06:15:06Z",
+        "stars": [],
+        "notifications": [],
+    }
+
+
+def legacy_to_dict(model) -> dict:
+    """to_dict() before field plans were introduced."""
+    data = {}
+    for field in fields(model):
+        key = field.name
+        value = getattr(model, key)
+        if isinstance(value, (list, tuple, set)):
+            data[key] = []
+            for item in value:
+                if hasattr(item, "to_dict"):
+                    data[key].append(legacy_to_dict(item))
+                else:
+                    data[key].append(item)
+        elif hasattr(value, "to_dict"):
+            data[key] = legacy_to_dict(value)
+        elif value is not None:
+            data[key] = value
+    return data
+
+
+def legacy_to_json_string(model) -> str:
+    return json.dumps(
+        legacy_to_dict(model),
+        ensure_ascii=False,
+        default=model._convert_value)
+
+
+def bench(name: str, func, baseline: float = None) -> float:
+    elapsed = timeit.timeit(func, number=1)
+    ratio = f"  ({baseline / elapsed:.1f}x)" if baseline else ""
+    print(f"{name:<32}{NUMBER / elapsed:>12,.0f}/s{ratio}")
+    return elapsed
+
+
+def main():
+    comments = [Comment.from_dict(make_comment(i)) for i in range(NUMBER)]
+
+    baseline = bench(
+        "legacy to_dict", lambda: [legacy_to_dict(c) for c in comments])
+    bench("to_dict", lambda: [c.to_dict() for c in comments], baseline)
+
+    baseline = bench(
+        "legacy to_json_string",
+        lambda: [legacy_to_json_string(c) for c in comments])
+    bench("to_json_string",
+          lambda: [c.to_json_string() for c in comments], baseline)
+    bench("dumps_many (json)",
+          lambda: dumps_many(comments, io.StringIO(), dumps=_dumps_json),
+          baseline)
+    bench("dumps_many (default)",
+          lambda: dumps_many(comments, io.StringIO()), baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,11 @@ setup(
     install_requires=[
         "requests>=2.0"
     ],
+    extras_require={
+        "async": ["httpx>=0.23"],
+        "orjson": ["orjson>=3.0"],
+        "msgspec": ["msgspec>=0.9"],
+    },
     classifiers=[
         "Topic :: Software Development",
         "Development Status :: 7 - Inactive",
@@ -11,3 +11,143 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+
+"""Fixtures shared by API tests."""
+
+import json
+from urllib.parse import parse_qs, urlparse
+
+PROJECT = {
+    "id": 1,
+    "projectKey": "TEST",
+    "name": "test",
+    "chartEnabled": False,
+    "subtaskingEnabled": False,
+    "projectLeaderCanEditProjectLeader": False,
+    "useWikiTreeView": True,
+    "textFormattingRule": "markdown",
+    "archived": False,
+    "displayOrder": 0,
+    "useDevAttributes": True,
+}
+
+
+USER = {
+    "id": 1,
+    "userId": "admin",
+    "name": "admin",
+    "roleType": 1,
+    "lang": "ja",
+    "mailAddress": "eguchi@nulab.example",
+}
+
+
+def comment(comment_id: int) -> dict:
+    return {
+        "id": comment_id,
+        "content": f"comment {comment_id}",
+        "changeLog": [],
+        "createdUser": USER,
+        "created": "2013-08-05T06:15:06Z",
+        "updated": "2013-08-05T06:15:06Z",
+        "stars": [],
+        "notifications": [],
+    }
+
+
+def star(star_id: int) -> dict:
+    return {
+        "id": star_id,
+        "comment": None,
+        "url": "https://xx.backlogtool.com/view/BLG-1",
+        "title": "[BLG-1] first issue | Show issue - Backlog",
+        "presenter": USER,
+        "created": "2014-01-23T10:55:19Z",
+    }
+
+
+def paged_callback(items: list):
+    """Emulate paging of Backlog. minId and maxId are inclusive."""
+    def callback(request):
+        query = {k: v[0] for k, v in parse_qs(urlparse(request.url).query)
+                 .items()}
+        ids = sorted(items, reverse=query.get("order") == "desc")
+        if "minId" in query:
+            ids = [i for i in ids if i >= int(query["minId"])]
+        if "maxId" in query:
+            ids = [i for i in ids if i <= int(query["maxId"])]
+        ids = ids[:int(query.get("count", 20))]
+        return 200, {}, json.dumps([items[i] for i in ids])
+    return callback
+
+
+def issue(issue_id: int) -> dict:
+    return {
+        "id": issue_id,
+        "projectId": 1,
+        "issueKey": f"BLG-{issue_id}",
+        "keyId": issue_id,
+        "issueType": {"id": 2,
+                      "projectId": 1,
+                      "name": "Task",
+                      "color": "#7ea800",
+                      "displayOrder": 0},
+        "summary": "first issue",
+        "description": "",
+        "resolution": None,
+        "priority": {"id": 3, "name": "Normal"},
+        "status": {"id": 1,
+                   "projectId": 1,
+                   "name": "Open",
+                   "color": "#ed8077",
+                   "displayOrder": 1000},
+        "assignee": USER,
+        "category": [{"id": 12, "name": "Development", "displayOrder": 0}],
+        "versions": [],
+        "milestone": [{"id": 30,
+                       "projectId": 1,
+                       "name": "wait for release",
+                       "description": "",
+                       "startDate": None,
+                       "releaseDueDate": None,
+                       "archived": False,
+                       "displayOrder": 0}],
+        "startDate": None,
+        "dueDate": "2013-08-31T00:00:00Z",
+        "estimatedHours": None,
+        "actualHours": 1.5,
+        "parentIssueId": None,
+        "createdUser": USER,
+        "created": "2012-07-23T06:10:15Z",
+        "updatedUser": USER,
+        "updated": "2013-02-07T08:09:49Z",
+        "customFields": [],
+        "attachments": [{"id": 1,
+                         "name": "IMGP0088.JPG",
+                         "size": 85079,
+                         "createdUser": USER,
+                         "created": "2014-07-11T06:26:05Z"}],
+        "sharedFiles": [],
+        "stars": [],
+    }
+
+
+def query_of(request) -> dict:
+    return parse_qs(urlparse(request.url).query)
+
+
+def wiki(wiki_id: int, updated: str) -> dict:
+    return {
+        "id": wiki_id,
+        "projectId": 1,
+        "name": f"page {wiki_id}",
+        "content": None,
+        "tags": [],
+        "attachments": [],
+        "sharedFiles": [],
+        "stars": [],
+        "createdUser": USER,
+        "created": "2022-01-01T00:00:00Z",
+        "updatedUser": USER,
+        "updated": updated,
+    }
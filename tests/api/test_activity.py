@@ -0,0 +1,239 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+
+import httpx
+import responses
+
+from backlog import (ActivityFeed, AsyncBacklogApi, BacklogApi, ModelDecoder,
+                     SQLiteSyncStore, latest_changes, to_change_events)
+from backlog.models import (Activity, ActivityType, Comment, Issue, User,
+                            Wiki)
+
+from . import PROJECT, USER, paged_callback, query_of
+
+
+def activity(activity_id: int, type_id: int = 2, content: dict = None):
+    return {
+        "id": activity_id,
+        "project": PROJECT,
+        "type": type_id,
+        "content": content if content is not None else {
+            "id": activity_id * 10,
+            "key_id": activity_id,
+            "summary": "first issue",
+            "description": "",
+        },
+        "notifications": [],
+        "createdUser": USER,
+        "created": "2013-12-27T07:50:44Z",
+    }
+
+
+class TestActivity(unittest.TestCase):
+    def setUp(self):
+        self.tested = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+        )
+
+    @responses.activate
+    def test_get_space_activities(self):
+        responses.add(responses.GET,
+                      f"{self.tested.base_url}space/activities",
+                      json=[activity(1), activity(2, type_id=99)])
+
+        activities = self.tested.get_space_activities(
+            activity_types=[ActivityType.ISSUE_CREATED, 2],
+            min_id=1, max_id=5, count=10, order="asc")
+
+        self.assertEqual(query_of(responses.calls[0].request), {
+            "activityTypeId[]": ["1", "2"],
+            "minId": ["1"],
+            "maxId": ["5"],
+            "count": ["10"],
+            "order": ["asc"],
+            "apiKey": ["key"],
+        })
+        self.assertIsInstance(activities[0], Activity)
+        self.assertIs(activities[0].type, ActivityType.ISSUE_UPDATED)
+        self.assertEqual(activities[0].project.project_key, "TEST")
+        self.assertEqual(activities[0].content["key_id"], 1)
+        # types unknown to this library
+        self.assertIsNone(activities[1].type)
+
+    @responses.activate
+    def test_get_project_and_user_activities(self):
+        responses.add(responses.GET,
+                      f"{self.tested.base_url}projects/TEST/activities",
+                      json=[activity(1)])
+        responses.add(responses.GET,
+                      f"{self.tested.base_url}users/1/activities",
+                      json=[activity(2)])
+
+        self.assertEqual(
+            self.tested.get_project_activities("TEST")[0].id, 1)
+        self.assertEqual(self.tested.get_user_activities(1)[0].id, 2)
+
+    def test_invalid_params(self):
+        with self.assertRaises(ValueError):
+            self.tested.get_space_activities(count=101)
+        with self.assertRaises(ValueError):
+            self.tested.get_space_activities(order="up")
+
+    def test_async_get_space_activities(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=[activity(1)])
+
+        async def fetch():
+            async with httpx.AsyncClient(
+                    transport=httpx.MockTransport(handler)) as client:
+                api = AsyncBacklogApi(space_key="test",
+                                      space_type="jp",
+                                      api_key="key",
+                                      client=client)
+                return await api.get_space_activities()
+
+        activities = asyncio.run(fetch())
+
+        self.assertIs(activities[0].type, ActivityType.ISSUE_UPDATED)
+
+
+class TestChangeEvents(unittest.TestCase):
+    def to_events(self, data: dict) -> list:
+        return to_change_events(Activity.from_dict(data))
+
+    def test_issue(self):
+        events = self.to_events(activity(1, type_id=1))
+
+        self.assertEqual(len(events), 1)
+        self.assertIs(events[0].model, Issue)
+        self.assertEqual(events[0].action, "created")
+        self.assertEqual(events[0].id, 10)
+        self.assertEqual(events[0].project_id, 1)
+
+    def test_comment(self):
+        events = self.to_events(activity(1, type_id=3, content={
+            "id": 10, "key_id": 1, "comment": {"id": 7, "content": "hi"}}))
+
+        self.assertIs(events[0].model, Comment)
+        self.assertEqual((events[0].id, events[0].parent_id), (7, 10))
+        self.assertEqual(events[0].key_id, 1)
+
+    def test_multiple_entities(self):
+        issues = self.to_events(activity(1, type_id=14, content={
+            "tx_id": 1, "link": [{"id": 10, "key_id": 1},
+                                 {"id": 11, "key_id": 2}]}))
+        users = self.to_events(activity(2, type_id=16, content={
+            "users": [USER]}))
+
+        self.assertEqual([e.id for e in issues], [10, 11])
+        self.assertEqual([e.key_id for e in issues], [1, 2])
+        self.assertEqual([(e.model, e.action, e.id, e.parent_id)
+                          for e in users], [(User, "removed", 1, 1)])
+
+    def test_entity_without_model(self):
+        events = self.to_events(activity(1, type_id=18, content={"id": 5}))
+
+        self.assertIsNone(events[0].model)
+        self.assertEqual(events[0].id, 5)
+
+    def test_latest_changes(self):
+        events = [event for data in (
+            activity(1, type_id=5, content={"id": 1}),
+            activity(2, type_id=6, content={"id": 1}),
+            activity(3, type_id=5, content={"id": 2}),
+            activity(4, type_id=12, content={}),
+        ) for event in self.to_events(data)]
+
+        changes = latest_changes(events)
+
+        self.assertEqual(
+            {key: event.action for key, event in changes.items()},
+            {(Wiki, 1): "updated", (Wiki, 2): "created"})
+
+
+class TestActivityFeed(unittest.TestCase):
+    def setUp(self):
+        self.api = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+        )
+        self.store = SQLiteSyncStore(":memory:")
+        self.url = f"{self.api.base_url}space/activities"
+
+    def tearDown(self):
+        self.store.close()
+
+    @responses.activate
+    def test_resume_from_cursor(self):
+        items = {i: activity(i) for i in range(1, 6)}
+        responses.add_callback(
+            responses.GET, self.url, callback=paged_callback(items))
+
+        first = ActivityFeed(self.api, self.store, count=2)
+        first_ids = [a.id for a in first.iter_activities()]
+        items.update({i: activity(i) for i in (6, 7)})
+        second = ActivityFeed(self.api, self.store, count=2)
+        second_ids = [e.activity.id for e in second.iter_events()]
+
+        self.assertEqual(first_ids, [1, 2, 3, 4, 5])
+        self.assertEqual(second_ids, [6, 7])
+        self.assertEqual(query_of(responses.calls[5].request)["minId"],
+                         ["5"])
+        self.assertEqual(self.store.get_cursor("space/activities"), 7)
+
+    @responses.activate
+    def test_cursor_is_stored_when_exhausted(self):
+        items = {i: activity(i) for i in range(1, 4)}
+        responses.add_callback(
+            responses.GET, self.url, callback=paged_callback(items))
+
+        feed = ActivityFeed(self.api, self.store)
+        next(feed.iter_activities())
+
+        self.assertEqual(feed.last_id, 1)
+        self.assertIsNone(self.store.get_cursor("space/activities"))
+
+    @responses.activate
+    def test_filtered_feed(self):
+        responses.add(
+            responses.GET,
+            f"{self.api.base_url}projects/TEST/activities",
+            json=[activity(1, type_id=5, content={"id": 1})])
+
+        feed = ActivityFeed(self.api,
+                            self.store,
+                            project_id_or_key="TEST",
+                            activity_types=[ActivityType.WIKI_CREATED])
+        events = list(feed.iter_events())
+
+        self.assertEqual(query_of(responses.calls[0].request)
+                         ["activityTypeId[]"], ["5"])
+        self.assertIs(events[0].model, Wiki)
+        self.assertEqual(
+            self.store.get_cursor("projects/TEST/activities?types=5"), 1)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ActivityFeed(self.api, project_id_or_key="TEST", user_id=1)
+        with self.assertRaises(ValueError):
+            ActivityFeed(self.api, count=0)
+        with self.assertRaises(ValueError):
+            ActivityFeed(
+                self.api.with_decoder(ModelDecoder(output="raw")))
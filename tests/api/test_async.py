@@ -0,0 +1,177 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import unittest
+
+import httpx
+
+from backlog import AsyncBacklogApi, BacklogApi
+from backlog.models import Priority, User
+
+
+class TestAsyncBacklogApi(unittest.TestCase):
+    def setUp(self):
+        self.requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            if request.url.path == "/api/v2/users/1":
+                return httpx.Response(200, json={
+                    "id": 1,
+                    "userId": "admin",
+                    "name": "admin",
+                    "roleType": 1,
+                    "lang": "ja",
+                    "mailAddress": "eguchi@nulab.example",
+                })
+            if request.url.path == "/api/v2/users/1/stars":
+                max_id = int(request.url.params.get("maxId", 3))
+                return httpx.Response(200, json=[{
+                    "id": star_id,
+                    "comment": None,
+                    "url": "https://xx.backlogtool.com/view/BLG-1",
+                    "title": "[BLG-1] first issue | Show issue - Backlog",
+                    "presenter": {
+                        "id": 1,
+                        "userId": "admin",
+                        "name": "admin",
+                        "roleType": 1,
+                        "lang": "ja",
+                        "mailAddress": "eguchi@nulab.example",
+                    },
+                    "created": "2014-01-23T10:55:19Z",
+                } for star_id in range(max_id, max(max_id - 2, 0), -1)])
+            if request.url.path == "/api/v2/users":
+                return httpx.Response(200, content=b"[" + b",".join(
+                    json.dumps({
+                        "id": user_id,
+                        "userId": "admin",
+                        "name": "admin",
+                        "roleType": 1,
+                        "lang": "ja",
+                        "mailAddress": "eguchi@nulab.example",
+                    }).encode() for user_id in (1, 2)) + b"]")
+            if request.url.path == "/api/v2/priorities":
+                return httpx.Response(200, json=[
+                    {"id": 2, "name": "High"},
+                    {"id": 3, "name": "Normal"},
+                ])
+            return httpx.Response(200, json={"count": 3})
+
+        self.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler))
+        self.tested = AsyncBacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+            client=self.client,
+        )
+
+    def tearDown(self):
+        asyncio.run(self.client.aclose())
+
+    def test_has_same_methods_as_backlog_api(self):
+        sync_methods = {name for name in dir(BacklogApi)
+                        if name.startswith(("get_", "iter_"))}
+        async_methods = {name for name in dir(AsyncBacklogApi)
+                         if name.startswith(("get_", "iter_"))}
+
+        self.assertEqual(sync_methods, async_methods)
+
+    def test_get_user(self):
+        user = asyncio.run(self.tested.get_user(1))
+
+        request = self.requests[0]
+        self.assertEqual(request.method, "GET")
+        self.assertEqual(
+            str(request.url),
+            f"{self.tested.base_url}users/1?apiKey=key")
+        self.assertIsInstance(user, User)
+        self.assertEqual(user.id, 1)
+
+    def test_get_priorities(self):
+        priorities = asyncio.run(self.tested.get_priorities())
+
+        self.assertEqual(priorities, [Priority.HIGH, Priority.NORMAL])
+
+    def test_get_number_of_wikis(self):
+        count = asyncio.run(self.tested.get_number_of_wikis("TEST"))
+
+        self.assertEqual(
+            str(self.requests[0].url),
+            f"{self.tested.base_url}wikis/count"
+            "?projectIdOrKey=TEST&apiKey=key")
+        self.assertEqual(count, 3)
+
+    def test_concurrent_requests(self):
+        async def fetch():
+            return await asyncio.gather(
+                *[self.tested.get_user(1) for _ in range(10)])
+
+        users = asyncio.run(fetch())
+
+        self.assertEqual(len(users), 10)
+        self.assertEqual(len(self.requests), 10)
+
+    def test_get_users_bulk(self):
+        results = asyncio.run(
+            self.tested.get_users_bulk([1, 1], max_concurrency=1))
+
+        self.assertEqual([r.key for r in results], [1, 1])
+        self.assertTrue(all(isinstance(r.value, User) for r in results))
+
+    def test_iter_user_received_stars(self):
+        async def collect():
+            return [star.id async for star
+                    in self.tested.iter_user_received_stars(1, count=2)]
+
+        self.assertEqual(asyncio.run(collect()), [3, 2, 1])
+        self.assertEqual(len(self.requests), 3)
+
+    def test_iter_users(self):
+        async def collect():
+            return [user.id async for user in self.tested.iter_users()]
+
+        self.assertEqual(asyncio.run(collect()), [1, 2])
+
+    def test_close_external_client(self):
+        async def use():
+            async with self.tested:
+                pass
+            return self.client.is_closed
+
+        self.assertFalse(asyncio.run(use()))
+
+    def test_close_owned_client(self):
+        async def use():
+            async with AsyncBacklogApi(
+                    space_key="test",
+                    space_type="jp",
+                    api_key="key",
+                    max_connections=5) as api:
+                client = api.client
+            return client.is_closed
+
+        self.assertTrue(asyncio.run(use()))
+
+    def test_max_connections_is_invalid(self):
+        with self.assertRaises(ValueError):
+            AsyncBacklogApi(
+                space_key="test",
+                space_type="jp",
+                api_key="key",
+                max_connections=0,
+            )
@@ -0,0 +1,87 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import requests
+import responses
+
+from backlog import BacklogApi
+from backlog.bulk import run_bulk
+
+
+def user(user_id: int) -> dict:
+    return {
+        "id": user_id,
+        "userId": f"user{user_id}",
+        "name": f"user{user_id}",
+        "roleType": 2,
+        "lang": "ja",
+        "mailAddress": f"user{user_id}@nulab.example",
+    }
+
+
+class TestBulk(unittest.TestCase):
+    def setUp(self):
+        self.tested = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+            max_workers=4,
+        )
+
+    @responses.activate
+    def test_get_users_bulk(self):
+        for user_id in range(1, 11):
+            responses.add(responses.GET,
+                          f"{self.tested.base_url}users/{user_id}",
+                          json=user(user_id),
+                          status=200)
+        responses.add(responses.GET,
+                      f"{self.tested.base_url}users/99",
+                      body=requests.ConnectionError("connection refused"))
+
+        results = self.tested.get_users_bulk([*range(10, 0, -1), 99])
+
+        self.assertEqual(len(responses.calls), 11)
+        self.assertEqual([r.key for r in results], [*range(10, 0, -1), 99])
+        self.assertEqual([r.value.id for r in results[:10]],
+                         list(range(10, 0, -1)))
+        self.assertTrue(all(r.ok for r in results[:10]))
+        self.assertFalse(results[10].ok)
+        self.assertIsNone(results[10].value)
+        self.assertIsInstance(results[10].error, requests.ConnectionError)
+
+    @responses.activate
+    def test_get_wiki_attachments_bulk(self):
+        for wiki_id in (1, 2):
+            responses.add(responses.GET,
+                          f"{self.tested.base_url}wikis/{wiki_id}/attachments",
+                          json=[{"id": wiki_id,
+                                 "name": "test.json",
+                                 "size": 8857,
+                                 "createdUser": user(1),
+                                 "created": "2014-01-06T11:10:45Z"}],
+                          status=200)
+
+        results = self.tested.get_wiki_attachments_bulk([2, 1], max_workers=1)
+
+        self.assertEqual([r.value[0].id for r in results], [2, 1])
+
+    def test_get_wikis_bulk_with_no_ids(self):
+        self.assertEqual(self.tested.get_wikis_bulk([]), [])
+
+    def test_max_workers_is_invalid(self):
+        with self.assertRaises(ValueError):
+            run_bulk(str, [1], max_workers=0)
@@ -0,0 +1,124 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import responses
+
+from backlog import BacklogApi, ResponseCache
+from backlog.models import Priority
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.tested = ResponseCache(
+            maxsize=2,
+            ttls={"a": 10.0, "projects/*/statuses": 20.0},
+            clock=self.clock,
+        )
+
+    def test_get_ttl(self):
+        self.assertEqual(self.tested.get_ttl("a"), 10.0)
+        self.assertEqual(self.tested.get_ttl("projects/TEST/statuses"), 20.0)
+        self.assertIsNone(self.tested.get_ttl("projects/TEST/users"))
+
+    def test_expire(self):
+        self.tested.set("key", 1, 10.0)
+        self.assertEqual(self.tested.get("key"), (True, 1))
+
+        self.clock.now = 10.0
+
+        self.assertEqual(self.tested.get("key"), (False, None))
+        self.assertEqual((self.tested.hits, self.tested.misses), (1, 1))
+
+    def test_evict_least_recently_used(self):
+        first = ResponseCache.make_key("url", "first", {})
+        second = ResponseCache.make_key("url", "second", {})
+        third = ResponseCache.make_key("url", "third", {})
+        self.tested.set(first, 1, 10.0)
+        self.tested.set(second, 2, 10.0)
+        self.tested.get(first)
+        self.tested.set(third, 3, 10.0)
+
+        self.assertEqual(self.tested.get(second), (False, None))
+        self.assertEqual(self.tested.get(first), (True, 1))
+        self.assertEqual(self.tested.evictions, 1)
+
+    def test_invalidate(self):
+        self.tested.set(ResponseCache.make_key("url", "space", {}), 1, 10.0)
+        self.tested.set(
+            ResponseCache.make_key("url", "projects/A/statuses", {}), 2, 10.0)
+
+        self.assertEqual(self.tested.invalidate("projects/*"), 1)
+        self.assertEqual(len(self.tested), 1)
+
+    def test_make_key_ignores_param_order(self):
+        self.assertEqual(
+            ResponseCache.make_key("url", "wikis", {"a": 1, "b": "x"}),
+            ResponseCache.make_key("url", "wikis", {"b": "x", "a": "1"}))
+
+
+class TestBacklogApiCache(unittest.TestCase):
+    def setUp(self):
+        self.tested = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+            cache=ResponseCache(),
+        )
+
+    @responses.activate
+    def test_reference_data_is_cached(self):
+        responses.add(
+            responses.GET,
+            f"{self.tested.base_url}priorities",
+            json=[{"id": 2, "name": "High"}],
+            status=200)
+
+        first = self.tested.get_priorities()
+        second = self.tested.get_priorities()
+
+        self.assertEqual(first, [Priority.HIGH])
+        self.assertEqual(second, [Priority.HIGH])
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(self.tested.cache.hits, 1)
+        self.assertEqual(self.tested.cache.misses, 1)
+
+        self.tested.cache.invalidate("priorities")
+        self.tested.get_priorities()
+
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_other_data_is_not_cached(self):
+        responses.add(
+            responses.GET,
+            f"{self.tested.base_url}users/1/stars/count",
+            json={"count": 1},
+            status=200)
+
+        self.tested.get_number_of_user_received_stars(1)
+        self.tested.get_number_of_user_received_stars(1)
+
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(len(self.tested.cache), 0)
@@ -0,0 +1,132 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+import unittest
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import responses
+
+from backlog import BacklogApi, ModelDecoder
+from backlog.models import RAISE, Comment, Issue, Priority, User
+
+from . import USER, comment, issue
+
+
+class RecordingExecutor(Executor):
+    def __init__(self):
+        self.tasks = 0
+
+    def map(self, func, *iterables, **kwargs):
+        results = []
+        for args in zip(*iterables):
+            self.tasks += 1
+            results.append(func(*args))
+        return iter(results)
+
+
+class TestDecodeExecutor(unittest.TestCase):
+    def setUp(self):
+        self.items = [comment(i) for i in range(1, 11)]
+
+    def test_decode_in_process_pool(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            decoder = ModelDecoder(
+                executor=executor, parallel_threshold=5, chunk_size=3)
+            comments = decoder.to_models(Comment, self.items)
+
+        self.assertEqual(comments, ModelDecoder().to_models(
+            Comment, self.items))
+        self.assertIs(comments[0].created_user, comments[2].created_user)
+
+    def test_enum_default_in_process_pool(self):
+        items = [dict(issue(i), priority={"id": 9, "name": "Urgent"})
+                 for i in range(1, 11)]
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            decoder = ModelDecoder(
+                executor=executor, parallel_threshold=5, chunk_size=3,
+                enum_default=Priority.LOW)
+            issues = decoder.to_models(Issue, items)
+            decoder.enum_default = RAISE
+            with self.assertRaises(ValueError):
+                decoder.to_models(Issue, items)
+
+        self.assertEqual({i.priority for i in issues}, {Priority.LOW})
+
+    def test_decode_below_threshold(self):
+        executor = RecordingExecutor()
+        decoder = ModelDecoder(
+            executor=executor, parallel_threshold=11, chunk_size=3)
+
+        decoder.to_models(Comment, self.items)
+
+        self.assertEqual(executor.tasks, 0)
+
+    def test_decode_in_chunks(self):
+        executor = RecordingExecutor()
+        decoder = ModelDecoder(
+            executor=executor, parallel_threshold=10, chunk_size=3)
+
+        comments = decoder.to_models(Comment, iter(self.items))
+
+        self.assertEqual(executor.tasks, 4)
+        self.assertEqual([c.id for c in comments], list(range(1, 11)))
+
+    def test_invalid_params(self):
+        with self.assertRaises(ValueError):
+            ModelDecoder(parallel_threshold=0)
+        with self.assertRaises(ValueError):
+            ModelDecoder(chunk_size=0)
+
+    @responses.activate
+    def test_get_issue_comments(self):
+        api = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+            decoder=ModelDecoder(
+                executor=RecordingExecutor(), parallel_threshold=5),
+        )
+        responses.add(responses.GET,
+                      f"{api.base_url}issues/1/comments",
+                      json=self.items)
+
+        comments = api.get_issue_comments(1)
+
+        self.assertEqual(len(comments), 10)
+        self.assertEqual(api.decoder.executor.tasks, 1)
+
+
+class TestCompactPickle(unittest.TestCase):
+    def test_pickle_values_of_fields(self):
+        user = User.from_dict(USER)
+        comment_ = Comment.from_dict(comment(1))
+
+        self.assertEqual(user.__reduce__(), (User, (
+            1, "admin", "admin", 1, "ja", "eguchi@nulab.example",
+            None, None)))
+        self.assertEqual(pickle.loads(pickle.dumps(comment_)), comment_)
+
+    def test_pickle_shared_user_once(self):
+        with_shared = ModelDecoder().to_models(
+            Comment, [comment(1), comment(2)])
+        without_shared = ModelDecoder(intern_users=False).to_models(
+            Comment, [comment(1), comment(2)])
+
+        loaded = pickle.loads(pickle.dumps(with_shared))
+
+        self.assertIs(loaded[0].created_user, loaded[1].created_user)
+        self.assertLess(len(pickle.dumps(with_shared)),
+                        len(pickle.dumps(without_shared)))
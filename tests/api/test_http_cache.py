@@ -0,0 +1,130 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+import httpx
+import responses
+
+from backlog import AsyncBacklogApi, BacklogApi, SQLiteHttpCache
+
+from . import PROJECT
+
+
+class TestSQLiteHttpCache(unittest.TestCase):
+    def setUp(self):
+        self.tested = SQLiteHttpCache(":memory:")
+
+    def tearDown(self):
+        self.tested.close()
+
+    def test_store_and_get(self):
+        stored = self.tested.store(
+            "key", "wikis/1", {"ETag": '"abc"'}, b"{}")
+        cached = self.tested.get("key")
+
+        self.assertTrue(stored)
+        self.assertEqual(cached.body, b"{}")
+        self.assertEqual(cached.to_conditional_headers(),
+                         {"If-None-Match": '"abc"'})
+
+    def test_response_without_validators_is_not_stored(self):
+        self.assertFalse(self.tested.store("key", "wikis/1", {}, b"{}"))
+        self.assertIsNone(self.tested.get("key"))
+
+    def test_invalidate(self):
+        self.tested.store("a", "wikis/1", {"ETag": "a"}, b"{}")
+        self.tested.store("b", "projects/1", {"ETag": "b"}, b"{}")
+
+        self.assertEqual(self.tested.invalidate("wikis/*"), 1)
+        self.assertIsNone(self.tested.get("a"))
+        self.assertIsNotNone(self.tested.get("b"))
+
+
+class TestBacklogApiHttpCache(unittest.TestCase):
+    @responses.activate
+    def test_conditional_request(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.sqlite3")
+            with SQLiteHttpCache(path) as cache:
+                api = BacklogApi(
+                    space_key="test",
+                    space_type="jp",
+                    api_key="key",
+                    http_cache=cache,
+                )
+                url = f"{api.base_url}projects/TEST"
+                responses.add(
+                    responses.GET, url, json=PROJECT, status=200,
+                    headers={"ETag": '"v1"',
+                             "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"})
+                api.get_project("TEST")
+
+            with SQLiteHttpCache(path) as cache:
+                api = BacklogApi(
+                    space_key="test",
+                    space_type="jp",
+                    api_key="key",
+                    http_cache=cache,
+                )
+                responses.replace(responses.GET, url, status=304)
+                project = api.get_project("TEST")
+
+                self.assertEqual(project.project_key, "TEST")
+                self.assertEqual(cache.hits, 1)
+
+        headers = responses.calls[1].request.headers
+        self.assertEqual(headers["If-None-Match"], '"v1"')
+        self.assertEqual(headers["If-Modified-Since"],
+                         "Wed, 21 Oct 2015 07:28:00 GMT")
+        self.assertNotIn("If-None-Match", responses.calls[0].request.headers)
+
+
+class TestAsyncBacklogApiHttpCache(unittest.TestCase):
+    def test_conditional_request(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=PROJECT, headers={
+                "ETag": '"v1"',
+                "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+        async def fetch(cache: SQLiteHttpCache):
+            async with httpx.AsyncClient(
+                    transport=httpx.MockTransport(handler)) as client:
+                api = AsyncBacklogApi(
+                    space_key="test",
+                    space_type="jp",
+                    api_key="key",
+                    client=client,
+                    http_cache=cache,
+                )
+                return [await api.get_project("TEST") for _ in range(2)]
+
+        with SQLiteHttpCache(":memory:") as cache:
+            projects = asyncio.run(fetch(cache))
+
+            self.assertEqual([p.project_key for p in projects],
+                             ["TEST", "TEST"])
+            self.assertEqual(cache.hits, 1)
+
+        self.assertNotIn("If-None-Match", requests[0].headers)
+        self.assertEqual(requests[1].headers["If-Modified-Since"],
+                         "Wed, 21 Oct 2015 07:28:00 GMT")
@@ -0,0 +1,147 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import unittest
+
+import responses
+
+from backlog import BacklogApi, ModelDecoder
+from backlog.models import User, UserIdentityMap, user_identity_scope
+
+USER = {"id": 1,
+        "userId": "admin",
+        "name": "admin",
+        "roleType": 1,
+        "lang": "ja",
+        "mailAddress": "eguchi@nulab.example"}
+
+
+def make_file(file_id, user):
+    return {"id": file_id,
+            "type": "file",
+            "dir": "/",
+            "name": f"{file_id}.png",
+            "size": 10,
+            "createdUser": user,
+            "created": "2009-02-27T03:26:15Z",
+            "updatedUser": user,
+            "updated": "2009-03-03T16:57:47Z"}
+
+
+class TestUserIdentityMap(unittest.TestCase):
+    def test_resolve_in_scope(self):
+        with user_identity_scope() as identity_map:
+            first = User.from_dict(USER)
+            second = User.from_dict(dict(USER))
+
+        self.assertIs(first, second)
+        self.assertEqual(identity_map.hits, 1)
+        self.assertEqual(identity_map.misses, 1)
+        self.assertIsNot(User.from_dict(USER), first)
+
+    def test_resolve_changed_user(self):
+        with user_identity_scope():
+            first = User.from_dict(USER)
+            renamed = User.from_dict(dict(USER, name="renamed"))
+
+        self.assertIsNot(first, renamed)
+        self.assertEqual(renamed.name, "renamed")
+
+    def test_resolve_user_changed_in_any_field(self):
+        account = {"nulabId": "abc", "name": "admin", "uniqueId": "admin"}
+        changes = [{"lang": "en"},
+                   {"keyword": "new"},
+                   {"userId": "root"},
+                   {"nulabAccount": account},
+                   {"nulabAccount": dict(account, name="renamed")}]
+        identity_map = UserIdentityMap()
+
+        with user_identity_scope(identity_map):
+            users = [User.from_dict(USER)]
+            for change in changes:
+                users.append(User.from_dict(dict(USER, **change)))
+            shared = User.from_dict(dict(USER, **changes[-1]))
+
+        self.assertEqual(len({id(user) for user in users}), 6)
+        self.assertEqual(users[-1].nulab_account.name, "renamed")
+        self.assertIs(shared, users[-1])
+
+    def test_release_unreferenced_user(self):
+        identity_map = UserIdentityMap()
+        with user_identity_scope(identity_map):
+            user = User.from_dict(USER)
+        self.assertEqual(len(identity_map), 1)
+
+        del user
+        gc.collect()
+        self.assertEqual(len(identity_map), 0)
+
+    def test_maxsize(self):
+        identity_map = UserIdentityMap(maxsize=1)
+        with user_identity_scope(identity_map):
+            users = [User.from_dict(dict(USER, id=i)) for i in range(3)]
+
+        self.assertEqual(len(users), 3)
+        self.assertEqual(len(identity_map), 1)
+
+
+class TestModelDecoder(unittest.TestCase):
+    def setUp(self):
+        self.tested = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+        )
+        self.url = f"{self.tested.base_url}wikis/1/sharedFiles"
+
+    @responses.activate
+    def test_share_users_in_response(self):
+        responses.add(responses.GET, self.url,
+                      json=[make_file(1, USER), make_file(2, USER)])
+
+        files = self.tested.get_wiki_shared_files(1)
+
+        self.assertIs(files[0].created_user, files[0].updated_user)
+        self.assertIs(files[0].created_user, files[1].created_user)
+
+    @responses.activate
+    def test_not_share_users_between_responses(self):
+        responses.add(responses.GET, self.url, json=[make_file(1, USER)])
+
+        first = self.tested.get_wiki_shared_files(1)
+        second = self.tested.get_wiki_shared_files(1)
+
+        self.assertIsNot(first[0].created_user, second[0].created_user)
+
+    @responses.activate
+    def test_share_users_between_responses(self):
+        responses.add(responses.GET, self.url, json=[make_file(1, USER)])
+        self.tested.decoder = ModelDecoder(
+            user_identity_map=UserIdentityMap())
+
+        first = self.tested.get_wiki_shared_files(1)
+        second = self.tested.get_wiki_shared_files(1)
+
+        self.assertIs(first[0].created_user, second[0].created_user)
+
+    @responses.activate
+    def test_disable_interning(self):
+        responses.add(responses.GET, self.url, json=[make_file(1, USER)])
+        self.tested.decoder = ModelDecoder(intern_users=False)
+
+        files = self.tested.get_wiki_shared_files(1)
+
+        self.assertIsNot(files[0].created_user, files[0].updated_user)
+        self.assertEqual(files[0].created_user, files[0].updated_user)
@@ -0,0 +1,234 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import unittest
+from datetime import date, datetime
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import responses
+
+from backlog import AsyncBacklogApi, BacklogApi, ModelDecoder
+from backlog.models import RAISE, Attachment, Issue, Priority, Resolution
+from backlog.models.base import get_decoder
+
+from . import issue, query_of
+
+
+def issues_callback(total: int):
+    """Emulate offset paging of issues."""
+    def callback(request):
+        query = query_of(request)
+        if urlparse(request.url).path.endswith("/count"):
+            return 200, {}, json.dumps({"count": total})
+        offset = int(query.get("offset", ["0"])[0])
+        count = int(query.get("count", ["20"])[0])
+        ids = range(offset + 1, min(offset + count, total) + 1)
+        return 200, {}, json.dumps([issue(i) for i in ids])
+    return callback
+
+
+class TestIssue(unittest.TestCase):
+    def setUp(self):
+        self.tested = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+        )
+
+    @responses.activate
+    def test_get_issues(self):
+        responses.add(responses.GET,
+                      f"{self.tested.base_url}issues",
+                      json=[issue(1)])
+
+        issues = self.tested.get_issues(
+            project_ids=[1, 2],
+            status_ids=iter([3]),
+            assignee_ids=[4],
+            keyword="bug",
+            updated_since=date(2022, 1, 2),
+            updated_until="2022-12-31",
+            sort="updated",
+            order="desc",
+            offset=20,
+            count=10)
+
+        self.assertEqual(query_of(responses.calls[0].request), {
+            "projectId[]": ["1", "2"],
+            "statusId[]": ["3"],
+            "assigneeId[]": ["4"],
+            "keyword": ["bug"],
+            "updatedSince": ["2022-01-02"],
+            "updatedUntil": ["2022-12-31"],
+            "sort": ["updated"],
+            "order": ["desc"],
+            "offset": ["20"],
+            "count": ["10"],
+            "apiKey": ["key"],
+        })
+        tested = issues[0]
+        self.assertEqual(tested.issue_key, "BLG-1")
+        self.assertEqual(tested.issue_type.name, "Task")
+        self.assertIsNone(tested.resolution)
+        self.assertIs(tested.priority, Priority.NORMAL)
+        self.assertEqual(tested.status.name, "Open")
+        self.assertEqual(tested.assignee.id, 1)
+        self.assertEqual(tested.category[0].name, "Development")
+        self.assertEqual(tested.milestone[0].id, 30)
+        self.assertIsNone(tested.start_date)
+        self.assertEqual(tested.due_date, datetime(2013, 8, 31))
+        self.assertEqual(tested.actual_hours, 1.5)
+        self.assertIsInstance(tested.attachments[0], Attachment)
+        self.assertEqual(tested.attachments[0].size, 85079)
+        self.assertEqual(tested.attachments[0].created,
+                         datetime(2014, 7, 11, 6, 26, 5))
+
+    def test_issue_from_dict(self):
+        data = dict(issue(1),
+                    resolution={"id": 0, "name": "Fixed"},
+                    priority={"id": 9, "name": "Urgent"},
+                    assignee=None)
+
+        tested = Issue.from_dict(data)
+
+        self.assertIs(tested.resolution, Resolution.FIXED)
+        self.assertIsNone(tested.priority)
+        self.assertIsNone(tested.assignee)
+        self.assertEqual(json.loads(tested.to_json_string())["resolution"],
+                         0)
+
+    def test_compiled_decoder(self):
+        data = dict(issue(1), resolution={"id": 0, "name": "Fixed"})
+
+        self.assertEqual(get_decoder(Issue)(data), Issue.from_dict(data))
+
+    def test_unknown_enums_with_enum_default(self):
+        items = [dict(issue(1), priority={"id": 9, "name": "Urgent"},
+                      resolution={"id": 9, "name": "Later"})]
+
+        for compiled in (True, False):
+            with self.subTest(compiled=compiled):
+                tested = ModelDecoder(
+                    compiled=compiled, enum_default=Priority.NORMAL)
+                issues = tested.to_models(Issue, items)
+                self.assertIs(issues[0].priority, Priority.NORMAL)
+
+                tested = ModelDecoder(compiled=compiled, enum_default=RAISE)
+                with self.assertRaises(ValueError):
+                    tested.to_models(Issue, items)
+                with self.assertRaises(ValueError):
+                    tested.to_model(Issue, items[0])
+
+        self.assertIsNone(ModelDecoder().to_models(Issue, items)[0].priority)
+        self.assertIsNone(Issue.from_dict(items[0]).priority)
+
+    def test_get_issues_with_invalid_params(self):
+        with self.assertRaises(ValueError):
+            self.tested.get_issues(count=101)
+        with self.assertRaises(ValueError):
+            self.tested.get_issues(offset=-1)
+        with self.assertRaises(ValueError):
+            self.tested.get_issues(order="random")
+
+    @responses.activate
+    def test_count_issues(self):
+        responses.add(responses.GET,
+                      f"{self.tested.base_url}issues/count",
+                      json={"count": 42})
+
+        count = self.tested.count_issues(project_ids=[1])
+
+        self.assertEqual(count, 42)
+        self.assertEqual(query_of(responses.calls[0].request)["projectId[]"],
+                         ["1"])
+
+    @responses.activate
+    def test_iter_issues(self):
+        callback = issues_callback(250)
+        responses.add_callback(responses.GET,
+                               f"{self.tested.base_url}issues/count",
+                               callback=callback)
+        responses.add_callback(responses.GET,
+                               f"{self.tested.base_url}issues",
+                               callback=callback)
+
+        issues = list(self.tested.iter_issues(
+            project_ids=iter([1]), max_workers=2))
+
+        self.assertEqual([i.id for i in issues], list(range(1, 251)))
+        self.assertEqual(len(responses.calls), 4)
+        offsets = sorted(int(query_of(call.request)["offset"][0])
+                         for call in responses.calls[1:])
+        self.assertEqual(offsets, [0, 100, 200])
+        for call in responses.calls:
+            query = query_of(call.request)
+            self.assertEqual(query["projectId[]"], ["1"])
+        self.assertEqual(query["sort"], ["created"])
+        self.assertEqual(query["order"], ["asc"])
+
+    @responses.activate
+    def test_iter_issues_without_issues(self):
+        callback = issues_callback(0)
+        responses.add_callback(responses.GET,
+                               f"{self.tested.base_url}issues/count",
+                               callback=callback)
+
+        self.assertEqual(list(self.tested.iter_issues()), [])
+        self.assertEqual(len(responses.calls), 1)
+
+    def test_iter_issues_with_invalid_params(self):
+        with self.assertRaises(ValueError):
+            self.tested.iter_issues(count=0)
+        with self.assertRaises(ValueError):
+            self.tested.iter_issues(order="random")
+        with self.assertRaises(ValueError):
+            self.tested.iter_issues(max_workers=-1)
+
+
+class TestAsyncIssue(unittest.TestCase):
+    def test_iter_issues(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            query = parse_qs(request.url.query.decode())
+            total = 45
+            if request.url.path.endswith("/count"):
+                return httpx.Response(200, json={"count": total})
+            offset = int(query["offset"][0])
+            count = int(query["count"][0])
+            ids = range(offset + 1, min(offset + count, total) + 1)
+            return httpx.Response(200, json=[issue(i) for i in ids])
+
+        async def run():
+            async with AsyncBacklogApi(
+                    space_key="test",
+                    space_type="jp",
+                    api_key="key",
+                    client=httpx.AsyncClient(
+                        transport=httpx.MockTransport(handler))) as api:
+                issues = [i async for i in api.iter_issues(
+                    project_ids=[1], count=10, max_concurrency=3)]
+                count = await api.count_issues()
+                await api.client.aclose()
+            return issues, count
+
+        issues, count = asyncio.run(run())
+
+        self.assertEqual([i.id for i in issues], list(range(1, 46)))
+        self.assertEqual(count, 45)
+        self.assertEqual(len(requests), 7)
@@ -0,0 +1,108 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import unittest
+
+import httpx
+import responses
+
+from backlog import AsyncBacklogApi, BacklogApi, JsonBackend, get_json_backend
+from backlog.json_backend import BACKENDS, PREFERENCE
+
+from . import USER
+
+
+class TestGetJsonBackend(unittest.TestCase):
+    def test_auto_detect(self):
+        expected = next(name for name in PREFERENCE if name in BACKENDS)
+
+        self.assertEqual(get_json_backend().name, expected)
+
+    def test_get_by_name(self):
+        backend = get_json_backend("json")
+
+        self.assertEqual(backend.name, "json")
+        self.assertEqual(backend.loads(b'{"a": [1]}'), {"a": [1]})
+
+    def test_get_instance(self):
+        backend = JsonBackend("custom", json.loads)
+
+        self.assertIs(get_json_backend(backend), backend)
+
+    def test_not_installed(self):
+        with self.assertRaises(ValueError):
+            get_json_backend("unknown")
+
+    def test_backends_decode_same_value(self):
+        body = json.dumps([USER, {"name": "日本語", "value": 1.5}]).encode()
+
+        for name, backend in BACKENDS.items():
+            with self.subTest(backend=name):
+                self.assertEqual(backend.loads(body), json.loads(body))
+
+
+class TestJsonBackend(unittest.TestCase):
+    @responses.activate
+    def test_decode_with_backend(self):
+        bodies = []
+
+        def loads(body):
+            bodies.append(body)
+            return json.loads(body)
+
+        api = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+            json_backend=JsonBackend("recording", loads),
+        )
+        responses.add(responses.GET, f"{api.base_url}users/1", json=USER)
+
+        user = api.get_user(1)
+
+        self.assertEqual(user.id, 1)
+        self.assertEqual(len(bodies), 1)
+        self.assertIsInstance(bodies[0], bytes)
+
+    def test_invalid_backend(self):
+        with self.assertRaises(ValueError):
+            BacklogApi(
+                space_key="test",
+                space_type="jp",
+                api_key="key",
+                json_backend="unknown",
+            )
+
+    def test_async_decode_with_backend(self):
+        def handler(request):
+            return httpx.Response(200, json=USER)
+
+        async def run():
+            async with AsyncBacklogApi(
+                    space_key="test",
+                    space_type="jp",
+                    api_key="key",
+                    client=httpx.AsyncClient(
+                        transport=httpx.MockTransport(handler)),
+                    json_backend="json") as api:
+                user = await api.get_user(1)
+                await api.client.aclose()
+            return api, user
+
+        api, user = asyncio.run(run())
+
+        self.assertEqual(api.json_backend.name, "json")
+        self.assertEqual(user.id, 1)
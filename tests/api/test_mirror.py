@@ -0,0 +1,168 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+from datetime import datetime
+
+from backlog import SQLiteMirror
+from backlog.models import (Attachment, Comment, LazyWiki, Project,
+                            SharedFile, Star, Status, User, Wiki)
+
+from . import PROJECT, USER, comment, star, wiki
+
+ATTACHMENT = {"id": 1,
+              "name": "test.json",
+              "size": 8857,
+              "createdUser": USER,
+              "created": "2014-01-06T11:10:45Z"}
+
+SHARED_FILE = {"id": 454403,
+               "type": "file",
+               "dir": "/userIcon/",
+               "name": "01_male clerk.png",
+               "size": 2735,
+               "createdUser": USER,
+               "created": "2009-02-27T03:26:15Z",
+               "updatedUser": USER,
+               "updated": "2009-03-03T16:57:47Z"}
+
+
+def other_user_wiki(wiki_id: int, updated: str) -> dict:
+    data = wiki(wiki_id, updated)
+    data["projectId"] = 2
+    data["createdUser"] = dict(USER, id=2)
+    return data
+
+
+class TestSQLiteMirror(unittest.TestCase):
+    def setUp(self):
+        self.tested = SQLiteMirror(":memory:", batch_size=2)
+        self.wikis = [
+            Wiki.from_dict(wiki(1, "2022-01-01T00:00:00Z")),
+            Wiki.from_dict(wiki(2, "2022-01-02T00:00:00Z")),
+            Wiki.from_dict(other_user_wiki(3, "2022-01-03T00:00:00Z")),
+        ]
+
+    def tearDown(self):
+        self.tested.close()
+
+    def test_upsert_and_get(self):
+        stored = self.tested.upsert(
+            self.wikis + [User.from_dict(USER)])
+
+        self.assertEqual(stored, 4)
+        self.assertEqual(self.tested.get(Wiki, 2), self.wikis[1])
+        self.assertEqual(self.tested.get(User, 1).name, "admin")
+        self.assertIsNone(self.tested.get(Wiki, 4))
+
+    def test_round_trip(self):
+        account = {"nulabId": "abc", "name": "admin", "uniqueId": "a"}
+        changed = dict(comment(1), changeLog=[{
+            "field": "status",
+            "newValue": "Closed",
+            "originalValue": "Open",
+            "attachmentInfo": None,
+            "attributeInfo": None,
+            "notificationInfo": None,
+        }])
+        models = [
+            User.from_dict(dict(USER, id=2, nulabAccount=account)),
+            Project.from_dict(PROJECT),
+            Wiki.from_dict(dict(wiki(1, "2022-01-01T00:00:00Z"),
+                                attachments=[ATTACHMENT],
+                                sharedFiles=[SHARED_FILE],
+                                stars=[star(1)])),
+            Comment.from_dict(changed),
+            Star.from_dict(star(1)),
+            Attachment.from_dict(ATTACHMENT),
+            SharedFile.from_dict(SHARED_FILE),
+        ]
+
+        self.tested.upsert(models)
+
+        for model in models:
+            self.assertEqual(self.tested.get(type(model), model.id), model)
+
+    def test_stored_as_json(self):
+        self.tested.upsert(self.wikis[:1])
+
+        row = self.tested._connection.execute(
+            "SELECT data FROM wikis").fetchone()
+        data = json.loads(row[0])
+        self.assertEqual(data["projectId"], 1)
+        self.assertEqual(data["updated"], "2022-01-01T00:00:00Z")
+
+    def test_upsert_keeps_parent_id(self):
+        self.tested.upsert([Comment.from_dict(comment(1))], parent_id=10)
+        self.tested.upsert([Comment.from_dict(comment(1))])
+
+        self.assertEqual(
+            len(self.tested.query(Comment, parent_id=10)), 1)
+
+        self.tested.upsert([Comment.from_dict(comment(1))], parent_id=11)
+
+        self.assertEqual(
+            len(self.tested.query(Comment, parent_id=11)), 1)
+
+    def test_upsert_replaces(self):
+        self.tested.upsert(self.wikis)
+        self.tested.upsert(
+            [LazyWiki.from_dict(wiki(1, "2022-02-01T00:00:00Z"))])
+
+        self.assertEqual(self.tested.count(Wiki), 3)
+        self.assertEqual(self.tested.get(Wiki, 1).updated,
+                         datetime(2022, 2, 1))
+
+    def test_query(self):
+        self.tested.upsert(self.wikis)
+
+        def ids(**kwargs):
+            return [w.id for w in self.tested.query(Wiki, **kwargs)]
+
+        self.assertEqual(ids(), [1, 2, 3])
+        self.assertEqual(ids(project_id=1), [1, 2])
+        self.assertEqual(ids(created_user=2), [3])
+        self.assertEqual(ids(updated_since=datetime(2022, 1, 2),
+                             updated_until=datetime(2022, 1, 2)), [2])
+        self.assertEqual(ids(order_by="updated", order="desc", limit=2),
+                         [3, 2])
+        self.assertEqual(ids(limit=1, offset=1), [2])
+        self.assertEqual(self.tested.count(Wiki, project_id=1), 2)
+
+    def test_query_by_parent(self):
+        self.tested.upsert(
+            [Comment.from_dict(comment(i)) for i in (1, 2)], parent_id=10)
+        self.tested.upsert([Comment.from_dict(comment(3))], parent_id=11)
+        self.tested.upsert([Star.from_dict(star(1))], parent_id=1)
+
+        self.assertEqual(
+            [c.id for c in self.tested.query(Comment, parent_id=10)], [1, 2])
+        self.assertEqual(self.tested.count(Star, created_user=1), 1)
+
+    def test_delete(self):
+        self.tested.upsert(self.wikis)
+
+        self.assertEqual(self.tested.delete(Wiki, [1, 3, 4]), 2)
+        self.assertEqual(self.tested.count(Wiki), 1)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.tested.upsert([Status(1, 1, "Open", "#ffffff", 0)])
+        with self.assertRaises(ValueError):
+            self.tested.query(Wiki, order_by="name")
+        with self.assertRaises(ValueError):
+            self.tested.query(Wiki, order="up")
+        with self.assertRaises(ValueError):
+            SQLiteMirror(":memory:", batch_size=0)
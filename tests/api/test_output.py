@@ -0,0 +1,151 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+from dataclasses import fields
+
+import httpx
+import responses
+
+from backlog import AsyncBacklogApi, BacklogApi, ModelDecoder
+from backlog.models import Star, User
+
+from . import USER, comment, paged_callback, star
+
+RAW_USER = {
+    "id": 1,
+    "user_id": "admin",
+    "name": "admin",
+    "role_type": 1,
+    "lang": "ja",
+    "mail_address": "eguchi@nulab.example",
+    "nulab_account": None,
+    "keyword": None,
+}
+
+
+class TestModelDecoderOutput(unittest.TestCase):
+    def test_to_raw(self):
+        raw = ModelDecoder().to_raw(Star, star(1))
+
+        self.assertEqual(raw, {
+            "id": 1,
+            "comment": None,
+            "url": "https://xx.backlogtool.com/view/BLG-1",
+            "title": "[BLG-1] first issue | Show issue - Backlog",
+            "presenter": RAW_USER,
+            "created": "2014-01-23T10:55:19Z",
+        })
+
+    def test_raw_keys_match_fields(self):
+        raw = ModelDecoder().to_raw(Star, star(1))
+
+        self.assertEqual(list(raw), [field.name for field in fields(Star)])
+
+    def test_to_columns(self):
+        columns = ModelDecoder().to_columns(User, [USER, dict(USER, id=2)])
+
+        self.assertEqual(columns["id"], [1, 2])
+        self.assertEqual(columns["mail_address"],
+                         ["eguchi@nulab.example"] * 2)
+        self.assertEqual(columns["nulab_account"], [None, None])
+
+    def test_to_columns_without_items(self):
+        columns = ModelDecoder().to_columns(User, [])
+
+        self.assertEqual(columns["id"], [])
+
+    def test_invalid_output(self):
+        with self.assertRaises(ValueError):
+            ModelDecoder(output="table")
+        with self.assertRaises(ValueError):
+            ModelDecoder().with_output("table")
+
+
+class TestOutput(unittest.TestCase):
+    def setUp(self):
+        self.tested = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+        )
+
+    @responses.activate
+    def test_raw_output(self):
+        responses.add(responses.GET,
+                      f"{self.tested.base_url}users/1",
+                      json=USER)
+        api = self.tested.with_decoder(ModelDecoder(output="raw"))
+
+        self.assertEqual(api.get_user(1), RAW_USER)
+        self.assertIs(api.session, self.tested.session)
+        self.assertIsInstance(self.tested.get_user(1), User)
+
+    @responses.activate
+    def test_columns_output(self):
+        responses.add(responses.GET,
+                      f"{self.tested.base_url}issues/1/comments",
+                      json=[comment(1), comment(2)])
+        self.tested.decoder = ModelDecoder(output="columns")
+
+        columns = self.tested.get_issue_comments(1)
+
+        self.assertEqual(columns["id"], [1, 2])
+        self.assertEqual(columns["change_log"], [[], []])
+        self.assertEqual(columns["created_user"], [RAW_USER, RAW_USER])
+
+    @responses.activate
+    def test_iter_with_columns_output(self):
+        items = {i: comment(i) for i in range(1, 6)}
+        responses.add_callback(
+            responses.GET,
+            f"{self.tested.base_url}issues/1/comments",
+            callback=paged_callback(items))
+        self.tested.decoder = ModelDecoder(output="columns")
+
+        comments = list(self.tested.iter_issue_comments(1, count=2))
+
+        self.assertEqual([c["id"] for c in comments], list(range(1, 6)))
+
+    def test_close_shared_session(self):
+        api = self.tested.with_decoder(ModelDecoder(output="raw"))
+        api.close()
+
+        self.assertTrue(self.tested._owns_session)
+        self.assertFalse(api._owns_session)
+
+
+class TestAsyncOutput(unittest.TestCase):
+    def test_raw_output(self):
+        def handler(request):
+            return httpx.Response(200, json=[USER])
+
+        async def run():
+            async with AsyncBacklogApi(
+                    space_key="test",
+                    space_type="jp",
+                    api_key="key",
+                    client=httpx.AsyncClient(
+                        transport=httpx.MockTransport(handler)),
+                    decoder=ModelDecoder(output="raw")) as api:
+                users = await api.get_users()
+                streamed = [user async for user in api.iter_users()]
+                await api.client.aclose()
+            return users, streamed
+
+        users, streamed = asyncio.run(run())
+
+        self.assertEqual(users, [RAW_USER])
+        self.assertEqual(streamed, [RAW_USER])
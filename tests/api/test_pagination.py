@@ -0,0 +1,89 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import responses
+
+from backlog import BacklogApi
+
+from . import comment, paged_callback, star
+
+
+class TestPagination(unittest.TestCase):
+    def setUp(self):
+        self.tested = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+        )
+
+    @responses.activate
+    def test_get_issue_comments_with_page_params(self):
+        responses.add(
+            responses.GET,
+            f"{self.tested.base_url}issues/BLG-1/comments",
+            json=[comment(5)],
+            status=200)
+
+        comments = self.tested.get_issue_comments(
+            "BLG-1", min_id=5, max_id=10, count=1, order="asc")
+
+        request = responses.calls[0].request
+        self.assertEqual(
+            request.url,
+            f"{self.tested.base_url}issues/BLG-1/comments"
+            "?minId=5&maxId=10&count=1&order=asc&apiKey=key")
+        self.assertEqual(comments[0].id, 5)
+
+    @responses.activate
+    def test_iter_issue_comments(self):
+        items = {i: comment(i) for i in range(1, 8)}
+        responses.add_callback(
+            responses.GET,
+            f"{self.tested.base_url}issues/BLG-1/comments",
+            callback=paged_callback(items))
+
+        comments = self.tested.iter_issue_comments("BLG-1", count=3)
+
+        self.assertEqual([c.id for c in comments], list(range(1, 8)))
+        self.assertEqual(len(responses.calls), 4)
+        self.assertIn("comments?count=3&order=asc",
+                      responses.calls[0].request.url)
+        self.assertIn("minId=3&count=3&order=asc",
+                      responses.calls[1].request.url)
+        self.assertIn("minId=5&count=3&order=asc",
+                      responses.calls[2].request.url)
+        self.assertIn("minId=7&count=3&order=asc",
+                      responses.calls[3].request.url)
+
+    @responses.activate
+    def test_iter_user_received_stars(self):
+        items = {i: star(i) for i in range(1, 7)}
+        responses.add_callback(
+            responses.GET,
+            f"{self.tested.base_url}users/1/stars",
+            callback=paged_callback(items))
+
+        stars = self.tested.iter_user_received_stars(1, count=3)
+
+        self.assertEqual([s.id for s in stars], list(range(6, 0, -1)))
+        self.assertIn("maxId=4&count=3&order=desc",
+                      responses.calls[1].request.url)
+
+    def test_iter_issue_comments_with_invalid_params(self):
+        with self.assertRaises(ValueError):
+            self.tested.iter_issue_comments("BLG-1", count=101)
+        with self.assertRaises(ValueError):
+            self.tested.iter_issue_comments("BLG-1", order="random")
@@ -16,7 +16,8 @@ import unittest
 
 import responses
 
-from backlog import BacklogApi
+from backlog import BacklogApi, ModelDecoder
+from backlog.models import RAISE, Priority
 
 
 class TestPriority(unittest.TestCase):
@@ -62,3 +63,23 @@ class TestPriority(unittest.TestCase):
         self.assertEqual(resolutions[1].to_value(), 3)
         self.assertEqual(resolutions[2].name, "LOW")
         self.assertEqual(resolutions[2].to_value(), 4)
+
+    @responses.activate
+    def test_get_priorities_with_unknown_id(self):
+        responses.add(
+            responses.GET,
+            f"{self.tested.base_url}priorities",
+            json=[{"id": 2, "name": "High"}, {"id": 9, "name": "Urgent"}],
+            status=200
+        )
+
+        priorities = self.tested.get_priorities()
+        self.assertEqual(priorities, [Priority.HIGH])
+
+        self.tested.decoder = ModelDecoder(enum_default=Priority.NORMAL)
+        priorities = self.tested.get_priorities()
+        self.assertEqual(priorities, [Priority.HIGH, Priority.NORMAL])
+
+        self.tested.decoder = ModelDecoder(enum_default=RAISE)
+        with self.assertRaises(ValueError):
+            self.tested.get_priorities()
@@ -0,0 +1,126 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import responses
+
+from backlog import BacklogApi, FileRateLimiter, RateLimiter
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.tested = RateLimiter(
+            limit=60,
+            period=60.0,
+            burst=2,
+            clock=self.clock,
+            sleep=self.clock.sleep,
+        )
+
+    def test_acquire_within_burst(self):
+        self.assertEqual(self.tested.acquire(), 0)
+        self.assertEqual(self.tested.acquire(), 0)
+
+    def test_acquire_paces_requests(self):
+        self.tested.acquire()
+        self.tested.acquire()
+
+        self.assertAlmostEqual(self.tested.acquire(), 1.0)
+        self.assertAlmostEqual(self.tested.acquire(), 1.0)
+
+    def test_update_spreads_remaining_until_reset(self):
+        self.tested.update({
+            "X-RateLimit-Limit": "60",
+            "X-RateLimit-Remaining": "5",
+            "X-RateLimit-Reset": str(int(self.clock.now) + 50),
+        })
+        self.tested.acquire()
+        self.tested.acquire()
+
+        self.assertAlmostEqual(self.tested.acquire(), 10.0)
+
+    def test_update_waits_for_reset_when_quota_is_exhausted(self):
+        self.tested.update({
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(self.clock.now) + 30),
+        })
+
+        self.assertAlmostEqual(self.tested.acquire(), 30.0)
+
+    def test_update_ignores_missing_headers(self):
+        self.tested.update({})
+
+        self.assertEqual(self.tested.acquire(), 0)
+
+    def test_limit_is_invalid(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(limit=0)
+
+
+class TestFileRateLimiter(unittest.TestCase):
+    def test_bucket_is_shared_by_file(self):
+        clock = FakeClock()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bucket.json")
+            first = FileRateLimiter(
+                path, limit=60, burst=2, clock=clock, sleep=clock.sleep)
+            second = FileRateLimiter(
+                path, limit=60, burst=2, clock=clock, sleep=clock.sleep)
+
+            self.assertEqual(first.acquire(), 0)
+            self.assertEqual(second.acquire(), 0)
+            self.assertAlmostEqual(first.acquire(), 1.0)
+
+
+class TestBacklogApiRateLimit(unittest.TestCase):
+    @responses.activate
+    def test_limiter_is_corrected_by_response(self):
+        clock = FakeClock()
+        limiter = RateLimiter(
+            limit=60, burst=2, clock=clock, sleep=clock.sleep)
+        api = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+            rate_limiter=limiter,
+        )
+        responses.add(
+            responses.GET,
+            f"{api.base_url}users/1/stars/count",
+            json={"count": 1},
+            headers={
+                "X-RateLimit-Limit": "60",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(clock.now) + 20),
+            },
+            status=200)
+
+        api.get_number_of_user_received_stars(1)
+
+        self.assertAlmostEqual(limiter.acquire(), 20.0)
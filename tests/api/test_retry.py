@@ -0,0 +1,130 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import requests
+import responses
+
+from backlog import BacklogApi, RetryPolicy
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_get_delay_with_backoff(self):
+        policy = RetryPolicy(backoff_factor=1.0, max_backoff=3.0, jitter=False)
+
+        self.assertEqual(policy.get_delay(1), 1.0)
+        self.assertEqual(policy.get_delay(2), 2.0)
+        self.assertEqual(policy.get_delay(3), 3.0)
+
+    def test_get_delay_with_jitter(self):
+        policy = RetryPolicy(backoff_factor=1.0, random_func=lambda: 0.25)
+
+        self.assertEqual(policy.get_delay(3), 1.0)
+
+    def test_get_delay_with_retry_after(self):
+        policy = RetryPolicy(max_retry_after=60.0)
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        self.assertEqual(policy.get_delay(1, "12"), 12.0)
+        self.assertAlmostEqual(
+            policy.get_delay(1, format_datetime(retry_at, usegmt=True)),
+            30.0, delta=1.5)
+        self.assertIsNone(policy.get_delay(1, "120"))
+
+    def test_is_retryable(self):
+        policy = RetryPolicy(max_attempts=2, retry_statuses=(503,))
+
+        self.assertTrue(policy.is_retryable("GET", 1, status=503))
+        self.assertTrue(policy.is_retryable("GET", 1, error=OSError()))
+        self.assertFalse(policy.is_retryable("GET", 1, status=500))
+        self.assertFalse(policy.is_retryable("GET", 2, status=503))
+        self.assertFalse(policy.is_retryable("POST", 1, status=503))
+
+    def test_max_attempts_is_invalid(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+class TestBacklogApiRetry(unittest.TestCase):
+    def setUp(self):
+        self.tested = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+            timeout=(1.0, 2.0),
+            retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0),
+        )
+        self.url = f"{self.tested.base_url}users/1/stars/count"
+
+    @responses.activate
+    def test_retry_until_success(self):
+        responses.add(responses.GET, self.url, status=503,
+                      headers={"Retry-After": "0"})
+        responses.add(responses.GET, self.url,
+                      body=requests.ConnectionError("reset"))
+        responses.add(responses.GET, self.url, json={"count": 3}, status=200)
+
+        count = self.tested.get_number_of_user_received_stars(1)
+
+        self.assertEqual(count, 3)
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(self.tested.retry_stats.to_dict(), {
+            "requests": 1,
+            "attempts": 3,
+            "retries": 2,
+            "failures": 0,
+            "retries_by_reason": {503: 1, "ConnectionError": 1},
+        })
+
+    @responses.activate
+    def test_raise_after_all_attempts(self):
+        responses.add(responses.GET, self.url, status=502)
+
+        with self.assertRaises(requests.HTTPError):
+            self.tested.get_number_of_user_received_stars(1)
+
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(self.tested.retry_stats.failures, 1)
+
+    @responses.activate
+    def test_client_error_is_not_retried(self):
+        responses.add(responses.GET, self.url, status=404,
+                      json={"errors": [{"message": "No user."}]})
+
+        with self.assertRaises(requests.HTTPError):
+            self.tested.get_number_of_user_received_stars(1)
+
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_timeout_is_passed(self):
+        responses.add(responses.GET, self.url, json={"count": 3}, status=200)
+
+        self.tested.get_number_of_user_received_stars(1)
+
+        self.assertEqual(responses.calls[0].request.req_kwargs["timeout"],
+                         (1.0, 2.0))
+
+    @responses.activate
+    def test_no_retry_by_default(self):
+        api = BacklogApi(space_key="test", space_type="jp", api_key="key")
+        responses.add(responses.GET, self.url, status=503)
+
+        with self.assertRaises(requests.HTTPError):
+            api.get_number_of_user_received_stars(1)
+
+        self.assertEqual(len(responses.calls), 1)
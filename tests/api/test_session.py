@@ -0,0 +1,95 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+import requests
+import responses
+
+from backlog import BacklogApi
+
+
+class TestSession(unittest.TestCase):
+    def setUp(self):
+        self.tested = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+            pool_connections=2,
+            pool_maxsize=20,
+        )
+
+    def test_pool_is_configured(self):
+        adapter = self.tested.session.get_adapter(self.tested.base_url)
+
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 20)
+        self.assertEqual(self.tested.session.headers["Connection"],
+                         "keep-alive")
+
+    def test_keep_alive_is_disabled(self):
+        api = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+            keep_alive=False,
+        )
+
+        self.assertEqual(api.session.headers["Connection"], "close")
+
+    def test_pool_size_is_invalid(self):
+        with self.assertRaises(ValueError):
+            BacklogApi(
+                space_key="test",
+                space_type="jp",
+                api_key="key",
+                pool_maxsize=0,
+            )
+
+    @responses.activate
+    def test_session_is_shared_between_requests(self):
+        responses.add(responses.GET,
+                      f"{self.tested.base_url}users/1/stars/count",
+                      json={"count": 1},
+                      status=200)
+
+        with mock.patch.object(self.tested.session, "get",
+                               wraps=self.tested.session.get) as get:
+            self.tested.get_number_of_user_received_stars(1)
+            self.tested.get_number_of_user_received_stars(1)
+
+        self.assertEqual(get.call_count, 2)
+
+    def test_close_owned_session(self):
+        with mock.patch.object(self.tested.session, "close") as close:
+            with self.tested as api:
+                self.assertIs(api, self.tested)
+
+        close.assert_called_once_with()
+
+    def test_close_external_session(self):
+        session = requests.Session()
+        api = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+            session=session,
+        )
+
+        with mock.patch.object(session, "close") as close:
+            api.close()
+
+        self.assertIs(api.session, session)
+        close.assert_not_called()
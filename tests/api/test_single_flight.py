@@ -0,0 +1,100 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import responses
+
+from backlog import BacklogApi, SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.tested = SingleFlight()
+
+    def test_do_shares_error(self):
+        started = threading.Event()
+
+        def fail():
+            started.set()
+            time.sleep(0.1)
+            raise RuntimeError("failed")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(self.tested.do, "key", fail)
+            started.wait()
+            second = executor.submit(self.tested.do, "key", fail)
+
+            with self.assertRaises(RuntimeError):
+                first.result()
+            with self.assertRaises(RuntimeError):
+                second.result()
+
+        self.assertEqual(self.tested.executed, 1)
+        self.assertEqual(self.tested.coalesced, 1)
+
+    def test_do_after_completion_runs_again(self):
+        self.assertEqual(self.tested.do("key", lambda: 1), 1)
+        self.assertEqual(self.tested.do("key", lambda: 2), 2)
+        self.assertEqual(self.tested.coalesced, 0)
+
+    def test_do_async(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "value"
+
+        async def run():
+            return await asyncio.gather(
+                *[self.tested.do_async("key", fetch) for _ in range(5)])
+
+        self.assertEqual(asyncio.run(run()), ["value"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.tested.coalesced, 4)
+
+
+class TestBacklogApiSingleFlight(unittest.TestCase):
+    @responses.activate
+    def test_identical_requests_are_coalesced(self):
+        api = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+            single_flight=SingleFlight(),
+        )
+
+        def callback(request):
+            time.sleep(0.2)
+            return 200, {}, json.dumps({"count": 7})
+
+        responses.add_callback(
+            responses.GET,
+            f"{api.base_url}users/1/stars/count",
+            callback=callback)
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            counts = list(executor.map(
+                lambda _: api.get_number_of_user_received_stars(1),
+                range(5)))
+
+        self.assertEqual(counts, [7] * 5)
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(api.single_flight.coalesced, 4)
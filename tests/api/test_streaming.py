@@ -0,0 +1,132 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+
+import requests
+import responses
+
+from backlog import BacklogApi
+from backlog.models import User
+from backlog.streaming import JsonArrayDecoder, iter_json_array
+
+
+def split(data: bytes, size: int) -> list:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestJsonArrayDecoder(unittest.TestCase):
+    def test_decode_in_small_chunks(self):
+        items = [{"id": 1, "name": "日本語"}, 12345, "text", [1, [2]], None]
+        data = json.dumps(items, ensure_ascii=False).encode("utf-8")
+
+        for size in (1, 2, 3, 7, len(data)):
+            self.assertEqual(list(iter_json_array(split(data, size))), items)
+
+    def test_decode_number_split_across_chunks(self):
+        for chunks in ([b"[1500.", b"0]"],
+                       [b"[1.5e", b"3, 2]"],
+                       [b"[1.5E+", b"2]"],
+                       [b"[-", b"12]"],
+                       [b"[12", b"34 ]"]):
+            data = b"".join(chunks)
+            self.assertEqual(list(iter_json_array(chunks)), json.loads(data))
+
+        items = [1500.25, -1.5e-3, 0, 123456789]
+        data = json.dumps(items).encode()
+        for size in (1, 2, 3, 5):
+            self.assertEqual(list(iter_json_array(split(data, size))), items)
+
+    def test_decode_empty_array(self):
+        self.assertEqual(list(iter_json_array([b" [ ", b"] "])), [])
+
+    def test_feed_returns_completed_items(self):
+        decoder = JsonArrayDecoder()
+
+        self.assertEqual(decoder.feed(b'[{"id": 1}, {"id"'), [{"id": 1}])
+        self.assertEqual(decoder.feed(b': 2}]'), [{"id": 2}])
+        self.assertEqual(decoder.close(), [])
+
+    def test_not_array(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'{"id": 1}']))
+
+    def test_incomplete_array(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'[{"id": 1}, {"id": 2']))
+
+    def test_invalid_separator(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'[1 2]']))
+
+
+class TestBacklogApiStreaming(unittest.TestCase):
+    def setUp(self):
+        self.tested = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+        )
+
+    @responses.activate
+    def test_iter_users(self):
+        responses.add(
+            responses.GET,
+            f"{self.tested.base_url}users",
+            json=[{"id": user_id,
+                   "userId": f"user{user_id}",
+                   "name": f"user{user_id}",
+                   "roleType": 2,
+                   "lang": None,
+                   "mailAddress": f"user{user_id}@nulab.example"}
+                  for user_id in range(1, 4)],
+            status=200)
+
+        users = self.tested.iter_users()
+
+        self.assertEqual(len(responses.calls), 0)
+        self.assertEqual([user.id for user in users], [1, 2, 3])
+        self.assertTrue(responses.calls[0].request.req_kwargs["stream"])
+        self.assertEqual(
+            responses.calls[0].request.url,
+            f"{self.tested.base_url}users?apiKey=key")
+
+    @responses.activate
+    def test_iter_wikis_with_error(self):
+        responses.add(
+            responses.GET,
+            f"{self.tested.base_url}wikis",
+            json={"errors": [{"message": "No project."}]},
+            status=404)
+
+        with self.assertRaises(requests.HTTPError):
+            next(self.tested.iter_wikis("TEST"))
+
+    @responses.activate
+    def test_iter_project_users(self):
+        responses.add(
+            responses.GET,
+            f"{self.tested.base_url}projects/TEST/users",
+            json=[{"id": 1,
+                   "userId": "admin",
+                   "name": "admin",
+                   "roleType": 1,
+                   "lang": "ja",
+                   "mailAddress": "eguchi@nulab.example"}],
+            status=200)
+
+        users = list(self.tested.iter_project_users("TEST"))
+
+        self.assertIsInstance(users[0], User)
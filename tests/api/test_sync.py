@@ -0,0 +1,203 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+from datetime import datetime, timedelta
+
+import responses
+
+from backlog import (BacklogApi, ModelDecoder, SQLiteSyncStore, SyncEngine,
+                     SyncState)
+
+from . import comment, issue, query_of, wiki
+
+
+def updated_issue(issue_id: int, updated: str) -> dict:
+    data = issue(issue_id)
+    data["updated"] = updated
+    return data
+
+
+def issues_callback(issues: list):
+    """Emulate updatedSince filter of issues."""
+    def callback(request):
+        since = query_of(request).get("updatedSince", [""])[0]
+        items = [i for i in issues if i["updated"][:10] >= since]
+        if request.url.split("?")[0].endswith("/count"):
+            return 200, {}, json.dumps({"count": len(items)})
+        return 200, {}, json.dumps(items)
+    return callback
+
+
+class TestSQLiteSyncStore(unittest.TestCase):
+    def setUp(self):
+        self.tested = SQLiteSyncStore(":memory:")
+
+    def tearDown(self):
+        self.tested.close()
+
+    def test_set_and_get(self):
+        state = SyncState(updated=datetime(2022, 1, 2, 3, 4, 5),
+                          full_synced=datetime(2022, 1, 3),
+                          full_requests=7)
+        self.tested.set("wikis/1", state)
+
+        self.assertEqual(self.tested.get("wikis/1"), state)
+        self.assertIsNone(self.tested.get("wikis/2"))
+
+    def test_reset(self):
+        state = SyncState(updated=None,
+                          full_synced=datetime(2022, 1, 3),
+                          full_requests=1)
+        self.tested.set("wikis/1", state)
+        self.tested.set("wikis/2", state)
+        self.tested.set("space", state)
+
+        self.assertEqual(self.tested.reset("wikis/*"), 2)
+        self.assertIsNone(self.tested.get("wikis/1"))
+        self.assertIsNotNone(self.tested.get("space"))
+
+
+class TestSyncEngine(unittest.TestCase):
+    def setUp(self):
+        self.api = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+        )
+        self.store = SQLiteSyncStore(":memory:")
+        self.now = datetime(2022, 6, 1)
+        self.tested = SyncEngine(
+            self.api, self.store, clock=lambda: self.now)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_raw_decoder_is_rejected(self):
+        api = self.api.with_decoder(ModelDecoder(output="raw"))
+
+        with self.assertRaises(ValueError):
+            SyncEngine(api, self.store)
+
+    @responses.activate
+    def test_sync_wikis(self):
+        url = f"{self.api.base_url}wikis"
+        responses.add(responses.GET, url, json=[
+            wiki(1, "2022-01-01T00:00:00Z"),
+            wiki(2, "2022-01-02T00:00:00Z"),
+        ])
+        first = [w.id for w in self.tested.sync_wikis(1)]
+
+        responses.replace(responses.GET, url, json=[
+            wiki(1, "2022-01-01T00:00:00Z"),
+            wiki(2, "2022-01-02T00:00:00Z"),
+            wiki(3, "2022-01-03T00:00:00Z"),
+        ])
+        second = [w.id for w in self.tested.sync_wikis(1)]
+
+        self.assertEqual(first, [1, 2])
+        # the wiki page at the mark is returned again
+        self.assertEqual(second, [2, 3])
+        self.assertEqual(self.store.get("wikis/1").updated,
+                         datetime(2022, 1, 3))
+        self.assertTrue(self.tested.reports[0].full)
+        self.assertFalse(self.tested.reports[1].full)
+        self.assertEqual(self.tested.reports[1].fetched, 3)
+        self.assertEqual(self.tested.reports[1].changed, 2)
+
+    @responses.activate
+    def test_sync_wikis_detail_saves_requests(self):
+        responses.add(responses.GET, f"{self.api.base_url}wikis", json=[
+            wiki(1, "2022-01-01T00:00:00Z"),
+            wiki(2, "2022-01-02T00:00:00Z"),
+            wiki(3, "2022-01-03T00:00:00Z"),
+        ])
+        for wiki_id in (1, 2, 3):
+            responses.add(responses.GET,
+                          f"{self.api.base_url}wikis/{wiki_id}",
+                          json=wiki(wiki_id, "2022-01-03T00:00:00Z"))
+
+        list(self.tested.sync_wikis(1, detail=True))
+        second = list(self.tested.sync_wikis(1, detail=True))
+
+        self.assertEqual([w.id for w in second], [3])
+        self.assertEqual(self.tested.reports[0].requests, 4)
+        self.assertEqual(self.tested.reports[1].requests, 2)
+        self.assertEqual(self.tested.reports[1].requests_saved, 2)
+        self.assertEqual(self.tested.requests_saved, 2)
+
+    @responses.activate
+    def test_sync_issue_comments(self):
+        issues = [updated_issue(1, "2022-01-01T00:00:00Z"),
+                  updated_issue(2, "2022-01-05T00:00:00Z")]
+        callback = issues_callback(issues)
+        responses.add_callback(
+            responses.GET, f"{self.api.base_url}issues", callback=callback)
+        responses.add_callback(
+            responses.GET, f"{self.api.base_url}issues/count",
+            callback=callback)
+        for issue_id in (1, 2):
+            responses.add(
+                responses.GET,
+                f"{self.api.base_url}issues/{issue_id}/comments",
+                json=[comment(issue_id)])
+
+        first = list(self.tested.sync_issue_comments([1]))
+        issues[1] = updated_issue(2, "2022-01-10T00:00:00Z")
+        second = list(self.tested.sync_issue_comments([1]))
+
+        self.assertEqual([(i.id, [c.id for c in comments])
+                          for i, comments in first], [(1, [1]), (2, [2])])
+        # the comments were not changed after the last run
+        self.assertEqual([(i.id, comments) for i, comments in second],
+                         [(2, [])])
+        self.assertEqual(query_of(responses.calls[-2].request)
+                         ["updatedSince"], ["2022-01-04"])
+        self.assertEqual(self.tested.reports[0].requests, 4)
+        self.assertEqual(self.tested.reports[1].requests, 3)
+        self.assertEqual(self.tested.reports[1].requests_saved, 1)
+
+    @responses.activate
+    def test_full_resync(self):
+        responses.add(responses.GET, f"{self.api.base_url}wikis", json=[
+            wiki(1, "2022-01-01T00:00:00Z"),
+            wiki(2, "2022-01-02T00:00:00Z"),
+        ])
+        self.tested.full_resync_interval = timedelta(days=7)
+
+        list(self.tested.sync_wikis(1))
+        self.now += timedelta(days=1)
+        incremental = list(self.tested.sync_wikis(1))
+        self.now += timedelta(days=7)
+        full = list(self.tested.sync_wikis(1))
+        forced = list(SyncEngine(self.api, self.store, full=True,
+                                 clock=lambda: self.now).sync_wikis(1))
+
+        self.assertEqual(len(incremental), 1)
+        self.assertEqual(len(full), 2)
+        self.assertEqual(len(forced), 2)
+        self.assertEqual(self.store.get("wikis/1").full_synced, self.now)
+
+    @responses.activate
+    def test_mark_is_stored_when_exhausted(self):
+        responses.add(responses.GET, f"{self.api.base_url}wikis", json=[
+            wiki(1, "2022-01-01T00:00:00Z"),
+            wiki(2, "2022-01-02T00:00:00Z"),
+        ])
+
+        next(self.tested.sync_wikis(1))
+
+        self.assertIsNone(self.store.get("wikis/1"))
+        self.assertEqual(self.tested.reports, [])
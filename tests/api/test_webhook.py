@@ -0,0 +1,191 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+from backlog import (BacklogApi, ResponseCache, SQLiteHttpCache,
+                     WebhookReceiver, load_payloads, replay)
+from backlog.models import ActivityType, Comment, Issue, Wiki
+
+RECORDED = os.path.join(os.path.dirname(__file__), "data", "webhooks.jsonl")
+
+
+class TestWebhookReceiver(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResponseCache(ttls={"*": 60.0})
+        self.http_cache = SQLiteHttpCache(":memory:")
+        self.api = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+            cache=self.cache,
+            http_cache=self.http_cache,
+        )
+        self.tested = WebhookReceiver(clients=[self.api])
+        self.payloads = list(load_payloads(RECORDED))
+
+    def tearDown(self):
+        self.http_cache.close()
+
+    def cache_path(self, path: str):
+        key = ResponseCache.make_key(self.api.base_url, path, {})
+        self.cache.set(key, {}, 60.0)
+        self.http_cache.store(path, path, {"ETag": "a"}, b"{}")
+
+    def test_handle(self):
+        event = self.tested.handle(self.payloads[1])
+
+        self.assertIs(event.activity.type, ActivityType.ISSUE_COMMENTED)
+        self.assertEqual(event.activity.project.project_key, "TEST")
+        self.assertEqual([(c.model, c.id, c.parent_id)
+                          for c in event.changes], [(Comment, 40, 30)])
+        self.assertEqual(self.tested.received, 1)
+
+    def test_invalid_payload(self):
+        data = json.loads(self.payloads[1])
+        for body in (b"not json",
+                     b"[]",
+                     json.dumps({"id": 1}),
+                     dict(data, content="text"),
+                     dict(data, type=14, content={"link": ["text"]})):
+            with self.assertRaises(ValueError):
+                self.tested.handle(body)
+
+    def test_invalidate_caches(self):
+        for path in ("wikis/20", "wikis/20/attachments", "wikis/21",
+                     "issues/TEST-4/comments", "issues/30", "space"):
+            self.cache_path(path)
+
+        self.tested.handle(self.payloads[0])
+        self.tested.handle(self.payloads[1])
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNotNone(self.http_cache.get("wikis/21"))
+        self.assertIsNotNone(self.http_cache.get("space"))
+        self.assertIsNone(self.http_cache.get("issues/TEST-4/comments"))
+        self.assertEqual(self.tested.invalidated, 8)
+
+    def test_invalidate_every_updated_issue(self):
+        for path in ("issues/TEST-5/comments", "issues/TEST-6", "issues/30",
+                     "users/1/activities", "users/2/activities"):
+            self.cache_path(path)
+
+        self.tested.handle(self.payloads[2])
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.http_cache.get("issues/TEST-5/comments"))
+        self.assertIsNone(self.http_cache.get("issues/TEST-6"))
+        self.assertIsNone(self.http_cache.get("users/1/activities"))
+        self.assertIsNotNone(self.http_cache.get("issues/30"))
+        self.assertIsNotNone(self.http_cache.get("users/2/activities"))
+
+    def test_subscribe(self):
+        subscription = self.tested.subscribe()
+        full = self.tested.subscribe(maxsize=1)
+
+        replay(self.tested, self.payloads)
+        self.tested.unsubscribe(subscription)
+        self.tested.handle(self.payloads[0])
+
+        events = [subscription.get_nowait() for _ in range(3)]
+        self.assertTrue(subscription.empty())
+        self.assertEqual([e.activity.id for e in events], [101, 102, 103])
+        self.assertEqual([(c.model, c.id) for c in events[2].changes],
+                         [(Issue, 31), (Issue, 32)])
+        self.assertEqual(full.qsize(), 1)
+        self.assertEqual(self.tested.dropped, 3)
+
+    def test_wsgi_statuses(self):
+        tested = WebhookReceiver(token="secret")
+        get_status = []
+        tested({"REQUEST_METHOD": "GET", "wsgi.input": BytesIO()},
+               lambda status, headers: get_status.append(status))
+
+        self.assertEqual(get_status, ["405 Method Not Allowed"])
+        self.assertEqual(
+            replay(tested, self.payloads[:1], query="token=secret"), [200])
+        self.assertEqual(
+            replay(tested, self.payloads[:1], query="token=wrong"), [403])
+        self.assertEqual(replay(tested, [b"{}"], query="token=secret"),
+                         [400])
+        for length in ("abc", "-1"):
+            status = []
+            tested({"REQUEST_METHOD": "POST",
+                    "QUERY_STRING": "token=secret",
+                    "CONTENT_LENGTH": length,
+                    "wsgi.input": BytesIO(self.payloads[0])},
+                   lambda s, headers: status.append(s))
+            self.assertEqual(status, ["400 Bad Request"])
+        self.assertEqual(tested.received, 1)
+
+    def test_asgi(self):
+        body = self.payloads[0]
+
+        async def run():
+            subscription = self.tested.subscribe_async()
+            chunks = [{"type": "http.request", "body": body[:10],
+                       "more_body": True},
+                      {"type": "http.request", "body": body[10:]}]
+            sent = []
+
+            async def receive():
+                return chunks.pop(0)
+
+            async def send(message):
+                sent.append(message)
+
+            await self.tested.asgi(
+                {"type": "http", "method": "POST", "query_string": b""},
+                receive, send)
+            event = await asyncio.wait_for(subscription.get(), 1)
+            return sent, event
+
+        sent, event = asyncio.run(run())
+
+        self.assertEqual(sent[0]["status"], 200)
+        self.assertEqual([(c.model, c.id) for c in event.changes],
+                         [(Wiki, 20)])
+
+    def test_asgi_invalid_payload(self):
+        body = json.dumps(
+            dict(json.loads(self.payloads[0]), content="text")).encode()
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": body}
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(self.tested.asgi(
+            {"type": "http", "method": "POST", "query_string": b""},
+            receive, send))
+
+        self.assertEqual(sent[0]["status"], 400)
+        self.assertEqual(self.tested.received, 0)
+
+    def test_load_payloads_from_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for i, payload in enumerate(self.payloads):
+                with open(os.path.join(directory, f"{i}.json"), "wb") as f:
+                    f.write(payload)
+
+            loaded = list(load_payloads(directory))
+
+        self.assertEqual(loaded, self.payloads)
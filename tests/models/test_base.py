@@ -12,11 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import json
 import unittest
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import List, Optional
 
-from backlog.models import Base
+from backlog.models import Base, Comment, dumps_many, parse_datetime
+from backlog.models.base import _dumps_json
 
 
 @dataclass
@@ -66,3 +70,113 @@ class TestBase(unittest.TestCase):
             '"updated": "2022-12-31T23:59:59Z"' +
             '}'
         )
+
+
+@dataclass
+class NestedClass(Base):
+    child: Optional[TestClass]
+    children: List[TestClass]
+    created: datetime
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            child=TestClass.from_dict(data),
+            children=[TestClass.from_dict(data)],
+            created=datetime(2022, 1, 2, 3, 4, 5, 6),
+        )
+
+
+COMMENT = {
+    "id": 1,
+    "content": "コメント",
+    "changeLog": [{"field": "status",
+                   "newValue": "2",
+                   "originalValue": "1",
+                   "attachmentInfo": None,
+                   "attributeInfo": None,
+                   "notificationInfo": None}],
+    "createdUser": {"id": 1,
+                    "userId": "admin",
+                    "name": "admin",
+                    "roleType": 1,
+                    "lang": "ja",
+                    "mailAddress": "eguchi@nulab.example"},
+    "created": "2013-08-05T06:15:06Z",
+    "updated": "2013-08-05T06:15:06Z",
+    "stars": [],
+    "notifications": [],
+}
+
+
+class TestSerialization(unittest.TestCase):
+    def setUp(self):
+        self.tested = NestedClass.from_dict({"key": "value"})
+
+    def test_to_dict_nested(self):
+        child = TestClass.from_dict({"key": "value"}).to_dict()
+
+        self.assertEqual(self.tested.to_dict(), {
+            "child": child,
+            "children": [child],
+            "created": datetime(2022, 1, 2, 3, 4, 5, 6),
+        })
+
+    def test_to_dict_omits_none(self):
+        self.tested.child = None
+
+        self.assertNotIn("child", self.tested.to_dict())
+
+    def test_to_json_string_nested(self):
+        data = json.loads(self.tested.to_json_string())
+
+        self.assertEqual(data["child"]["updated"], "2022-12-31T23:59:59Z")
+        self.assertEqual(data["created"], "2022-01-02T03:04:05Z")
+
+    def test_dumps_many(self):
+        comments = [Comment.from_dict(dict(COMMENT, id=i)) for i in (1, 2)]
+        fp = io.StringIO()
+
+        count = dumps_many(comments, fp)
+
+        lines = fp.getvalue().splitlines()
+        self.assertEqual(count, 2)
+        self.assertEqual(len(lines), 2)
+        self.assertEqual([json.loads(line) for line in lines],
+                         [json.loads(c.to_json_string()) for c in comments])
+        self.assertIn("コメント", lines[0])
+
+    def test_dumps_many_with_json(self):
+        fp = io.StringIO()
+
+        dumps_many([Comment.from_dict(COMMENT)], fp, dumps=_dumps_json)
+
+        self.assertTrue(fp.getvalue().startswith('{"id":1,'))
+        self.assertEqual(json.loads(fp.getvalue())["created"],
+                         "2013-08-05T06:15:06Z")
+
+
+class TestParseDatetime(unittest.TestCase):
+    def test_parse_datetime(self):
+        self.assertEqual(
+            parse_datetime("2022-12-31T23:59:59Z"),
+            datetime(2022, 12, 31, 23, 59, 59))
+
+    def test_parse_aware_datetime(self):
+        parsed = parse_datetime("2022-12-31T23:59:59Z", aware=True)
+
+        self.assertEqual(
+            parsed,
+            datetime(2022, 12, 31, 23, 59, 59, tzinfo=timezone.utc))
+        self.assertIs(parsed.tzinfo, timezone.utc)
+
+    def test_parse_cached_datetime(self):
+        self.assertIs(
+            parse_datetime("2022-01-01T00:00:00Z"),
+            parse_datetime("2022-01-01T00:00:00Z"))
+
+    def test_parse_invalid_datetime(self):
+        for value in ("2022-12-31 23:59:59", "2022-13-31T23:59:59Z",
+                      "2022-12-31T23:59:59+09:00", ""):
+            with self.assertRaises(ValueError):
+                parse_datetime(value)
@@ -0,0 +1,195 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import List, Optional
+
+from backlog.models import (Attachment, Base, Category, Comment, IssueType,
+                            Priority, Project, SharedFile, Space, Star,
+                            Status, User, Version, Wiki, user_identity_scope)
+from backlog.models.base import compile_decoder, get_decoder
+
+USER = {"id": 1,
+        "userId": "admin",
+        "name": "admin",
+        "roleType": 1,
+        "lang": "ja",
+        "mailAddress": "eguchi@nulab.example",
+        "nulabAccount": {"nulabId": "abc", "name": "admin", "uniqueId": "a"},
+        "keyword": "admin"}
+
+ATTACHMENT = {"id": 1,
+              "name": "test.json",
+              "size": 8857,
+              "createdUser": USER,
+              "created": "2014-01-06T11:10:45Z"}
+
+SHARED_FILE = {"id": 454403,
+               "type": "file",
+               "dir": "/userIcon/",
+               "name": "01_male clerk.png",
+               "size": 2735,
+               "createdUser": USER,
+               "created": "2009-02-27T03:26:15Z",
+               "updatedUser": USER,
+               "updated": "2009-03-03T16:57:47Z"}
+
+STAR = {"id": 10,
+        "comment": None,
+        "url": "https://xx.backlogtool.com/view/BLG-1",
+        "title": "[BLG-1] first issue | Show issue - Backlog",
+        "presenter": USER,
+        "created": "2014-01-23T10:55:19Z"}
+
+SAMPLES = [
+    (User, USER),
+    (User, dict(USER, nulabAccount=None, keyword=None)),
+    (Space, {"spaceKey": "nulab",
+             "name": "Nulab Inc.",
+             "ownerId": 1,
+             "lang": "ja",
+             "timezone": "Asia/Tokyo",
+             "reportSendTime": "08:00:00",
+             "textFormattingRule": "markdown",
+             "created": "2008-07-06T15:00:00Z",
+             "updated": "2013-06-18T07:55:37Z"}),
+    (Project, {"id": 1,
+               "projectKey": "TEST",
+               "name": "test",
+               "chartEnabled": False,
+               "subtaskingEnabled": False,
+               "projectLeaderCanEditProjectLeader": False,
+               "useWikiTreeView": True,
+               "textFormattingRule": "markdown",
+               "archived": False,
+               "displayOrder": 0,
+               "useDevAttributes": True}),
+    (Status, {"id": 1, "projectId": 1, "name": "Open",
+              "color": "#ed8077", "displayOrder": 1000}),
+    (IssueType, {"id": 1, "projectId": 1, "name": "Bug",
+                 "color": "#990000", "displayOrder": 0,
+                 "templateSummary": "Subject",
+                 "templateDescription": "Details"}),
+    (Category, {"id": 12, "name": "Development", "displayOrder": 0}),
+    (Version, {"id": 3, "projectId": 1, "name": "wait for release",
+               "description": "", "startDate": None,
+               "releaseDueDate": "2013-08-05T00:00:00Z",
+               "archived": False, "displayOrder": 0}),
+    (Attachment, ATTACHMENT),
+    (SharedFile, SHARED_FILE),
+    (Star, STAR),
+    (Comment, {"id": 6586,
+               "content": "test",
+               "changeLog": [{"field": "status",
+                              "newValue": "2",
+                              "originalValue": "1",
+                              "attachmentInfo": None,
+                              "attributeInfo": None,
+                              "notificationInfo": None}],
+               "createdUser": USER,
+               "created": "2013-08-05T06:15:06Z",
+               "updated": "2013-08-05T06:15:06Z",
+               "stars": [STAR],
+               "notifications": []}),
+    (Wiki, {"id": 1,
+            "projectId": 1,
+            "name": "Home",
+            "content": "test",
+            "tags": [{"id": 12, "name": "proceedings"}],
+            "attachments": [ATTACHMENT],
+            "sharedFiles": [SHARED_FILE],
+            "stars": [STAR],
+            "createdUser": USER,
+            "created": "2012-07-23T06:09:48Z",
+            "updatedUser": USER,
+            "updated": "2012-07-23T06:09:48Z"}),
+]
+
+
+@dataclass
+class Generated(Base):
+    __slots__ = ("id", "display_name", "priority", "due_date", "users")
+
+    _JSON_KEYS = {"due_date": "dueAt"}
+    _FIELD_DECODERS = {
+        "priority": lambda value: Priority.value_of(value["id"]),
+    }
+
+    id: int
+    display_name: Optional[str]
+    priority: Optional[Priority]
+    due_date: Optional[datetime]
+    users: List[User]
+
+
+class TestCompileDecoder(unittest.TestCase):
+    def test_same_as_from_dict(self):
+        for model, data in SAMPLES:
+            with self.subTest(model=model.__name__):
+                self.assertEqual(get_decoder(model)(data),
+                                 model.from_dict(data))
+
+    def test_class_variables_are_not_fields(self):
+        self.assertEqual(
+            [f.name for f in fields(Generated)],
+            ["id", "display_name", "priority", "due_date", "users"])
+
+    def test_cached(self):
+        self.assertIs(compile_decoder(Comment), compile_decoder(Comment))
+
+    def test_default_from_dict(self):
+        generated = Generated.from_dict({
+            "id": 1,
+            "priority": {"id": 2, "name": "High"},
+            "dueAt": "2013-08-05T00:00:00Z",
+            "users": [USER],
+        })
+
+        self.assertEqual(generated.id, 1)
+        self.assertIsNone(generated.display_name)
+        self.assertIs(generated.priority, Priority.HIGH)
+        self.assertEqual(generated.due_date, datetime(2013, 8, 5))
+        self.assertEqual(generated.users, [User.from_dict(USER)])
+
+    def test_optional_values(self):
+        generated = Generated.from_dict({
+            "id": 1, "priority": None, "dueAt": "", "users": []})
+
+        self.assertIsNone(generated.priority)
+        self.assertIsNone(generated.due_date)
+
+    def test_missing_required_value(self):
+        with self.assertRaises(KeyError):
+            get_decoder(Status)({"id": 1})
+
+    def test_unresolvable_annotation(self):
+        @dataclass
+        class Broken(Base):
+            __slots__ = ("owner",)
+
+            owner: "Undefined"  # noqa: F821
+
+        with self.assertRaises(NameError):
+            compile_decoder(Broken)
+
+    def test_share_users(self):
+        _, data = SAMPLES[-1]
+
+        with user_identity_scope():
+            wiki = get_decoder(Wiki)(data)
+
+        self.assertIs(wiki.created_user, wiki.updated_user)
+        self.assertIs(wiki.created_user, wiki.stars[0].presenter)
@@ -0,0 +1,43 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from backlog.models import Priority, Resolution
+
+
+class TestBaseEnum(unittest.TestCase):
+    def test_value_of(self):
+        for member in Resolution:
+            self.assertIs(Resolution.value_of(member.to_value()), member)
+
+    def test_value_of_unknown_value(self):
+        with self.assertRaises(ValueError):
+            Priority.value_of(9)
+        self.assertIsNone(Priority.value_of(9, None))
+        self.assertIs(Priority.value_of(9, Priority.NORMAL), Priority.NORMAL)
+
+    def test_name_of(self):
+        self.assertIs(Priority.name_of("High"), Priority.HIGH)
+        self.assertIs(Resolution.name_of("Won't Fix"), Resolution.WONT_FIX)
+
+    def test_name_of_unknown_name(self):
+        with self.assertRaises(ValueError):
+            Priority.name_of("HIGH")
+        self.assertIsNone(Priority.name_of("HIGH", None))
+
+    def test_members_are_not_changed(self):
+        self.assertEqual([p.name for p in Priority],
+                         ["HIGH", "NORMAL", "LOW"])
+        self.assertEqual(str(Priority.HIGH), "High")
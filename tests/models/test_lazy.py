@@ -0,0 +1,181 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+import threading
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import responses
+
+from backlog import BacklogApi, ModelDecoder
+from backlog.models import (Comment, LazyComment, LazyWiki, Wiki,
+                            user_identity_scope)
+
+USER = {"id": 1,
+        "userId": "admin",
+        "name": "admin",
+        "roleType": 1,
+        "lang": "ja",
+        "mailAddress": "eguchi@nulab.example"}
+
+WIKI = {"id": 1,
+        "projectId": 2,
+        "name": "Home",
+        "content": "text",
+        "tags": [{"id": 12, "name": "proceedings"}],
+        "attachments": [{"id": 1,
+                         "name": "test.json",
+                         "size": 8857,
+                         "createdUser": USER,
+                         "created": "2014-01-06T11:10:45Z"}],
+        "sharedFiles": [],
+        "stars": [],
+        "createdUser": USER,
+        "created": "2012-07-23T06:09:48Z",
+        "updatedUser": USER,
+        "updated": "2012-07-23T06:09:48Z"}
+
+COMMENT = {"id": 6586,
+           "content": "test",
+           "changeLog": [{"field": "status",
+                          "newValue": "2",
+                          "originalValue": "1",
+                          "attachmentInfo": None,
+                          "attributeInfo": None,
+                          "notificationInfo": None}],
+           "createdUser": USER,
+           "created": "2013-08-05T06:15:06Z",
+           "updated": "2013-08-05T06:15:06Z",
+           "stars": [],
+           "notifications": []}
+
+
+class TestLazyModel(unittest.TestCase):
+    def test_decode_on_access(self):
+        wiki = LazyWiki.from_dict(WIKI)
+
+        self.assertIsInstance(wiki, Wiki)
+        self.assertEqual(wiki.name, "Home")
+        with self.assertRaises(AttributeError):
+            Wiki.tags.__get__(wiki)
+
+        tags = wiki.tags
+        self.assertEqual(tags[0].name, "proceedings")
+        self.assertIs(Wiki.tags.__get__(wiki), tags)
+        self.assertIs(wiki.tags, tags)
+        self.assertEqual(wiki.created, datetime(2012, 7, 23, 6, 9, 48))
+
+    def test_release_raw_after_every_field(self):
+        wiki = LazyWiki.from_dict(WIKI)
+        names = list(LazyWiki._LAZY_FIELDS)
+
+        for name in names[:-1]:
+            getattr(wiki, name)
+        self.assertIs(wiki._raw, WIKI)
+        getattr(wiki, names[-1])
+
+        self.assertIsNone(wiki._raw)
+        self.assertEqual(wiki.to_dict(), Wiki.from_dict(WIKI).to_dict())
+
+    def test_decode_same_field_in_threads(self):
+        wiki = LazyWiki.from_dict(WIKI)
+        barrier = threading.Barrier(8)
+        decode_tags = LazyWiki._LAZY_FIELDS["tags"]
+
+        def decode(data):
+            barrier.wait(timeout=5)
+            return decode_tags(data)
+
+        with mock.patch.dict(LazyWiki._LAZY_FIELDS, tags=decode):
+            threads = [threading.Thread(target=lambda: wiki.tags)
+                       for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(wiki.tags[0].name, "proceedings")
+        self.assertIs(wiki._raw, WIKI)
+        self.assertEqual(wiki.attachments[0].name, "test.json")
+
+    def test_same_as_eager_model(self):
+        self.assertEqual(LazyWiki.from_dict(WIKI).to_dict(),
+                         Wiki.from_dict(WIKI).to_dict())
+        self.assertEqual(LazyComment.from_dict(COMMENT).to_dict(),
+                         Comment.from_dict(COMMENT).to_dict())
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            LazyWiki.from_dict(WIKI).unknown
+
+    def test_share_users_after_scope(self):
+        with user_identity_scope():
+            wiki = LazyWiki.from_dict(WIKI)
+
+        self.assertIs(wiki.created_user, wiki.updated_user)
+        self.assertIs(wiki.created_user, wiki.attachments[0].created_user)
+
+    def test_pickle(self):
+        wiki = pickle.loads(pickle.dumps(LazyWiki.from_dict(WIKI)))
+
+        self.assertIs(type(wiki), Wiki)
+        self.assertEqual(wiki.to_dict(), Wiki.from_dict(WIKI).to_dict())
+
+    def test_assign_field(self):
+        wiki = LazyWiki.from_dict(WIKI)
+        wiki.tags = []
+
+        self.assertEqual(wiki.tags, [])
+
+
+class TestLazyDecoder(unittest.TestCase):
+    def setUp(self):
+        self.tested = BacklogApi(
+            space_key="test",
+            space_type="jp",
+            api_key="key",
+            decoder=ModelDecoder(lazy=True),
+        )
+
+    @responses.activate
+    def test_get_wikis(self):
+        responses.add(responses.GET,
+                      f"{self.tested.base_url}wikis",
+                      json=[WIKI])
+
+        wikis = self.tested.get_wikis(2)
+
+        self.assertIsInstance(wikis[0], LazyWiki)
+        self.assertEqual(wikis[0].tags[0].id, 12)
+
+    @responses.activate
+    def test_get_issue_comments(self):
+        responses.add(responses.GET,
+                      f"{self.tested.base_url}issues/1/comments",
+                      json=[COMMENT])
+
+        comments = self.tested.get_issue_comments(1)
+
+        self.assertIsInstance(comments[0], LazyComment)
+        self.assertEqual(comments[0].change_log[0].new_value, "2")
+
+    @responses.activate
+    def test_model_without_lazy_class(self):
+        responses.add(responses.GET,
+                      f"{self.tested.base_url}users/1",
+                      json=USER)
+
+        self.assertEqual(type(self.tested.get_user(1)).__name__, "User")
@@ -0,0 +1,80 @@
+# Copyright 2022 Ryo H
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+import unittest
+from dataclasses import fields
+from datetime import datetime
+
+from backlog import models
+from backlog.models import Base, LazyModel, Star
+
+
+class TestSlots(unittest.TestCase):
+    def setUp(self):
+        self.star = Star.from_dict({
+            "id": 1,
+            "comment": None,
+            "url": "https://xx.backlogtool.com/view/BLG-1",
+            "title": "[BLG-1] first issue | Show issue - Backlog",
+            "presenter": {
+                "id": 1,
+                "userId": "admin",
+                "name": "admin",
+                "roleType": 1,
+                "lang": "ja",
+                "mailAddress": "eguchi@nulab.example",
+            },
+            "created": "2014-01-23T10:55:19Z",
+        })
+
+    def test_models_have_no_instance_dict(self):
+        classes = [cls for cls in vars(models).values()
+                   if isinstance(cls, type) and issubclass(cls, Base)
+                   and cls is not Base]
+
+        for cls in classes:
+            with self.subTest(model=cls.__name__):
+                self.assertTrue(all("__slots__" in vars(klass)
+                                    for klass in cls.__mro__[:-1]))
+                if issubclass(cls, LazyModel):
+                    self.assertEqual(cls.__slots__, LazyModel.SLOTS)
+                    continue
+                self.assertEqual(
+                    set(cls.__slots__) - {"__weakref__"},
+                    {field.name for field in fields(cls)})
+        self.assertFalse(hasattr(self.star, "__dict__"))
+
+    def test_to_dict(self):
+        self.assertEqual(self.star.to_dict(), {
+            "id": 1,
+            "url": "https://xx.backlogtool.com/view/BLG-1",
+            "title": "[BLG-1] first issue | Show issue - Backlog",
+            "presenter": {
+                "id": 1,
+                "user_id": "admin",
+                "name": "admin",
+                "role_type": 1,
+                "lang": "ja",
+                "mail_address": "eguchi@nulab.example",
+            },
+            "created": datetime(2014, 1, 23, 10, 55, 19),
+        })
+
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.star)), self.star)
+
+    def test_cannot_set_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            self.star.unknown = 1